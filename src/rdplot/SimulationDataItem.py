@@ -17,15 +17,28 @@
 #    along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 ##################################################################################################
+import bz2
+import gzip
+import io
+import lzma
 import pkgutil
 import re
+import tarfile
+import zipfile
 from abc import ABCMeta, abstractmethod
 from collections import deque
-from copy import copy
-from os import listdir
-from os.path import join, abspath, isfile, isdir, basename, splitext
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from itertools import islice
+from os import stat
+from os.path import abspath, isfile, isdir, basename, splitext, join
+from threading import Lock
+import numpy as np
 from PyQt5.QtCore import *
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QComboBox, QDialogButtonBox, QLabel, QCheckBox
+from rdplot.lib.FileFilter import FileFilter
 import re
 
 
@@ -40,6 +53,284 @@ def is_class(cls):
     return hasattr(cls, '__bases__')
 
 
+class _LastFileCache:
+    """Keeps the value computed for the most recently accessed file. The
+    factory and the parser classes access the same file several times in a row
+    (detection and every parse stage), thus, keeping the last file is
+    sufficient to process each file only once. The value is invalidated if the
+    file is modified.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._value = None
+        self._lock = Lock()
+
+    def get(self, path, compute_function):
+        path = abspath(path)
+        file_stat = stat_file(path)
+        key = (path, file_stat.st_mtime_ns, file_stat.st_size)
+
+        with self._lock:
+            if self._key == key:
+                return self._value
+
+        value = compute_function(path, file_stat.st_size)
+
+        with self._lock:
+            self._key = key
+            self._value = value
+        return value
+
+    def put(self, path, value):
+        """Keep the *value*, which was obtained otherwise, for the file at
+        *path*"""
+        path = abspath(path)
+        file_stat = stat_file(path)
+        with self._lock:
+            self._key = (path, file_stat.st_mtime_ns, file_stat.st_size)
+            self._value = value
+
+
+_file_text_cache = _LastFileCache()
+_file_signature_cache = _LastFileCache()
+
+# Functions opening compressed files by their extension. The files are
+# decompressed while they are read.
+_compressed_file_openers = {
+    '.gz': gzip.open,
+    '.xz': lzma.open,
+    '.bz2': bz2.open,
+}
+
+
+def get_compression_extension(path):
+    """Get the extension of the compressed file at *path*, e.g. '.gz', or an
+    empty string, if the file is not compressed.
+
+    :rtype: :class: `str`
+    """
+    for extension in _compressed_file_openers:
+        if path.endswith(extension):
+            return extension
+    return ''
+
+
+def strip_compression_extension(path):
+    """Remove the extension of a compressed file from *path*, thus,
+    'QP22_enc.log.gz' becomes 'QP22_enc.log'. Should be used to check the file
+    ending of logs, which might be compressed.
+
+    :rtype: :class: `str`
+    """
+    extension = get_compression_extension(path)
+    return path[:-len(extension)] if extension else path
+
+
+def _decode_text(data):
+    """Decode *data* like a file opened with :func: `open` in text mode"""
+    return io.TextIOWrapper(io.BytesIO(data)).read()
+
+
+# Extensions of tar and zip archives, whose members can be parsed
+_archive_extensions = r'(?:\.tar(?:\.gz|\.xz|\.bz2)?|\.tgz|\.txz|\.tbz2?|\.zip)'
+_archive_path_pattern = re.compile(_archive_extensions + '$', re.I)
+# archive, which is followed by the name of a member
+_archive_in_path_pattern = re.compile(_archive_extensions + r'(?=[/\\])', re.I)
+
+
+def is_archive(path):
+    """Check, if *path* is a tar or zip archive. The members of archives are
+    identified by the path of the archive joined with the name of the member,
+    e.g. 'results.tar.gz/QP22/log_enc.log', see :func: `split_archive_path`.
+
+    :rtype: :class: `bool`
+    """
+    return bool(_archive_path_pattern.search(path)) and isfile(path)
+
+
+def split_archive_path(path):
+    """Split the *path* of an archive member into the path of the archive and
+    the name of the member.
+
+    :rtype: :class: `tuple` of the archive path and the member name, or of
+        *path* and None, if *path* is not in an archive
+    """
+    for match in _archive_in_path_pattern.finditer(path):
+        archive_path = path[:match.end()]
+        if isfile(archive_path):
+            # member names always use '/'
+            return archive_path, path[match.end() + 1:].replace('\\', '/')
+    return path, None
+
+
+def stat_file(path):
+    """Like :func: `os.stat`, but members of archives get the modification
+    time and size of their archive.
+    """
+    return stat(split_archive_path(path)[0])
+
+
+# Errors raised while reading broken archives
+_archive_errors = (tarfile.TarError, zipfile.BadZipFile, OSError, EOFError, lzma.LZMAError)
+
+
+def _decode_member_text(member_name, data):
+    """Decode the *data* of an archive member, which might be a compressed
+    file itself"""
+    extension = get_compression_extension(member_name)
+    if extension:
+        data = {'.gz': gzip.decompress, '.xz': lzma.decompress, '.bz2': bz2.decompress}[extension](data)
+    return _decode_text(data)
+
+
+def _read_archive_member_text(archive_path, member_name):
+    """Read the text of a single member of an archive. Note, that members of
+    compressed tar archives can only be found by decompressing the archive up
+    to them, use :func: `iter_archive_members` to process all members.
+    """
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            data = archive.read(member_name)
+    else:
+        with tarfile.open(archive_path, 'r:*') as archive:
+            member_file = archive.extractfile(member_name)
+            if member_file is None:
+                raise IsADirectoryError("'{}' is not a file in '{}'".format(member_name, archive_path))
+            data = member_file.read()
+    return _decode_member_text(member_name, data)
+
+
+def iter_archive_members(archive_path):
+    """Generator of the files in the tar or zip archive at *archive_path*, in
+    the order in which they are stored. The archive is read as a stream, thus
+    it is not extracted. For each file, a tuple of its path, i.e. the archive
+    path joined with the member name, its size and a function, which reads
+    its text, is generated. The function has to be called, before the next
+    member is generated.
+
+    :rtype: generator of :class: `tuple`s
+    """
+    def read_text_function(member_name, member_file):
+        return lambda: _decode_member_text(member_name, member_file.read())
+
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as member_file:
+                    yield (join(archive_path, info.filename), info.file_size,
+                           read_text_function(info.filename, member_file))
+        return
+
+    with tarfile.open(archive_path, 'r|*') as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            member_file = archive.extractfile(member)
+            yield join(archive_path, member.name), member.size, read_text_function(member.name, member_file)
+
+
+def prime_file_text(path, text):
+    """Provide the *text* of the file at *path*, which was read otherwise,
+    e.g. from the stream of an archive, to the parser classes. It is used
+    until the next file is read, see :func: `read_file_text`.
+    """
+    _file_text_cache.put(path, text)
+
+
+def open_file(path, mode='r'):
+    """Open the file at *path* like :func: `open`. Files compressed with
+    gzip, xz or bzip2 are recognized by their extension and decompressed
+    while they are read, without temporary files.
+
+    :param path: path to file
+    :type path: :class: `str`
+
+    :param mode: 'r' to read text or 'rb' to read bytes
+    :type mode: :class: `str`
+
+    :rtype: file object
+    """
+    extension = get_compression_extension(path)
+    if not extension:
+        return open(path, mode)
+    # the compression modules use 'rt' for text
+    return _compressed_file_openers[extension](path, mode if 'b' in mode else mode + 't')
+
+
+def _read_whole_file_text(path, _):
+    archive_path, member_name = split_archive_path(path)
+    try:
+        if member_name is not None:
+            return _read_archive_member_text(archive_path, member_name)
+        with open_file(path, 'r') as file:
+            return file.read()
+    except (tarfile.TarError, zipfile.BadZipFile, KeyError, EOFError, lzma.LZMAError) as error:
+        # report corrupt or truncated compressed files and archives, and missing
+        # archive members like gzip and bzip2 report corrupt files
+        raise OSError("Could not read file '{}': {}".format(path, error)) from error
+
+
+def read_file_text(path):
+    """Read the whole text of the file at *path*. The text is shared by all
+    subsequent calls for the same, unmodified file, until another file is read.
+    Compressed files are decompressed, see :func: `open_file`.
+
+    :param path: path to file
+    :type path: :class: `str`
+
+    :rtype: :class: `str`
+    """
+    return _file_text_cache.get(path, _read_whole_file_text)
+
+
+def read_file_signature(path):
+    """Get the :class: `FileSignature` of the file at *path*. Like the text,
+    the signature of the most recently accessed file is shared by all parser
+    classes, which try to detect the file.
+
+    :param path: path to file
+    :type path: :class: `str`
+
+    :rtype: :class: `FileSignature`
+    """
+    return _file_signature_cache.get(path, FileSignature.from_path)
+
+
+def iter_sim_data_item_values(sim_data_item):
+    """Walk the dictionary trees of the *data* of a sim data item, see
+    :class: `SimulationDataItem`, and yield the values at the leafs together
+    with their identifiers and path.
+
+    :param sim_data_item: :class: `SimDataItem`
+
+    :rtype: iterator of :class: `tuple`s of identifiers, :class: `list` of
+        keys and :class: `list` of values
+    """
+
+    for (identifiers, sim_data_item_dict_tree) in sim_data_item.data:
+        # Process all items of the *encoder_log*'s dictionary tree.
+        # Note, that tuple in queue are pairs of path ie. a list of
+        # strings/keys of the encoder_log_dict_tree, and the tree itself.
+        # deque has to be initialized with iterable, thus, pair is wrapped
+        # with list.
+        tree_queue = deque([([], sim_data_item_dict_tree)])
+
+        while len(tree_queue) > 0:
+            (keys, parent) = tree_queue.pop()
+
+            # Dictionary items are added to the queue to be processed
+            # themselves
+            if isinstance(parent, Mapping):
+                for key, item in parent.items():
+                    tree_queue.appendleft((keys + [key], item))
+                continue
+
+            yield identifiers, keys, parent
+
+
 def dict_tree_from_sim_data_items(sim_data_item_collection):
     """Combine the *data* of different sim data items to a tree of
     :class: `dicts`, which is then used to display the data. To understand, why
@@ -53,87 +344,50 @@ def dict_tree_from_sim_data_items(sim_data_item_collection):
     """
 
     dict_tree = {}
+    # Lists of PlotData objects at the leafs of *dict_tree* by path, and
+    # PlotData objects by path and identifiers. Thus, the PlotData object, to
+    # which the data of an item is added, is found without walking the tree
+    # and comparing the identifiers of all PlotData objects at the leaf.
+    plot_data_lists = {}
+    plot_data_index = {}
+    # Values of the sim data items joined into a PlotData object by its id.
+    # The values are only converted to the array of the PlotData object once,
+    # after all items are processed.
+    joined_values = {}
 
     for sim_data_item in sim_data_item_collection:
-        for (identifiers, sim_data_item_dict_tree) in sim_data_item.data:
-
-            # Process all items of the *encoder_log*'s dictionary tree ie.
-            # create corresponding keys in the output *dict_tree* and
-            # copy the data at the corresponding position in PlotData
-            # objects.
-
-            # Note, that tuple in queue are pairs of path ie. a list of
-            # strings/keys of the encoder_log_dict_tree, and the tree itself.
-            # deque has to be initialized with iterable, thus, pair is wrapped
-            # with list.
-            tree_queue = deque([([], sim_data_item_dict_tree)])
-
-            while len(tree_queue) > 0:
-                (keys, parent) = tree_queue.pop()
-
-                # Dictionary items are added to the queue to be processed
-                # themselves
-                if isinstance(parent, dict):
-                    for key, item in parent.items():
-                        tree_queue.appendleft((keys + [key], item))
-                    continue
-                label = sim_data_item._get_label(keys)
+        for (identifiers, keys, values) in iter_sim_data_item_values(sim_data_item):
+            identifiers_key = tuple(identifiers)
+            path_key = tuple(keys)
+
+            # If a PlotData object with equal path and identifiers exists,
+            # append the values to it
+            plot_data = plot_data_index.get((path_key, identifiers_key))
+            if plot_data is not None:
+                joined_values[id(plot_data)][1].extend(values)
+                continue
+
+            # Otherwise, add a new PlotData object to the list at the path
+            # in the output *dict_tree*
+            label = sim_data_item._get_label(keys)
+            plot_data = PlotData(identifiers, [], keys, label)
+            plot_data_index[(path_key, identifiers_key)] = plot_data
+            joined_values[id(plot_data)] = (plot_data, list(values))
+
+            plot_data_list = plot_data_lists.get(path_key)
+            if plot_data_list is None:
+                plot_data_list = plot_data_lists[path_key] = []
+                # Walk the path down the *dict_tree* and create not
+                # existing keys on the way
+                item = dict_tree
+                for key in keys[:-1]:
+                    item = item.setdefault(key, {})
+                item[keys[-1]] = plot_data_list
+            plot_data_list.append(plot_data)
+
+    for (plot_data, values) in joined_values.values():
+        plot_data.values = values
 
-                # Non dictionary items are processed ie. their data is
-                # added as PlotData object to the output *dict_tree*
-                dict_tree = append_value_to_dict_tree_at_path(
-                    dict_tree,
-                    keys,
-                    PlotData(identifiers, copy(parent), keys, label),
-                )
-
-    return dict_tree
-
-
-def append_value_to_dict_tree_at_path(dict_tree, path, plot_data):
-    """Add a *plot_data* object to a *dict_tree* at a certain *path*.
-
-    :param dict_tree: Tree of nested :class: `dict`s
-    :param path: :class: `list` of keys describing a path in the *dict_tree*
-    :param plot_data: :class: `PlotData` object to be added to the *dict_tree*
-
-    :rtype: Altered tree of nested :class: `dict`s
-    """
-
-    # Walk the *path* down at the *dict_tree* and create not existing keys
-    # on the way.
-    # Note, that the last key of the path is excluded, as the data has
-    # to be written to this key.
-    item = dict_tree
-    for key in path[:-1]:
-        # Create nested dictionaries if they do not exist already
-        if key not in item:
-            item[key] = {}
-
-        item = item[key]
-
-    # If the last element of the path does not exist, create a list on the
-    # corresponding position in the *dict_tree* with the *plot_data* object
-    # as only member so far. Return.
-    if path[-1] not in item:
-        item[path[-1]] = [plot_data]
-        return dict_tree
-
-    # If the last element does exist, retrieve the list stored at its position
-    plot_data_list = item[path[-1]]
-
-    # Iterate over the existing PlotData objects and check, if one has equal
-    # identifiers to the current one. If this is the case, append the values
-    # stored in the current *plot_data* object to one already present. Return.
-    for plot_data_other in plot_data_list:
-        if plot_data_other.identifiers == plot_data.identifiers:
-            plot_data_other.values.extend(plot_data.values)
-            return dict_tree
-
-    # If the last element exists, but no PlotData object with the same
-    # identifiers is present, append the PlotData object *plot_data* to the
-    # list.
-    plot_data_list.append(plot_data)
     return dict_tree
 
 
@@ -151,31 +405,187 @@ class PlotData:
     different simulation data items together, if they export data
     at the same position in the variable tree, and with the same *identifiers* .
 
+    The values are stored as float array with one row per point, and the x
+    value, the y value and optionally the confidence interval as columns. The
+    array is converted once, when the values are set, and the array sorted by
+    the x values is cached, until the values are changed again. Thus, plots
+    and tables can be redrawn without converting the values again.
+
     :param identifiers: Used to decide, if a list of values should be
         associated with a certain plot data object.
     :type identifiers: :class: `list`
 
-    :param values: The actual data ie. a list of x, y pairs
+    :param values: The actual data ie. a list of x, y pairs, or x, y, ci
+        triples, if a confidence interval is included
     :type values: :class: `list` of :class: `tuples` of double/int/...
 
     :param path: Path of the plot data object in the variable tree
     :type path: :class: `list` of :class: `str`
     """
 
+    __slots__ = ('identifiers', 'path', 'label', 'color', 'marker', 'linestyle', '_array', '_sorted_array')
+
     def __init__(self, identifiers=[], values=[], path=[], label=()):
         self.identifiers = identifiers
-        self.values = values
         self.path = path
         self.label = label
-        self.has_ci = False        
         self.color = " "
         self.marker = " "
+        self.linestyle = None
+        self.values = values
+
+    @staticmethod
+    def to_array(values):
+        """Convert *values* to a read-only float array with one row per point,
+        as it is kept by plot data objects. Arrays in this form are joined
+        and assigned to the *values* without converting them again, e.g. by
+        the :class: `VariableTreeModel`.
+
+        :param values: :class: `list` of :class: `tuples`, or array of values
+
+        :rtype: :class: `np.ndarray`
+        """
+        array = np.array(values, dtype=float)
+        if array.size == 0:
+            array = array.reshape(0, 2)
+        array.setflags(write=False)
+        return array
+
+    @property
+    def values(self):
+        """The values as :class: `list` of :class: `tuple`s of floats"""
+        return [tuple(value) for value in self._array.tolist()]
+
+    @values.setter
+    def values(self, values):
+        self._array = self.to_array(values)
+        self._sorted_array = None
+
+    def extend(self, values):
+        """Append *values* to the values of the plot data object
+
+        :param values: :class: `list` of :class: `tuples`, or array of values
+        """
+        self._array = self.to_array(np.concatenate((self._array, self.to_array(values))))
+        self._sorted_array = None
+
+    @property
+    def array(self):
+        """Read-only float array of the values, with the x values, the y values
+        and, if present, the confidence intervals as columns"""
+        return self._array
+
+    @property
+    def sorted_array(self):
+        """Like :attr: `array`, but the rows are sorted by their x values.
+        Rows with equal x values keep their order."""
+        if self._sorted_array is None:
+            array = self._array[np.argsort(self._array[:, 0], kind='stable')]
+            array.setflags(write=False)
+            self._sorted_array = array
+        return self._sorted_array
+
+    @property
+    def has_ci(self):
+        """True, if the values include a confidence interval ie. the values
+        are triples of (rate, value, ci-value)"""
+        return self._array.shape[1] == 3
 
 
-        # plot data has confidence interval if tuple has 3 entries
-        # tuple: (rate, value, ci-value)
-        if len(self.values[0]) == 3:
-            self.has_ci = True
+class FileSignature:
+    """Bounded view of a file used to detect the parser class of the file.
+    Version banners of simulation logs are written at the top, markers like
+    *Total Time* at the bottom. Thus, only a *head* and a *tail* window of the
+    text are read, and the cost of the detection does not depend on the length
+    of the file.
+
+    :param head: Text at the beginning of the file
+    :type head: :class: `str`
+
+    :param tail: Text at the end of the file. Empty, if the file is short enough
+        to be completely contained in the *head*.
+    :type tail: :class: `str`
+
+    :param read_tail: Function, which reads the *tail*, if it is not given. It
+        is called when the *tail* is accessed the first time.
+    :type read_tail: :class: `function`
+    """
+
+    # Size of the windows in bytes
+    head_size = 64 * 1024
+    tail_size = 64 * 1024
+
+    def __init__(self, head, tail='', read_tail=None):
+        self.head = head
+        self._tail = tail
+        self._read_tail = read_tail
+
+    @property
+    def tail(self):
+        if self._read_tail is not None:
+            self._tail = self._read_tail()
+            self._read_tail = None
+        return self._tail
+
+    @property
+    def is_complete(self):
+        """True, if the *head* is the whole text of the file"""
+        return self._read_tail is None and not self._tail
+
+    @classmethod
+    def from_path(cls, path, size):
+        """Read the signature of the file at *path* with *size* bytes"""
+        if split_archive_path(path)[1] is not None:
+            # the text of archive members is read from the archive stream
+            return cls.from_text(read_file_text(path))
+
+        if get_compression_extension(path):
+            # Only the head is decompressed. The tail of a compressed file can
+            # only be reached by decompressing the whole file, thus, it is taken
+            # from the text, which is kept for the subsequent parsing of the
+            # file, once it is needed.
+            try:
+                with open_file(path, 'rb') as file:
+                    data = file.read(cls.head_size + cls.tail_size + 1)
+            except (EOFError, lzma.LZMAError) as error:
+                raise OSError("Could not read file '{}': {}".format(path, error)) from error
+            if len(data) <= cls.head_size + cls.tail_size:
+                return cls(data.decode(errors='replace'))
+            return cls(data[:cls.head_size].decode(errors='replace'),
+                       read_tail=lambda: cls._get_tail_of_text(read_file_text(path)))
+
+        with open(path, 'rb') as file:
+            if size <= cls.head_size + cls.tail_size:
+                return cls(file.read().decode(errors='replace'))
+
+            head = file.read(cls.head_size).decode(errors='replace')
+            file.seek(-cls.tail_size, 2)
+            tail = file.read().decode(errors='replace')
+
+        # The tail starts somewhere within a line. Remove the partial line, as it
+        # could match patterns anchored at the start of a line.
+        tail = tail[tail.find('\n') + 1:]
+        return cls(head, tail)
+
+    @classmethod
+    def from_text(cls, text):
+        """Create the signature of a file with the given *text*"""
+        if len(text) <= cls.head_size + cls.tail_size:
+            return cls(text)
+        return cls(text[:cls.head_size], cls._get_tail_of_text(text))
+
+    @classmethod
+    def _get_tail_of_text(cls, text):
+        tail = text[-cls.tail_size:]
+        return tail[tail.find('\n') + 1:]
+
+    def matches_re_pattern(self, pattern):
+        """Check, if the head or the tail of the file match the given regex
+        *pattern*. The pattern is interpreted like in
+        :func: `AbstractSimulationDataItem._is_file_text_matching_re_pattern`.
+        """
+        return bool(re.search(pattern, self.head, re.M + re.X) or
+                    re.search(pattern, self.tail, re.M + re.X))
 
 
 class SimulationDataItemError(Exception):
@@ -199,6 +609,10 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
     # Order value, used to determine order in which parser are tried.
     parse_order = 100  # large default value. it subclass does not lower it, it will be tried last
 
+    # Version of the parser. Has to be increased, if the parsed data changes.
+    # Items of older versions in the parse cache are parsed again.
+    parser_version = 1
+
     # Constructor
 
     def __init__(self, path):
@@ -297,13 +711,35 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
         return str(self)
 
     # Helper Methods
+    @classmethod
+    def _read_file_text(cls, path):
+        """Read the text of the file at *path*. Detection and all parse stages
+        share one read of the file, see :func: `read_file_text`.
+        """
+        return read_file_text(path)
+
+    @classmethod
+    def _read_file_signature(cls, path):
+        """Read the head and tail of the file at *path*, see
+        :class: `FileSignature`.
+        """
+        return read_file_signature(path)
+
     @classmethod
     def _is_file_text_matching_re_pattern(cls, path, pattern):
         """Check, if the file at *path* matches the given regex *pattern*
         """
-        with open(path, 'r') as simulation_data_item_file:
-            text = simulation_data_item_file.read()
-            return bool(re.search(pattern, text, re.M + re.X))
+        text = cls._read_file_text(path)
+        return bool(re.search(pattern, text, re.M + re.X))
+
+    @classmethod
+    def _is_file_signature_matching_re_pattern(cls, path, pattern):
+        """Check, if the head or tail of the file at *path* matches the given
+        regex *pattern*. Should be preferred over
+        :func: `_is_file_text_matching_re_pattern` for markers at the top or the
+        bottom of a file, see :class: `FileSignature`.
+        """
+        return read_file_signature(path).matches_re_pattern(pattern)
 
 
 class SimulationDataItemFactory(QObject):
@@ -324,11 +760,24 @@ class SimulationDataItemFactory(QObject):
     items should be tried at last.
     """
     parsingError = pyqtSignal()
+
+    # Minimal number of files, for which a pool of worker processes is used.
+    # For less files, starting the workers takes longer than the parsing.
+    min_file_count_for_parser_pool = 16
+    # Number of archive members, which are read before they are parsed. Limits
+    # the memory used for the texts passed to the worker processes.
+    archive_member_batch_size = 256
+
     # Constructors
     def __init__(self, classes=None):
         super().__init__()
         self._classes = set()
         self.class_selection_dialog = None
+        # optional :class: `rdplot.lib.ParseCache.ParseCache`, which is checked
+        # before files are parsed
+        self.parse_cache = None
+        # selects the files of directories, which are parsed
+        self.file_filter = FileFilter()
 
         if classes is not None:
             for cls in classes:
@@ -392,6 +841,36 @@ class SimulationDataItemFactory(QObject):
         self._classes.add(cls)
 
     # Factory Methods
+    def _get_parser_classes(self):
+        """Get the non-abstract classes of the factory in the order given by
+        their *parse_order* attribute.
+        """
+        list_classes = list(reversed(sorted(self._classes, key=lambda parser_class: parser_class.parse_order)))
+        return list(filter(lambda x: True if str(x).find('Abstract') == -1 else False, list_classes))
+
+    def _create_item_list_with_parser_class(self, file_path, list_classes):
+        """Create the items for the file at *file_path* with the first class
+        of *list_classes*, which can parse the file.
+
+        :rtype: :class: `list` of simulation data items, or None if no class
+            can parse the file
+        """
+        try:
+            # read the signature once, the detection of all parser classes uses it
+            if isfile(file_path) or split_archive_path(file_path)[1] is not None:
+                read_file_signature(file_path)
+            # the tail of a compressed file is only read, if a parser class needs it
+            parser_class = next((cls for cls in list_classes if cls.can_parse_file(file_path)), None)
+        except (OSError, UnicodeDecodeError) as error:
+            # e.g. a corrupt compressed file
+            raise SimulationDataItemError("Could not read file '{}' due to {}".format(file_path, error))
+
+        if parser_class is None:
+            return None
+        if strip_compression_extension(file_path).endswith('.csv'):
+            return self.parse_csv_item_list(file_path)
+        return [parser_class(file_path)]
+
     def create_item_from_file(self, file_path):
         """Create an item of a AbstractSimulationDataItem sub class for the
         file specified by *file_path*.
@@ -402,19 +881,19 @@ class SimulationDataItemFactory(QObject):
         :rtype: object of sub class of :class: `AbstractSimulationDataItem`
         """
 
+        cls_list = self._get_cached_item_list(file_path)
+        if cls_list is not None:
+            return cls_list
+
         # Create simulation data item of the first class which says, it can parse
         # the file
-        cls_list = []
         # try parser, in the order given by their parse_order attribute. use the first one that can parse the file
-        list_classes = list(reversed(sorted(self._classes, key=lambda parser_class: parser_class.parse_order)))
-        list_classes = list(filter(lambda x: True if str(x).find('Abstract') == -1 else False, list_classes))
-        for cls in list_classes:
-            if cls.can_parse_file(file_path) and file_path.endswith('.csv'):
-                cls_list.extend(self.parse_csv_item_list(file_path))
-                break
-            if cls.can_parse_file(file_path):
-                cls_list.append(cls(file_path))
-                break
+        list_classes = self._get_parser_classes()
+        cls_list = self._create_item_list_with_parser_class(file_path, list_classes)
+        if cls_list is None:
+            cls_list = []
+        else:
+            self._put_cached_item_list(file_path, cls_list)
         # checking for parsers automatically would be a lot easier at this point
         # but user would not be able to manually select a format
         if not cls_list and isfile(file_path):
@@ -436,6 +915,189 @@ class SimulationDataItemFactory(QObject):
                     self.parsingError.emit()
         return cls_list
 
+    def _get_cached_item_list(self, file_path):
+        """Get the items of the file at *file_path* from the parse cache.
+
+        :rtype: :class: `list` of simulation data items, or None if the file
+            has to be parsed
+        """
+        if self.parse_cache is None:
+            return None
+        return self.parse_cache.get(file_path)
+
+    def _put_cached_item_list(self, file_path, item_list):
+        if self.parse_cache is not None:
+            self.parse_cache.put(file_path, item_list)
+
+    def create_parser_pool(self, process_count):
+        """Create a pool of *process_count* worker processes, which can be
+        passed to :func: `iter_item_lists_from_directory` to parse files in
+        parallel. The workers use the classes of this factory. Note, that the
+        pool has to be shut down by the caller.
+
+        :rtype: :class: `concurrent.futures.ProcessPoolExecutor`
+        """
+        # Processes are spawned, as forking a process with running threads
+        # (e.g. of Qt) is not safe
+        return ProcessPoolExecutor(max_workers=process_count,
+                                   mp_context=get_context('spawn'),
+                                   initializer=_init_parser_process,
+                                   initargs=(list(self._classes),))
+
+    def iter_item_lists_from_files(self, file_paths, parser_pool=None):
+        """Try to create simulation data items for all files in *file_paths*.
+        Ignore if files can not be parsed. The items are yielded as one list
+        per file, in the order of *file_paths*.
+
+        If a *parser_pool* created by :func: `create_parser_pool` is given, the
+        files are parsed in parallel. Files, which can not be parsed by any
+        class, are handled in this process, as the user might have to select a
+        class.
+
+        :param file_paths: :class: `list` of :class: `str` of file paths
+        :param parser_pool: optional pool of worker processes
+
+        :rtype: generator of :class: `list`s of simulation data items
+        """
+        # items of unchanged files are taken from the parse cache, only the
+        # remaining files are parsed
+        cached_item_lists = [self._get_cached_item_list(path) for path in file_paths]
+        uncached_paths = [path for (path, item_list) in zip(file_paths, cached_item_lists) if item_list is None]
+
+        if parser_pool is not None and len(uncached_paths) >= self.min_file_count_for_parser_pool:
+            parsed_item_lists = self._map_in_parser_pool(parser_pool, _create_item_list_in_parser_process,
+                                                         uncached_paths)
+        else:
+            parsed_item_lists = (None for _ in uncached_paths)
+
+        for path, item_list in zip(file_paths, cached_item_lists):
+            if item_list is None:
+                item_list = next(parsed_item_lists)
+                if item_list is not None:
+                    self._put_cached_item_list(path, item_list)
+            if item_list is None:
+                try:
+                    item_list = self.create_item_from_file(path)
+                except RuntimeError:
+                    break
+                except SimulationDataItemError as error:
+                    # We definitely cannot accept thousands of exceptions on the command line
+                    # print((
+                    #    "Could not create simulation data item from file '{}'"
+                    #    " due to {}"
+                    # ).format(path, error))
+                    continue
+            if not item_list:
+                continue
+            print("Parsed '{}' ".format(path))
+            yield item_list
+
+    @staticmethod
+    def _map_in_parser_pool(parser_pool, function, arguments):
+        """Generator of the item lists created by the workers of *parser_pool*
+        by calling *function* for each of the *arguments*. If the pool breaks,
+        None is generated for the remaining files, i.e. they are parsed in this
+        process."""
+        # send chunks of files to the workers to reduce the communication overhead
+        item_lists = parser_pool.map(function, arguments, chunksize=8)
+        count = 0
+        try:
+            for item_list in item_lists:
+                count += 1
+                yield item_list
+        except BrokenProcessPool:
+            print("Parser processes terminated, parsing remaining files in this process")
+            for _ in arguments[count:]:
+                yield None
+
+    def iter_item_lists_from_directory(self, directory_path, parser_pool=None):
+        """Try to create simulation data items for all files in a directory at
+        *directory_path*, which are accepted by the *file_filter* of the
+        factory. Depending on the filter, sub directories are searched, too.
+        See :func: `iter_item_lists_from_files`.
+
+        :param directory_path: :class: `str` of directory path
+        :param parser_pool: optional pool of worker processes
+
+        :rtype: generator of :class: `list`s of simulation data items
+        """
+        self.class_selection_dialog.reset()
+        file_paths = list(self.file_filter.iter_file_paths(directory_path))
+        return self.iter_item_lists_from_files(file_paths, parser_pool)
+
+    def iter_item_lists_from_archive(self, archive_path, parser_pool=None):
+        """Try to create simulation data items for all files in the tar or
+        zip archive at *archive_path*, which are accepted by the name and size
+        checks of the *file_filter*. The archive is not extracted, the members
+        are parsed from the archive stream, see :func: `iter_archive_members`.
+        The path of an item is the archive path joined with the member name.
+
+        If a *parser_pool* is given, the texts of the members are sent to the
+        worker processes. Members, which cannot be parsed by any class, are
+        skipped, i.e. the user is not asked for a class.
+
+        :param archive_path: :class: `str` of archive path
+        :param parser_pool: optional pool of worker processes
+
+        :rtype: generator of :class: `list`s of simulation data items
+        """
+        list_classes = self._get_parser_classes()
+
+        members = ((member_path, read_text) for (member_path, size, read_text) in iter_archive_members(archive_path)
+                   if self.file_filter.is_member_accepted(member_path[len(archive_path) + 1:], size))
+        is_archive_readable = True
+        while is_archive_readable:
+            # read a batch of members, for the members of unchanged archives the
+            # items are taken from the parse cache
+            batch = []
+            try:
+                for member_path, read_text in islice(members, self.archive_member_batch_size):
+                    item_list = self._get_cached_item_list(member_path)
+                    text = None
+                    if item_list is None:
+                        try:
+                            text = read_text()
+                        except UnicodeDecodeError:
+                            # not a text file
+                            continue
+                    batch.append((member_path, text, item_list))
+            except _archive_errors as error:
+                # parse the members read so far
+                print("Could not read archive '{}' due to {}".format(archive_path, error))
+                is_archive_readable = False
+            if not batch:
+                break
+
+            uncached_members = [(member_path, text) for (member_path, text, item_list) in batch if item_list is None]
+            if parser_pool is not None and len(uncached_members) >= self.min_file_count_for_parser_pool:
+                parsed_item_lists = self._map_in_parser_pool(parser_pool, _create_item_list_from_text_in_parser_process,
+                                                             uncached_members)
+            else:
+                parsed_item_lists = (None for _ in uncached_members)
+
+            for member_path, text, item_list in batch:
+                if item_list is None:
+                    item_list = next(parsed_item_lists)
+                    if item_list is None:
+                        try:
+                            item_list = self._create_item_list_from_text(member_path, text, list_classes)
+                        except SimulationDataItemError:
+                            continue
+                    self._put_cached_item_list(member_path, item_list)
+                if not item_list:
+                    continue
+                print("Parsed '{}' ".format(member_path))
+                yield item_list
+
+    def _create_item_list_from_text(self, file_path, text, list_classes):
+        """Create the items for the file at *file_path* with the given *text*,
+        which was read from an archive.
+
+        :rtype: :class: `list` of simulation data items
+        """
+        prime_file_text(file_path, text)
+        return self._create_item_list_with_parser_class(file_path, list_classes) or []
+
     def create_item_list_from_directory(self, directory_path):
         """Try to create simulation data items for all files in a directory at
         *directory_path*. Ignore if files can not be parsed.
@@ -446,31 +1108,19 @@ class SimulationDataItemFactory(QObject):
         """
 
         item_list = []
-        self.class_selection_dialog.reset()
-        for file_name in listdir(directory_path):
-            path = join(directory_path, file_name)
-            try:
-                item_list.extend(self.create_item_from_file(path))
-                print("Parsed '{}' ".format(path))
-            except RuntimeError:
-                break
-            except SimulationDataItemError as error:
-                pass
-                # We definitely cannot accept thousands of exceptions on the command line
-                # print((
-                #    "Could not create simulation data item from file '{}'"
-                #    " due to {}"
-                # ).format(path, error))
+        for file_item_list in self.iter_item_lists_from_directory(directory_path):
+            item_list.extend(file_item_list)
         return item_list
 
     def create_item_list_from_path(self, path):
         """Create a list of simulation data items from a path. The path can
-        either be a file or a directory and is parsed accordingly. The
+        either be a file, a tar or zip archive or a directory and is parsed
+        accordingly. The
         method fails if not at least one simulation data item can be
         created.
         Typically, a simulation data item is obtained from a single file.
         However, if the file is a csv file multiple simulation data items are
-        assumed to occur in that file. Therefore, handle the csv separately.
+        assumed to occur in that file, see :func: `parse_csv_item_list`.
 
         :param path: :class: `str` path
 
@@ -478,12 +1128,11 @@ class SimulationDataItemFactory(QObject):
         """
         self.class_selection_dialog.reset()
 
-        # this is the case of a csvfile...only one file for several
-        # simulation data items. Parse the file here and create an
-        # item for every nonempty line
-        if (isfile(path) and path.endswith(".csv")):
-            self.parse_csv_item_list(path)
-
+        if is_archive(path):
+            item_list = [item for item_list in self.iter_item_lists_from_archive(path) for item in item_list]
+            if len(item_list) == 0:
+                raise SimulationDataItemError()
+            return item_list
         if isfile(path):
             return self.create_item_from_file(path)
         if isdir(path):
@@ -506,21 +1155,11 @@ class SimulationDataItemFactory(QObject):
         try:
             from rdplot.SimulationDataItemClasses.CsvLogs import CSVLog
 
-            with open(log_path) as csvfile:
-                lines = csvfile.readlines()
-
-            header = lines[0]
             # the config is assumed to be in the file name
-            config = splitext(basename(log_path))[0]
-
-            item_list = []
-            for line in lines[1:]:
-                # first remove newline characters
-                line = line.replace("\n", "")
-                # and if we have empty lines somewhere, continue
-                if not line:
-                    continue
-                item_list.append(CSVLog(config, header, line))
+            config = splitext(basename(strip_compression_extension(log_path)))[0]
+
+            # the csv file might be a member of an archive
+            item_list = CSVLog.from_csv_text(config, read_file_text(log_path))
             return item_list
         except Exception as e:
             raise SimulationDataItemError()
@@ -533,6 +1172,40 @@ class SimulationDataItemFactory(QObject):
         return str("SimulationDataItemFactory with loaded classes: ".format(str(self)))
 
 
+# Factory of a worker process of a parser pool, see
+# :func: `SimulationDataItemFactory.create_parser_pool`
+_parser_process_factory = None
+
+
+def _init_parser_process(classes):
+    global _parser_process_factory
+    _parser_process_factory = SimulationDataItemFactory(classes)
+
+
+def _create_item_list_from_text_in_parser_process(member):
+    """Create the items for an archive *member*, i.e. a tuple of its path and
+    its text, in a worker process"""
+    factory = _parser_process_factory
+    file_path, text = member
+    try:
+        return factory._create_item_list_from_text(file_path, text, factory._get_parser_classes())
+    except SimulationDataItemError:
+        return []
+
+
+def _create_item_list_in_parser_process(file_path):
+    """Create the items for the file at *file_path* in a worker process.
+    Returns None, if the file has to be handled by the main process, i.e. if no
+    class can parse the file and the user has to select one.
+    """
+    factory = _parser_process_factory
+    try:
+        item_list = factory._create_item_list_with_parser_class(file_path, factory._get_parser_classes())
+    except SimulationDataItemError:
+        return []
+    return item_list if item_list else None
+
+
 class ClassSelectionDialog():
     def __init__(self):
         self.checked = False
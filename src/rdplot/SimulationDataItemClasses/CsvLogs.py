@@ -19,106 +19,178 @@
 ###############################################################################
 import re
 
-from rdplot.SimulationDataItem import AbstractSimulationDataItem
+import numpy as np
 
+from rdplot.SimulationDataItem import AbstractSimulationDataItem, strip_compression_extension
+from rdplot.lib.LabelRegistry import LabelRegistry
 
-class CSVLog(AbstractSimulationDataItem):
-    def __init__(self, config, header, line):
-        # we do not have a unique path for each simulation data item
-        # in the case of a csv file. Abuse the line as unique identifier
-        # there should not be any equal lines
-        super().__init__(line)
 
+class CsvSchema:
+    """Layout of the columns of a csv file, which is resolved once from the
+    *header* of the file: the indices of the sequence, qp and rate columns,
+    and the value columns together with their CI columns.
+
+    :param header: First line of the csv file
+    :type header: :class: `str`
+    """
+
+    def __init__(self, header):
         header = header.replace("\n", "")
-        header = re.split(r'[,;]',header.lower())
+        header = re.split(r'[,;]', header.lower())
         header = list(filter(None, header))
+        self.header = header
 
         try:
-            sequence_idx = header.index("sequence")
-        except Exception: # Sequence not found. Search for partial string
-            sequence_idx = 0
+            self.sequence_index = header.index("sequence")
+        except ValueError:  # Sequence not found. Search for partial string
+            self.sequence_index = 0
             for i, token in enumerate(header):
                 if "sequence" in token:
-                    sequence_idx = i
+                    self.sequence_index = i
                     break
 
         try:
-            qp_idx = header.index("qp")
+            self.qp_index = header.index("qp")
         except ValueError:
             try:
-                qp_idx = header.index("rate point")
+                self.qp_index = header.index("rate point")
             except ValueError:
-                qp_idx = header.index("bitrate")
-
-        # split also the line
-        line = re.split(r'[,;]',line)
-        line = list(line)
-        # line = list(filter(None, line))
+                self.qp_index = header.index("bitrate")
 
         # I want to allow for all header fields looking like the bitrate
         # Therefore, it is a little bit more complicated here
-        rate_idx = -1
-        try:
-            rate_idx = header.index("bitrate")
-        except ValueError:
-            pass
-
-        if rate_idx == -1:
-            tmp = list(map(lambda x: 'rate' in x, header))
-            rate_idx = tmp.index(1)
-
         try:
-            rate = float(line[rate_idx])
+            self.rate_index = header.index("bitrate")
         except ValueError:
-            rate = float('nan')
-
-        self.sequence = line[sequence_idx]
-        self.qp = line[qp_idx]
-        self.config = config
+            self.rate_index = [('rate' in token) for token in header].index(True)
 
-        data = {}
-        for i in range(0, len(header)):
+        # list of (name, index, index of the CI column or None) of the values
+        self.value_columns = []
+        for i, name in enumerate(header):
             # skip the header entries
-            if i in [sequence_idx, qp_idx, rate_idx]:
+            if i in [self.sequence_index, self.qp_index, self.rate_index]:
                 continue
             # check if value is a confidence value (CI)
             # if entry is a ci-value we can skip it, since
-            # it will be later processed with the according value
-            if header[i].find('-ci') != -1:
+            # it will be processed with the according value
+            if name.find('-ci') != -1:
                 continue
-            else:
-                # Check if CI value can be found, else just read the data.
-                # In case that a CI value is found, store its header index.
-                # Afterwards store the value and CI into a tuple with three
-                # entries (rate, value, ci-value). Otherwise we will just
-                # store the data in a tuple with two entries (rate, value).
-                # CI columns are always labeled as '<VALUE_NAME>-CI'.
-                ci_idx = -1
-                for j in range(0, len(header)):
-                    if header[j].find(header[i]+'-ci') != -1:
-                        ci_idx = j
-                        break
-
-                try:  # Prevent errors from missing last data item
-                    if ci_idx == -1:
-                        # Read only the data (no CI available)
-                        try:
-                            data[header[i]] = [(rate, float(line[i]))]
-                        except ValueError:
-                            data[header[i]] = [(rate, float('nan'))]
-                        continue
-                    else:
-                        # Read the data and CI in one tuple
-                        try:
-                            data[header[i]] = [(rate, float(line[i]), float(line[ci_idx]))]
-                        except ValueError:
-                            data[header[i]] = [(rate, float('nan'), float('nan'))]
-
-                        continue
-                except Exception as e:
-                    pass
-
-        self.summary_data = data
+            # CI columns are always labeled as '<VALUE_NAME>-CI'
+            ci_index = None
+            for j, ci_name in enumerate(header):
+                if ci_name.find(name + '-ci') != -1:
+                    ci_index = j
+                    break
+            self.value_columns.append((name, i, ci_index))
+
+    @staticmethod
+    def split_line(line):
+        return re.split(r'[,;]', line)
+
+    @staticmethod
+    def _get_column(rows, index):
+        """Strings of the column at *index*, None for rows which are too short"""
+        return [row[index] if index < len(row) else None for row in rows]
+
+    @staticmethod
+    def _to_float_column(strings):
+        """Convert the *strings* of a column to floats. Strings, which are
+        missing or cannot be converted, become None.
+        """
+        try:
+            return np.array(strings, dtype=float).tolist()
+        except (ValueError, TypeError):
+            pass
+
+        # at least one value is missing or not a number
+        floats = []
+        for string in strings:
+            try:
+                floats.append(float(string))
+            except (ValueError, TypeError):
+                floats.append(None)
+        return floats
+
+    def parse_summary_data(self, rows):
+        """Parse the summary data of all *rows*, i.e. the split lines of the
+        file, column by column.
+
+        :rtype: :class: `list` of summary data :class: `dict`s, one per row
+        """
+        nan = float('nan')
+        rates = [nan if rate is None else rate
+                 for rate in self._to_float_column([row[self.rate_index] for row in rows])]
+
+        data_list = [{} for _ in rows]
+        for name, index, ci_index in self.value_columns:
+            strings = self._get_column(rows, index)
+            values = self._to_float_column(strings)
+
+            if ci_index is None:
+                # Read only the data (no CI available)
+                for data, rate, string, value in zip(data_list, rates, strings, values):
+                    # values, which are missing at the end of a line, are skipped
+                    if string is not None:
+                        data[name] = [(rate, nan if value is None else value)]
+                continue
+
+            # Read the data and CI in one tuple (rate, value, ci-value)
+            ci_strings = self._get_column(rows, ci_index)
+            ci_values = self._to_float_column(ci_strings)
+            for data, rate, string, value, ci_string, ci_value in zip(data_list, rates, strings, values,
+                                                                      ci_strings, ci_values):
+                if string is None:
+                    continue
+                if value is None:
+                    data[name] = [(rate, nan, nan)]
+                elif ci_string is None:
+                    continue
+                elif ci_value is None:
+                    data[name] = [(rate, nan, nan)]
+                else:
+                    data[name] = [(rate, value, ci_value)]
+        return data_list
+
+
+class CSVLog(AbstractSimulationDataItem):
+    def __init__(self, config, header, line, schema=None, summary_data=None):
+        # we do not have a unique path for each simulation data item
+        # in the case of a csv file. Abuse the line as unique identifier
+        # there should not be any equal lines
+        super().__init__(line)
+
+        # the schema and the summary data are passed, if all lines of a file
+        # are parsed together, see :func: `from_csv_text`
+        if schema is None:
+            schema = CsvSchema(header)
+        row = schema.split_line(line)
+        if summary_data is None:
+            summary_data, = schema.parse_summary_data([row])
+
+        self.sequence = row[schema.sequence_index]
+        self.qp = row[schema.qp_index]
+        self.config = config
+        self.summary_data = summary_data
+
+    @classmethod
+    def from_csv_text(cls, config, text):
+        """Create an item for every nonempty line of the csv file with the
+        given *text*. The columns are resolved once from the header, and the
+        values of all lines are converted column by column.
+
+        :rtype: :class: `list` of :class: `CSVLog`
+        """
+        lines = text.split("\n")
+        header = lines[0]
+        schema = CsvSchema(header)
+
+        # if we have empty lines somewhere, skip them
+        lines = [line for line in lines[1:] if line]
+        rows = [schema.split_line(line) for line in lines]
+
+        summary_data_list = schema.parse_summary_data(rows)
+        return [cls(config, header, line, schema, summary_data)
+                for (line, summary_data) in zip(lines, summary_data_list)]
 
     @property
     def tree_identifier_list(self):
@@ -140,6 +212,10 @@ class CSVLog(AbstractSimulationDataItem):
         :param keys: Variable/Path for which to get the labels
         :return: tuple of labels: (x-axis label, y-axis label)
         """
+        return _label_registry.get_label(keys)
+
+    @staticmethod
+    def _create_label(keys):
         if keys[1].lower().find('psnr') != -1:
             label = ('kbps', 'dB')
         elif keys[1].lower().find('vmaf') != -1:
@@ -158,14 +234,17 @@ class CSVLog(AbstractSimulationDataItem):
 
     def can_parse_file(self):
         # we assume that we can parse it for the moment
-        if self.endswith('.csv'):
+        if strip_compression_extension(self).endswith('.csv'):
             return True
 
     # Non-abstract Helper Functions
     @classmethod
     def _enc_log_file_matches_re_pattern(cls, path, pattern):
         """"""
-        if path.endswith(".csv"):
+        if strip_compression_extension(path).endswith(".csv"):
             return cls._is_file_text_matching_re_pattern(path, pattern)
         return False
 
+
+# the labels of csv logs only depend on the variable name
+_label_registry = LabelRegistry(default_function=CSVLog._create_label)
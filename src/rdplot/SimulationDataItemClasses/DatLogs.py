@@ -17,45 +17,146 @@
 #    along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 ##################################################################################################
-import xmltodict
 from abc import abstractmethod
-from xml.parsers.expat import ExpatError
+from functools import partial
+from xml.parsers.expat import ExpatError, ParserCreate
 from os.path import normpath, dirname
 
-from rdplot.SimulationDataItem import (AbstractSimulationDataItem, SimulationDataItemError)
+from rdplot.SimulationDataItem import (AbstractSimulationDataItem, SimulationDataItemError, strip_compression_extension)
+from rdplot.lib.LabelRegistry import LabelRegistry
+
+
+class _RootElementFound(Exception):
+    pass
+
+
+class DatLogReader:
+    """Reads a dat log in a single pass with the expat parser. The document is
+    not kept, only the values and units of the elements below the root, and
+    the values of the frames in *temporal_data*, which are converted to float
+    while they are read.
+
+    A dat log is structured like::
+
+        <Logfile>
+            <Rate><Unit>kbps</Unit><Value>4171.1368</Value></Rate>
+            ...
+            <temporal_data>
+                <Frame0><PsnrY><Unit>dB</Unit><Value>39.5</Value></PsnrY>...</Frame0>
+                ...
+            </temporal_data>
+        </Logfile>
+    """
+
+    def __init__(self):
+        self.root = None
+        # element name -> value string
+        self.values = {}
+        # element name -> unit string
+        self.units = {}
+        # element name -> list of (frame number, value) tuples
+        self.temporal_data = {}
+
+        # names of the currently open elements
+        self._names = []
+        # character data of the current element
+        self._text = []
+
+    @staticmethod
+    def _create_parser():
+        # the text has already been decoded, and is passed as utf-8. Like
+        # xmltodict, override the encoding given by the xml declaration
+        parser = ParserCreate('utf-8')
+        parser.buffer_text = True
+        return parser
+
+    @classmethod
+    def read_root(cls, xml, is_complete=True):
+        """Read the name of the root element of the *xml* text. Parsing stops
+        at the root element, thus, *xml* may be the beginning of a document, if
+        *is_complete* is False.
+
+        :rtype: :class: `str`, or None if the root element has not been found
+        """
+        def start_element(name, attributes):
+            raise _RootElementFound(name)
+
+        parser = cls._create_parser()
+        parser.StartElementHandler = start_element
+        try:
+            parser.Parse(xml.encode('utf-8'), is_complete)
+        except _RootElementFound as root:
+            return root.args[0]
+        return None
+
+    def read(self, xml):
+        """Read the complete *xml* text"""
+        parser = self._create_parser()
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._text.append
+        parser.Parse(xml.encode('utf-8'), True)
+
+    def _start_element(self, name, attributes):
+        if self.root is None:
+            self.root = name
+        self._names.append(name)
+        self._text.clear()
+
+    def _end_element(self, name):
+        names = self._names
+        if name == 'Value' or name == 'Unit':
+            text = ''.join(self._text).strip()
+            if len(names) == 3:
+                # e.g. Logfile/Rate/Value
+                (self.values if name == 'Value' else self.units)[names[1]] = text
+            elif len(names) == 5 and names[1] == 'temporal_data' and name == 'Value':
+                # e.g. Logfile/temporal_data/Frame0/PsnrY/Value
+                frame_nr = int(names[2].split('Frame')[1])
+                try:
+                    self.temporal_data.setdefault(names[3], []).append((frame_nr, float(text)))
+                except ValueError:
+                    print("Could not convert %s: %s to float" % (names[3], text))
+        names.pop()
+        self._text.clear()
 
 
 class AbstractDatLog(AbstractSimulationDataItem):
     def __init__(self, path):
         super().__init__(path)
 
-        with open(self.path, 'r') as dat_log:
-            xml = dat_log.read()
-            sim_data = xmltodict.parse(xml)
-            sim_data = sim_data['Logfile']
-            # store the parsed xml dict
-            self.sim_data = sim_data
+        reader = DatLogReader()
+        try:
+            reader.read(self._read_file_text(self.path))
+        except ExpatError as error:
+            raise SimulationDataItemError("Could not parse '{}' due to {}".format(self.path, error))
+        if reader.root != 'Logfile':
+            raise SimulationDataItemError("'{}' is not a dat log".format(self.path))
+        # only the units are kept, they are needed for the labels
+        self.units = reader.units
 
         # Parse file path and set additional identifiers
         # self.logType = self._get_Type(path)
-        self.sequence, self.config, self.qp = self._parse_path(self.path)
+        self.sequence, self.config, self.qp = self._parse_path(self.path, reader.values)
 
         # Dictionaries holding the parsed values
-        self.summary_data = self._parse_summary_data()
-        self.temporal_data = self._parse_temporal_data()
+        self.summary_data = self._parse_summary_data(reader.values)
+        self.temporal_data = self._parse_temporal_data(reader.temporal_data)
 
         self.log_config = self._parse_config()
 
-    def _parse_path(self, path):
+    def _parse_path(self, path, values):
         """ parses the identifiers for an encoder log out of the
         path of the logfile and the sequence name and qp given in
          the logfile"""
         # set config to path of sim data item
         config = dirname(normpath(path))
-        sim_data = self.sim_data
 
-        sequence = sim_data['SeqName']['Value']
-        qp = sim_data['QP']['Value']
+        try:
+            sequence = values['SeqName']
+            qp = values['QP']
+        except KeyError as error:
+            raise SimulationDataItemError("Missing value {} in '{}'".format(error, path))
 
         return sequence, config, qp
 
@@ -73,6 +174,16 @@ class AbstractDatLog(AbstractSimulationDataItem):
         """
         pass
 
+    def _get_units(self):
+        """Units of the values by element name"""
+        units = getattr(self, 'units', None)
+        if units is None:
+            # items loaded from rd files of older versions keep the whole dat
+            # log in *sim_data*
+            units = {key: value['Unit'] for (key, value) in self.sim_data.items()
+                     if isinstance(value, dict) and 'Unit' in value}
+        return units
+
     @property
     def data(self):
         # TODO we may want to have more data than summary and temporal
@@ -92,70 +203,51 @@ class AbstractDatLog(AbstractSimulationDataItem):
     @classmethod
     def _enc_log_file_matches_re_pattern(cls, path, pattern):
         """"""
-        if path.endswith("enc.log"):
+        if strip_compression_extension(path).endswith("enc.log"):
             return cls._is_file_text_matching_re_pattern(path, pattern)
         return False
 
 
 class XMLDatLog(AbstractDatLog):
+    # the dat log is read by a DatLogReader, the parsed xml dict is not kept
+    parser_version = 2
+
     @classmethod
     def can_parse_file(cls, path):
             try:
-                with open(path, 'r') as dat_log:
-                    xml = dat_log.read()
-                xmltodict.parse(xml)
-                # if we can parse the xml file, assume that RDPlot can display the data
-                return True
-            except (ExpatError, UnicodeDecodeError, KeyError, IsADirectoryError,FileNotFoundError, PermissionError) as err:
+                # the root element is at the beginning of the file, thus, the
+                # rest of the file does not have to be read for the detection
+                signature = cls._read_file_signature(path)
+                root = DatLogReader.read_root(signature.head, is_complete=signature.is_complete)
+                if root is None and not signature.is_complete:
+                    root = DatLogReader.read_root(cls._read_file_text(path))
+                # if the root is a Logfile, assume that RDPlot can display the data
+                return root == 'Logfile'
+            # OSError also covers corrupt compressed files
+            except (ExpatError, UnicodeDecodeError, KeyError, OSError) as err:
                 return False
 
-    def _parse_summary_data(self):
+    def _parse_summary_data(self, values):
         try:
-            # create local copy of sim data. we don't want to delete the rate field outside of this function
-            sim_data = dict(self.sim_data)
-            rate = float(sim_data['Rate']['Value'])
-            del sim_data['Rate']
-
-            data = {}
-            for key, value in sim_data.items():
-                if 'temporal_data' == key:
-                    continue
-                try:
-                    data[key] = [(rate, float(sim_data[key]['Value']))]
-                except ValueError:
-                    print("Could not convert %s: %s to float" % (key,sim_data[key]['Value'] ))
-                    continue
+            rate = float(values['Rate'])
+        except (KeyError, ValueError):
+            raise SimulationDataItemError("No valid rate in '{}'".format(self.path))
 
-            return data
-        except IndexError:
-            raise
+        data = {}
+        for key, value in values.items():
+            if key == 'Rate':
+                continue
+            try:
+                data[key] = [(rate, float(value))]
+            except ValueError:
+                print("Could not convert %s: %s to float" % (key, value))
+                continue
 
-    def _parse_temporal_data(self):
-        try:
-            # create local copy of sim data. we don't want to delete the rate field outside of this function
-            sim_data = dict(self.sim_data)
-            data = {}
-
-            if 'temporal_data' in sim_data:
-                temporal_data = sim_data['temporal_data']
-                for frame_string, frame_items in temporal_data.items():
-                    frame_nr = int(frame_string.split('Frame')[1])
-                    for key, item_desc in frame_items.items():
-                        try:
-                            if not key in data:
-                                # start new list
-                                data[key] = [(frame_nr, float(item_desc['Value']))]
-                            else:
-                                # append to list
-                                data[key] += [(frame_nr, float(item_desc['Value']))]
-                        except ValueError:
-                            print("Could not convert %s: %s to float" % (key,sim_data[key]['Value'] ))
-                            continue
-            else:
-                return {}
-            return data
-        except IndexError:
-            raise
+        return data
+
+    def _parse_temporal_data(self, temporal_data):
+        # the values are already converted by the reader
+        return temporal_data
 
     def _parse_config(self):
         """Method which parses log file to get config (QP, other parameters).
@@ -164,24 +256,34 @@ class XMLDatLog(AbstractDatLog):
         """
         return {}  # in case no configuration information has been parsed return an empty dict
 
+    # label registries by the units of the dat logs. Dat logs written by the
+    # same simulation setup share their units, thus, there are few of them.
+    _label_registries = {}
+
     def _get_label(self, keys):
         """
         :param keys: Variable/Path for which to get the labels
         :return: tuple of labels: (x-axis label, y-axis label)
         """
-        sim_data = self.sim_data
+        units = self._get_units()
+        units_key = tuple(sorted(units.items()))
+        try:
+            label_registry = self._label_registries[units_key]
+        except KeyError:
+            # bind only the units, the registry must not keep the item alive
+            label_registry = LabelRegistry(default_function=partial(type(self)._create_label, units))
+            self._label_registries[units_key] = label_registry
+        return label_registry.get_label(keys)
 
+    @staticmethod
+    def _create_label(units, keys):
         if keys[0] == 'Summary':
-            unit_rate = sim_data['Rate']['Unit']
-            label_x = unit_rate
+            label_x = units.get('Rate', 'dummy')
         elif keys[0] == 'Temporal':
             label_x = 'Frame'
         else:
             label_x = 'dummy'
 
-        if 'Unit' in sim_data[keys[-1]]:
-            label_y = sim_data[keys[-1]]['Unit']
-        else:
-            label_y = 'dummy'
+        label_y = units.get(keys[-1], 'dummy')
 
         return (label_x, label_y)
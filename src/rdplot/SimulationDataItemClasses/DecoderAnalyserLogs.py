@@ -21,7 +21,12 @@ import re
 from os.path import normpath, basename, dirname
 from abc import abstractclassmethod
 
-from rdplot.SimulationDataItem import AbstractSimulationDataItem, SimulationDataItemError
+from rdplot.SimulationDataItem import AbstractSimulationDataItem, SimulationDataItemError, strip_compression_extension
+from rdplot.lib.LabelRegistry import LabelRegistry
+
+
+# everything is plotted over QP
+_label_registry = LabelRegistry(default_function=lambda keys: ('QP', keys[-1]))
 
 
 class AbstractDecAnalyserLog(AbstractSimulationDataItem):
@@ -61,10 +66,7 @@ class AbstractDecAnalyserLog(AbstractSimulationDataItem):
         :return: tuple of labels: (x-axis label, y-axis label)
         """
 
-        # everything is plotted over QP:
-        label = ('QP', keys[-1])
-
-        return label
+        return _label_registry.get_label(keys)
 
     # Properties
 
@@ -94,8 +96,8 @@ class AbstractDecAnalyserLog(AbstractSimulationDataItem):
     @classmethod
     def _enc_log_file_matches_re_pattern(cls, path, pattern):
         """"""
-        if path.endswith("dec.log"):
-            return cls._is_file_text_matching_re_pattern(path, pattern)
+        if strip_compression_extension(path).endswith("dec.log"):
+            return cls._is_file_signature_matching_re_pattern(path, pattern)
         return False
 
 
@@ -112,88 +114,87 @@ class DecAnalyserLogHM(AbstractDecAnalyserLog):
         return matches_class and is_finished
 
     def _parse_analyser_data(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-
-            # we are only interested in the statistics. splitting the file at the line with 'Decoder statistics'
-            dec_statistics = re.split('Decoder statistics', log_text)[1]
-            # each statistic has its own line:
-            dec_statistics = re.split('\n', dec_statistics)
-
-            data = dict()
-            data['Total'] = {}
-
-            variables_list = ['CABAC Count', 'CABAC Sum', 'CABAC bits', 'EP Count', 'EP Sum', 'EP bits', 'Total bits',
-                              'Total bytes']
-
-            # process each line
-            for statistic in dec_statistics:
-                # try to match non total items
-                m = re.match(
-                    r'\s*(\S+)\s*:' +         # name
-                    r'\s*(\S+)' +             # width
-                    r'\s*(\S+)' +             # type
-                    r'\s*(\S+)' +             # CABAC Count
-                    r'\s*(\S+)' +             # CABAC Sum
-                    r'\s*(\S+)' +             # CABAC bits
-                    r'\s*(\S+)' +             # EP Count
-                    r'\s*(\S+)' +             # EP Sum
-                    r'\s*(\S+)' +             # EP bits
-                    r'\s*(\S+)' +             # Total bits
-                    r'\s*\(\s*(\S+)\)',       # Total bytes
-                    statistic)
-                if m:
-                    statistic_name = m.group(1)
-                    statistic_width = m.group(2)
-                    statistic_type = m.group(3)
-
-                    # create type, width, statistic name if not existing
-                    if statistic_type not in data:
-                        data[statistic_type] = {}
-                    if statistic_width not in data[statistic_type]:
-                        data[statistic_type][statistic_width] = {}
-                    if statistic_name not in data[statistic_type][statistic_width]:
-                        data[statistic_type][statistic_width][statistic_name] = {}
-
-                    for idx, var_name in enumerate(variables_list):
-                        # Reference all data to bit rate
-                        data[statistic_type][statistic_width][statistic_name][var_name] = []
-                        # add an entry for each variable in variables_list
-                        data[statistic_type][statistic_width][statistic_name][var_name].append(
-                            (self.qp, float(m.group(idx + 4))))
-                        pass
-
-                    continue
-
-                # try to match total items
-                m = re.match(
-                    r'\[(\S+)\s*~' +          # name
-                    r'\s*(\S+)' +             # width
-                    r'\s*(\S+)' +             # type
-                    r'\s*(\S+)' +             # CABAC Count
-                    r'\s*(\S+)' +             # CABAC Sum
-                    r'\s*(\S+)' +             # CABAC bits
-                    r'\s*(\S+)' +             # EP Count
-                    r'\s*(\S+)' +             # EP Sum
-                    r'\s*(\S+)' +             # EP bits
-                    r'\s*(\S+)' +             # Total bits
-                    r'\s*\(\s*(\S+)\)\]',     # Total bytes
-                    statistic)
-                if m:
-                    statistic_name = m.group(1)
-
-                    # create  statistic name if not existing
-                    if statistic_name not in data['Total']:
-                        data['Total'][statistic_name] = {}
-
-                    for idx, var_name in enumerate(variables_list):
-                        # Reference all data to qp
-                        data['Total'][statistic_name][var_name] = []
-                        # add an entry for each variable in variables_list
-                        data['Total'][statistic_name][var_name].append((self.qp, float(m.group(idx + 4))))
-                        pass
-
-                    continue
+        log_text = self._read_file_text(self.path)
+
+        # we are only interested in the statistics. splitting the file at the line with 'Decoder statistics'
+        dec_statistics = re.split('Decoder statistics', log_text)[1]
+        # each statistic has its own line:
+        dec_statistics = re.split('\n', dec_statistics)
+
+        data = dict()
+        data['Total'] = {}
+
+        variables_list = ['CABAC Count', 'CABAC Sum', 'CABAC bits', 'EP Count', 'EP Sum', 'EP bits', 'Total bits',
+                          'Total bytes']
+
+        # process each line
+        for statistic in dec_statistics:
+            # try to match non total items
+            m = re.match(
+                r'\s*(\S+)\s*:' +         # name
+                r'\s*(\S+)' +             # width
+                r'\s*(\S+)' +             # type
+                r'\s*(\S+)' +             # CABAC Count
+                r'\s*(\S+)' +             # CABAC Sum
+                r'\s*(\S+)' +             # CABAC bits
+                r'\s*(\S+)' +             # EP Count
+                r'\s*(\S+)' +             # EP Sum
+                r'\s*(\S+)' +             # EP bits
+                r'\s*(\S+)' +             # Total bits
+                r'\s*\(\s*(\S+)\)',       # Total bytes
+                statistic)
+            if m:
+                statistic_name = m.group(1)
+                statistic_width = m.group(2)
+                statistic_type = m.group(3)
+
+                # create type, width, statistic name if not existing
+                if statistic_type not in data:
+                    data[statistic_type] = {}
+                if statistic_width not in data[statistic_type]:
+                    data[statistic_type][statistic_width] = {}
+                if statistic_name not in data[statistic_type][statistic_width]:
+                    data[statistic_type][statistic_width][statistic_name] = {}
+
+                for idx, var_name in enumerate(variables_list):
+                    # Reference all data to bit rate
+                    data[statistic_type][statistic_width][statistic_name][var_name] = []
+                    # add an entry for each variable in variables_list
+                    data[statistic_type][statistic_width][statistic_name][var_name].append(
+                        (self.qp, float(m.group(idx + 4))))
+                    pass
+
+                continue
+
+            # try to match total items
+            m = re.match(
+                r'\[(\S+)\s*~' +          # name
+                r'\s*(\S+)' +             # width
+                r'\s*(\S+)' +             # type
+                r'\s*(\S+)' +             # CABAC Count
+                r'\s*(\S+)' +             # CABAC Sum
+                r'\s*(\S+)' +             # CABAC bits
+                r'\s*(\S+)' +             # EP Count
+                r'\s*(\S+)' +             # EP Sum
+                r'\s*(\S+)' +             # EP bits
+                r'\s*(\S+)' +             # Total bits
+                r'\s*\(\s*(\S+)\)\]',     # Total bytes
+                statistic)
+            if m:
+                statistic_name = m.group(1)
+
+                # create  statistic name if not existing
+                if statistic_name not in data['Total']:
+                    data['Total'][statistic_name] = {}
+
+                for idx, var_name in enumerate(variables_list):
+                    # Reference all data to qp
+                    data['Total'][statistic_name][var_name] = []
+                    # add an entry for each variable in variables_list
+                    data['Total'][statistic_name][var_name].append((self.qp, float(m.group(idx + 4))))
+                    pass
+
+                continue
 
         return data
 
@@ -20,9 +20,170 @@
 import re
 from abc import abstractmethod
 from collections import defaultdict
+from collections.abc import Mapping
 from os.path import normpath, basename, dirname, splitext, split
 
-from rdplot.SimulationDataItem import (AbstractSimulationDataItem)
+import jsonpickle
+import numpy as np
+
+from rdplot.SimulationDataItem import (AbstractSimulationDataItem, strip_compression_extension)
+from rdplot.lib.LabelRegistry import LabelRegistry
+
+
+# Patterns for the lines of the encoders holding the data of one POC
+_HM_POC_LINE_PATTERN = re.compile(r"""
+    POC \s+ (\d+) \s+ .+ \s+ \d+ \s+ . \s+ (.-\D+) ,  #Slice
+    \s .+ \) \s+ (\d+) \s+ (.+) \s+ #bits
+    \[ (\D+) \s+ (\d+.\d+) \s+ #Y PSNR
+    \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ # U PSNR
+    \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ \D+ . # V PSNR
+    \s+ \[ (\D+) \s+ (\d+) \s+# Encoding time
+    """, re.X)
+
+_HM360LIB_POC_LINE_PATTERN = re.compile(r"""
+    POC \s+ (\d+) \s+ .+ \s+ \d+ \s+ . \s+ (.-\D+) ,  # POC, Slice
+    \s .+ \) \s+ (\d+) \s+ \S+ \s+  # bitrate
+    \[ \S \s (\S+) \s \S+ \s+ \S \s (\S+) \s \S+ \s+ \S \s (\S+) \s \S+ ] \s  # y-, u-, v-PSNR
+    \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-SPSNR_NN
+    \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-WSPSNR
+    \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-SPSNR_I
+    \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-CPPPSNR
+    \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-E2EWSPSNR
+    \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-PSNR_VP0
+    \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-PSNR_VP1
+    \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFSPSNR_NN
+    \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFSPSNR_I
+    \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFCPPPSNR
+    \[ \D+ \s+ (\d+) \s+ #ET
+    """, re.X)
+
+_SHM_POC_LINE_PATTERN = re.compile(r"""
+    POC \s+ (\d+) .+? : \s+ (\d+) .+ (\D-\D+) \s \D+,  #Slice
+    .+ \) \s+ (\d+) \s+ (.+) \s+ \[ (\D+) \s+ (\d+.\d+) \s+ #Y PSNR
+    \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ # U PSNR
+    \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ \D+ . # v PSNR
+    \s+ \[ (\D+) \s+ (\d+) \s+# Encoding time
+    """, re.X)
+
+
+def _create_enc_log_labels():
+    """Create the tree of labels of the variables of encoder logs, see
+    :class: `LabelRegistry`"""
+    # create all the labels with dictionaries. The leaves are tuples of x, y-labels
+    labels = {}
+    labels['Summary'] = {}
+    labels['Summary']['B'] = labels['Summary']['B Slices'] = labels['Summary']['B']['layer 0'] = \
+        labels['Summary']['B']['layer 1'] = labels['Summary']['B']['layer 1 + 2'] = defaultdict(
+        lambda: ('kbps', 'dB'))
+    labels['Summary']['I'] = labels['Summary']['I Slices'] = labels['Summary']['I']['layer 0'] = \
+        labels['Summary']['I']['layer 1'] = labels['Summary']['I']['layer 1 + 2'] = defaultdict(
+        lambda: ('kbps', 'dB'))
+    labels['Summary']['P'] = labels['Summary']['P Slices'] = labels['Summary']['P']['layer 0'] = \
+        labels['Summary']['P']['layer 1'] = labels['Summary']['P']['layer 1 + 2'] = defaultdict(
+        lambda: ('kbps', 'dB'))
+    labels['Summary']['SUMMARY'] = \
+        labels['Summary']['SUMMARY']['layer 0'] = \
+        labels['Summary']['SUMMARY']['layer 1'] = \
+        labels['Summary']['SUMMARY']['layer 1 + 2'] = \
+        labels['Summary']['PSNR1'] = \
+        labels['Summary']['PSNR2'] = \
+        labels['Summary']['PSNR3'] = \
+        labels['Summary']['PSNR4'] = \
+        defaultdict(lambda: ('kbps', 'dB'))
+
+    labels['Summary']['B']['Bitrate'] = labels['Summary']['I']['Bitrate'] = labels['Summary']['P']['Bitrate'] = \
+        labels['Summary']['SUMMARY']['Bitrate'] = ('kbps', 'bits')
+    labels['Summary']['B']['Frames'] = labels['Summary']['B']['Total Frames'] = ('kbps', 'Frames')
+    labels['Summary']['I']['Frames'] = labels['Summary']['I']['Total Frames'] = ('kbps', 'Frames')
+    labels['Summary']['P']['Frames'] = labels['Summary']['P']['Total Frames'] = ('kbps', 'Frames')
+    labels['Summary']['SUMMARY']['Frames'] = labels['Summary']['SUMMARY']['Total Frames'] = ('kbps', 'Frames')
+    labels['Summary']['SUMMARY']['Total Time'] = ('kbps', 'sec')
+    labels['Summary']['SUMMARY']['HM Major Version'] = labels['Summary']['SUMMARY']['HM Minor Version'] = \
+        labels['Summary']['SUMMARY']['360Lib Version'] = ('', 'sec')
+
+    labels['Temporal'] = labels['Temporal']['layer 0'] = labels['Temporal']['layer 1'] = defaultdict(
+        lambda: ('Frame', 'dB'))
+    labels['Temporal']['Bits'] = ('Frame', 'bits')
+    labels['Temporal']['Frames'] = ('Frame', 'POC')
+    labels['Temporal']['ET'] = ('Frame', 'sec')
+    return labels
+
+
+# the labels are the same for all encoder logs
+_label_registry = LabelRegistry(_create_enc_log_labels())
+
+
+class TemporalData(Mapping):
+    """Compact storage of the temporal data of an encoder log, ie. the values
+    of columns like *Y-PSNR* or *Bits* for each frame. Each column is stored
+    as typed numpy array, and the frame indexes are stored once for all
+    columns. Still, the data is accessed like a :class: `dict` of
+    :class: `list`s of (frame index, value) pairs, which are created on
+    access. Thus, the memory of a loaded log does not grow with tuple and
+    number objects for every value of every frame.
+
+    :param columns: Values of the frames by name of the column
+    :type columns: :class: `dict` of :class: `list`s, all of the same length
+
+    :param frames: Frame indexes of the values, by default the index of the
+        value in its column
+    :type frames: :class: `list` of :class: `int`
+    """
+
+    __slots__ = ('_frames', '_columns')
+
+    def __init__(self, columns, frames=None):
+        self._columns = {name: np.asarray(column) for (name, column) in columns.items()}
+        if frames is None:
+            frames = range(max((len(column) for column in self._columns.values()), default=0))
+        self._frames = np.asarray(frames)
+
+    @classmethod
+    def from_pairs(cls, temporal_data):
+        """Create the compact storage from a :class: `dict` of :class: `list`s
+        of (frame index, value) pairs, like it is stored in rd files. Values
+        stored as strings by older versions are converted to floats.
+
+        :rtype: :class: `TemporalData`, or *temporal_data* itself, if the
+            columns do not share their frame indexes
+        """
+        frames = None
+        columns = {}
+        for (name, pairs) in temporal_data.items():
+            column_frames = [frame for (frame, _) in pairs]
+            if frames is None:
+                frames = column_frames
+            elif column_frames != frames:
+                return temporal_data
+            column = np.asarray([value for (_, value) in pairs])
+            if column.dtype.kind in 'US':
+                try:
+                    column = column.astype(float)
+                except ValueError:
+                    return temporal_data
+            columns[name] = column
+        return cls(columns, frames)
+
+    def __getitem__(self, name):
+        return list(zip(self._frames.tolist(), self._columns[name].tolist()))
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+
+class _TemporalDataHandler(jsonpickle.handlers.BaseHandler):
+    """Write :class: `TemporalData` to rd files as plain :class: `dict` of
+    pairs, so the files can still be read by older versions. On reading,
+    the temporal data is compacted again by the encoder log."""
+
+    def flatten(self, obj, data):
+        return {name: self.context.flatten(pairs, reset=False) for (name, pairs) in obj.items()}
+
+
+jsonpickle.handlers.register(TemporalData, _TemporalDataHandler)
 
 
 class AbstractEncLog(AbstractSimulationDataItem):
@@ -33,7 +194,8 @@ class AbstractEncLog(AbstractSimulationDataItem):
         # self.logType = self._get_Type(path)
         self.sequence, self.config = self._parse_path(self.path)
 
-        # Dictionaries holding the parsed values
+        # Dictionaries holding the parsed values. Note, that all parse stages
+        # share one read of the log file, see *_read_file_text*
         self.summary_data = self._parse_summary_data()
         self.temporal_data = self._parse_temporal_data()
         self.additional_params = []
@@ -47,10 +209,9 @@ class AbstractEncLog(AbstractSimulationDataItem):
         # set config to path of sim data item
         config = dirname(normpath(path))
         # open log file and parse for sequence name and qp
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            sequence = re.findall(r""" ^Input \s+ File \s+ : \s+ (\S+) $
-                                    """, log_text, re.M + re.X)
+        log_text = self._read_file_text(self.path)
+        sequence = re.findall(r""" ^Input \s+ File \s+ : \s+ (\S+) $
+                                """, log_text, re.M + re.X)
 
         # set sequence to the sequence name without path and suffix
         # not for
@@ -64,52 +225,8 @@ class AbstractEncLog(AbstractSimulationDataItem):
         :param keys: Variable/Path for which to get the labels
         :return: tuple of labels: (x-axis label, y-axis label)
         """
-        # create all the labels with dictionaries. The leaves are tuples of x, y-labels
-        labels = {}
-        labels['Summary'] = {}
-        labels['Summary']['B'] = labels['Summary']['B Slices'] = labels['Summary']['B']['layer 0'] = \
-            labels['Summary']['B']['layer 1'] = labels['Summary']['B']['layer 1 + 2'] = defaultdict(
-            lambda: ('kbps', 'dB'))
-        labels['Summary']['I'] = labels['Summary']['I Slices'] = labels['Summary']['I']['layer 0'] = \
-            labels['Summary']['I']['layer 1'] = labels['Summary']['I']['layer 1 + 2'] = defaultdict(
-            lambda: ('kbps', 'dB'))
-        labels['Summary']['P'] = labels['Summary']['P Slices'] = labels['Summary']['P']['layer 0'] = \
-            labels['Summary']['P']['layer 1'] = labels['Summary']['P']['layer 1 + 2'] = defaultdict(
-            lambda: ('kbps', 'dB'))
-        labels['Summary']['SUMMARY'] = \
-            labels['Summary']['SUMMARY']['layer 0'] = \
-            labels['Summary']['SUMMARY']['layer 1'] = \
-            labels['Summary']['SUMMARY']['layer 1 + 2'] = \
-            labels['Summary']['PSNR1'] = \
-            labels['Summary']['PSNR2'] = \
-            labels['Summary']['PSNR3'] = \
-            labels['Summary']['PSNR4'] = \
-            defaultdict(lambda: ('kbps', 'dB'))
-
-        labels['Summary']['B']['Bitrate'] = labels['Summary']['I']['Bitrate'] = labels['Summary']['P']['Bitrate'] = \
-            labels['Summary']['SUMMARY']['Bitrate'] = ('kbps', 'bits')
-        labels['Summary']['B']['Frames'] = labels['Summary']['B']['Total Frames'] = ('kbps', 'Frames')
-        labels['Summary']['I']['Frames'] = labels['Summary']['I']['Total Frames'] = ('kbps', 'Frames')
-        labels['Summary']['P']['Frames'] = labels['Summary']['P']['Total Frames'] = ('kbps', 'Frames')
-        labels['Summary']['SUMMARY']['Frames'] = labels['Summary']['SUMMARY']['Total Frames'] = ('kbps', 'Frames')
-        labels['Summary']['SUMMARY']['Total Time'] = ('kbps', 'sec')
-        labels['Summary']['SUMMARY']['HM Major Version'] = labels['Summary']['SUMMARY']['HM Minor Version'] = \
-            labels['Summary']['SUMMARY']['360Lib Version'] = ('', 'sec')
-
-        labels['Temporal'] = labels['Temporal']['layer 0'] = labels['Temporal']['layer 1'] = defaultdict(
-            lambda: ('Frame', 'dB'))
-        labels['Temporal']['Bits'] = ('Frame', 'bits')
-        labels['Temporal']['Frames'] = ('Frame', 'POC')
-        labels['Temporal']['ET'] = ('Frame', 'sec')
-        label = labels
-        # return needed label with keys
-
-        for idx in keys[1:]:
-            if isinstance(label[idx], dict):
-                label = label[idx]
-            else:
-                label = label[idx]
-                return label
+        # the first key is the class name
+        return _label_registry.get_label(keys[1:])
 
     # Properties
 
@@ -141,6 +258,8 @@ class AbstractEncLog(AbstractSimulationDataItem):
         # This is for conformance with rd data written out by older versions of rdplot
         if not hasattr(self, 'additional_params'):
             self.additional_params = []
+        # Temporal data read from rd files is plain dicts of pairs
+        self.temporal_data = self._compact_temporal_data(self.temporal_data)
         l1 = list(zip(self.additional_params, [self.log_config[i] for i in self.additional_params]))
         l1 = list(map(lambda x: '='.join(x), l1))
         return [
@@ -176,8 +295,8 @@ class AbstractEncLog(AbstractSimulationDataItem):
     @classmethod
     def _enc_log_file_matches_re_pattern(cls, path, pattern):
         """"""
-        if path.endswith("enc.log"):
-            return cls._is_file_text_matching_re_pattern(path, pattern)
+        if strip_compression_extension(path).endswith("enc.log"):
+            return cls._is_file_signature_matching_re_pattern(path, pattern)
         return False
 
     @abstractmethod
@@ -195,10 +314,46 @@ class AbstractEncLog(AbstractSimulationDataItem):
         """
         pass
 
+    @staticmethod
+    def _iter_poc_line_values(log_text, line_pattern):
+        """Generator of the values of all lines in *log_text* starting with
+        'POC', which match the compiled *line_pattern*. The lines are processed
+        one at a time.
+        :return: tuples of the groups of the matches
+        """
+        for line_match in re.finditer(r'^POC.*$', log_text, re.M):
+            match = line_pattern.match(line_match.group())
+            if match:
+                yield match.groups()
+
+    @staticmethod
+    def _temporal_data_from_columns(columns):
+        """Create the temporal data from columns of values per frame.
+        As referencing to frame produces error, reference to index *i*
+        :return: :class: `TemporalData`, which behaves like a dict of lists of
+            (i, value) pairs
+        """
+        return TemporalData(columns)
+
+    @classmethod
+    def _compact_temporal_data(cls, temporal_data):
+        """Convert *temporal_data* given as (nested) dicts of lists of pairs
+        to :class: `TemporalData`
+
+        :rtype: :class: `TemporalData`, or dict of it for logs with layers
+        """
+        if isinstance(temporal_data, TemporalData) or len(temporal_data) == 0:
+            return temporal_data
+        if all(isinstance(value, Mapping) for value in temporal_data.values()):
+            return {key: cls._compact_temporal_data(value) for (key, value) in temporal_data.items()}
+        return TemporalData.from_pairs(temporal_data)
+
 
 class EncLogHM(AbstractEncLog):
     # Order value, used to determine order in which parser are tried.
     parse_order = 10
+    # temporal data is stored as numbers instead of strings
+    parser_version = 2
 
     @classmethod
     def can_parse_file(cls, path):
@@ -211,37 +366,36 @@ class EncLogHM(AbstractEncLog):
         return matches_class and is_finished
 
     def _parse_summary_data(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-
-            hm_match = re.search(r'HM software: Encoder Version \[([a-zA-Z-]+)?([0-9]+)\.([0-9]+)', log_text)
-            hm_major_version = hm_match.group(2)
-            hm_minor_version = hm_match.group(3)
-
-            if hm_major_version == '14':  # HM 14 does not write out average YUV-PSNR
-                # catch summary line
-                summaries = re.findall(r""" ^(\w*)-*.*$
-                                   \s* # catch newline and space
-                                   (.*)\| # catch phrase Total Frames / I / P / B
-                                   (\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)# catch rest of the line
-                                   \s* # catch newline and space
-                                   (\d+\s+)\w # catch frame number (integer)
-                                   (\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+) # other numbers (rate, PSNRs)
-                              """, log_text, re.M + re.X)
-                total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                               """, log_text, re.M + re.X)
-            else:
-                # catch summary line
-                summaries = re.findall(r""" ^(\w*)-*.*$
+        log_text = self._read_file_text(self.path)
+
+        hm_match = re.search(r'HM software: Encoder Version \[([a-zA-Z-]+)?([0-9]+)\.([0-9]+)', log_text)
+        hm_major_version = hm_match.group(2)
+        hm_minor_version = hm_match.group(3)
+
+        if hm_major_version == '14':  # HM 14 does not write out average YUV-PSNR
+            # catch summary line
+            summaries = re.findall(r""" ^(\w*)-*.*$
                                \s* # catch newline and space
                                (.*)\| # catch phrase Total Frames / I / P / B
-                               (\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)# catch rest of the line
+                               (\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)# catch rest of the line
                                \s* # catch newline and space
                                (\d+\s+)\w # catch frame number (integer)
-                               (\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)# others (rate, PSNRs)
+                               (\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+) # other numbers (rate, PSNRs)
                           """, log_text, re.M + re.X)
-                total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                               """, log_text, re.M + re.X)
+            total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
+                           """, log_text, re.M + re.X)
+        else:
+            # catch summary line
+            summaries = re.findall(r""" ^(\w*)-*.*$
+                           \s* # catch newline and space
+                           (.*)\| # catch phrase Total Frames / I / P / B
+                           (\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)# catch rest of the line
+                           \s* # catch newline and space
+                           (\d+\s+)\w # catch frame number (integer)
+                           (\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)# others (rate, PSNRs)
+                      """, log_text, re.M + re.X)
+            total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
+                           """, log_text, re.M + re.X)
         data = {}
         for summary in summaries:
             summary_type = summary[0]
@@ -280,32 +434,31 @@ class EncLogHM(AbstractEncLog):
         return data
 
     def _parse_config(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            lines = log_text.split('\n')
-            cleanlist = []
-            # some of the configs should not be interpreted as parameters
-            # those are removed from the cleanlist
-            param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
-                                    'TotalTime', 'HMsoftware']
-            for one_line in lines:
-                if one_line:
-                    if 'Non-environment-variable-controlled' in one_line:
-                        break
-                    if one_line.count(':') == 1:
-                        clean_line = one_line.strip(' \n\t\r')
-                        clean_line = re.sub(r'\s+', '', clean_line)
-                        if not any(re.search(param, clean_line) for param in param_not_considered):
-                            cleanlist.append(clean_line)
-                    elif one_line.count(':') > 1:
-                        if re.search(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
-                            clean_line = re.findall(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
-                                                    one_line, re.X)
-                        else:
-                            clean_line = re.findall(r'\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
-                        for clean_item in clean_line:
-                            if not any(re.search(param, clean_item) for param in param_not_considered):
-                                cleanlist.append(clean_item)
+        log_text = self._read_file_text(self.path)
+        lines = log_text.split('\n')
+        cleanlist = []
+        # some of the configs should not be interpreted as parameters
+        # those are removed from the cleanlist
+        param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
+                                'TotalTime', 'HMsoftware']
+        for one_line in lines:
+            if one_line:
+                if 'Non-environment-variable-controlled' in one_line:
+                    break
+                if one_line.count(':') == 1:
+                    clean_line = one_line.strip(' \n\t\r')
+                    clean_line = re.sub(r'\s+', '', clean_line)
+                    if not any(re.search(param, clean_line) for param in param_not_considered):
+                        cleanlist.append(clean_line)
+                elif one_line.count(':') > 1:
+                    if re.search(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
+                        clean_line = re.findall(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
+                                                one_line, re.X)
+                    else:
+                        clean_line = re.findall(r'\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
+                    for clean_item in clean_line:
+                        if not any(re.search(param, clean_item) for param in param_not_considered):
+                            cleanlist.append(clean_item)
 
         parsed_config = dict(item.split(':', maxsplit=1) for item in cleanlist)
         self.qp = parsed_config['QP']
@@ -313,37 +466,26 @@ class EncLogHM(AbstractEncLog):
 
     def _parse_temporal_data(self):
         # this function extracts temporal values
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-
-        temp_data = re.findall(r"""
-            ^POC \s+ (\d+) \s+ .+ \s+ \d+ \s+ . \s+ (.-\D+) ,  #Slice
-            \s .+ \) \s+ (\d+) \s+ (.+) \s+ #bits
-            \[ (\D+) \s+ (\d+.\d+) \s+ #Y PSNR
-            \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ # U PSNR
-            \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ \D+ . # V PSNR
-            \s+ \[ (\D+) \s+ (\d+) \s+# Encoding time
-            """, log_text, re.M + re.X)
-
-        # Association between index of data in temp_data and corresponding
-        # output key. Output shape definition is in one place.
-        names = {0: 'Frames', 2: 'Bits', 5: 'Y-PSNR', 7: 'U-PSNR',
-                 9: 'V-PSNR', 11: 'ET'}
+        log_text = self._read_file_text(self.path)
 
-        # Define output data dict and fill it with parsed values
-        data = {name: [] for (index, name) in names.items()}
-        for i in range(0, len(temp_data)):
-            # As referencing to frame produces error, reference to index *i*
-            for (index, name) in names.items():
-                data[name].append(
-                    (i, temp_data[i][index])
-                )
-        return data
+        # Association between index of data in a POC line match and corresponding
+        # output key and type. Output shape definition is in one place.
+        names = {0: ('Frames', int), 2: ('Bits', int), 5: ('Y-PSNR', float), 7: ('U-PSNR', float),
+                 9: ('V-PSNR', float), 11: ('ET', int)}
+
+        # Define output columns and fill them with parsed values
+        columns = {name: [] for (name, _) in names.values()}
+        for values in self._iter_poc_line_values(log_text, _HM_POC_LINE_PATTERN):
+            for (index, (name, convert)) in names.items():
+                columns[name].append(convert(values[index]))
+        return self._temporal_data_from_columns(columns)
 
 
 class EncLogHM360Lib(AbstractEncLog):
     # Order value, used to determine order in which parser are tried.
     parse_order = 20
+    # temporal data is stored as numbers instead of strings
+    parser_version = 2
 
     @classmethod
     def can_parse_file(cls, path):
@@ -352,34 +494,33 @@ class EncLogHM360Lib(AbstractEncLog):
         return matches_class and is_finished
 
     def _parse_config(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            lines = log_text.split('\n')
-            cleanlist = []
-            # some of the configs should not be interpreted as parameters
-            # those are removed from the cleanlist
-            param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
-                                    'TotalTime', 'HMsoftware']
-            for one_line in lines:
-                if one_line:
-                    if '-----360 video parameters----' in one_line:
-                        break
-                    if 'Non-environment-variable-controlled' in one_line:
-                        break
-                    if one_line.count(':') == 1:
-                        clean_line = one_line.strip(' \n\t\r')
-                        clean_line = re.sub(r'\s+', '', clean_line)
-                        if not any(re.search(param, clean_line) for param in param_not_considered):
-                            cleanlist.append(clean_line)
-                    elif one_line.count(':') > 1:
-                        if re.search(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
-                            clean_line = re.findall(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
-                                                    one_line, re.X)
-                        else:
-                            clean_line = re.findall(r'\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
-                        for clean_item in clean_line:
-                            if not any(re.search(param, clean_item) for param in param_not_considered):
-                                cleanlist.append(clean_item)
+        log_text = self._read_file_text(self.path)
+        lines = log_text.split('\n')
+        cleanlist = []
+        # some of the configs should not be interpreted as parameters
+        # those are removed from the cleanlist
+        param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
+                                'TotalTime', 'HMsoftware']
+        for one_line in lines:
+            if one_line:
+                if '-----360 video parameters----' in one_line:
+                    break
+                if 'Non-environment-variable-controlled' in one_line:
+                    break
+                if one_line.count(':') == 1:
+                    clean_line = one_line.strip(' \n\t\r')
+                    clean_line = re.sub(r'\s+', '', clean_line)
+                    if not any(re.search(param, clean_line) for param in param_not_considered):
+                        cleanlist.append(clean_line)
+                elif one_line.count(':') > 1:
+                    if re.search(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
+                        clean_line = re.findall(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
+                                                one_line, re.X)
+                    else:
+                        clean_line = re.findall(r'\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
+                    for clean_item in clean_line:
+                        if not any(re.search(param, clean_item) for param in param_not_considered):
+                            cleanlist.append(clean_item)
 
         parsed_config = dict(item.split(':', maxsplit=1) for item in cleanlist)
 
@@ -396,10 +537,9 @@ class EncLogHM360Lib(AbstractEncLog):
 
     def _parse_summary_data(self):
 
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()
-            total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                            """, log_text, re.M + re.X)
+        log_text = self._read_file_text(self.path)
+        total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
+                        """, log_text, re.M + re.X)
 
         # get 360 Lib version
         m = re.match(r'-----360Lib\ software\ version\ (\[3.0\])-----', log_text)
@@ -449,26 +589,9 @@ class EncLogHM360Lib(AbstractEncLog):
 
     def _parse_temporal_data(self):
         # this function extracts temporal values
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            temp_data = re.findall(r"""
-                ^POC \s+ (\d+) \s+ .+ \s+ \d+ \s+ . \s+ (.-\D+) ,  # POC, Slice
-                \s .+ \) \s+ (\d+) \s+ \S+ \s+  # bitrate
-                \[ \S \s (\S+) \s \S+ \s+ \S \s (\S+) \s \S+ \s+ \S \s (\S+) \s \S+ ] \s  # y-, u-, v-PSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-SPSNR_NN
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-WSPSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-SPSNR_I
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-CPPPSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-E2EWSPSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-PSNR_VP0
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-PSNR_VP1
-                \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFSPSNR_NN
-                \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFSPSNR_I
-                \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFCPPPSNR
-                \[ \D+ \s+ (\d+) \s+ #ET
-                """, log_text, re.M + re.X)
-
-        # Association between index of data in temp_data and corresponding
+        log_text = self._read_file_text(self.path)
+
+        # Association between index of data in a POC line match and corresponding
         # output key. Output shape definition is in one place.
         names = {0: 'Frames', 2: 'Bits',
                  3: 'Y-PSNR', 4: 'U-PSNR', 5: 'V-PSNR',
@@ -480,21 +603,22 @@ class EncLogHM360Lib(AbstractEncLog):
                  21: 'Y-PSNR_VP0', 22: 'U-PSNR_VP0', 23: 'V-PSNR_VP0',
                  24: 'Y-PSNR_VP1', 25: 'U-PSNR_VP1', 26: 'V-PSNR_VP1', 27: 'ET'
                  }
+        # POC, bits and encoding time are integers, the PSNR values floats
+        integer_names = ['Frames', 'Bits', 'ET']
 
-        # Define output data dict and fill it with parsed values
-        data = {name: [] for (index, name) in names.items()}
-        for i in range(0, len(temp_data)):
-            # As referencing to frame produces error, reference to index *i*
+        # Define output columns and fill them with parsed values
+        columns = {name: [] for (index, name) in names.items()}
+        for values in self._iter_poc_line_values(log_text, _HM360LIB_POC_LINE_PATTERN):
             for (index, name) in names.items():
-                data[name].append(
-                    (i, temp_data[i][index])
-                )
-        return data
+                columns[name].append(int(values[index]) if name in integer_names else float(values[index]))
+        return self._temporal_data_from_columns(columns)
 
 
 class EncLogSHM(AbstractEncLog):
     # Order value, used to determine order in which parser are tried.
     parse_order = 21
+    # temporal data is stored as numbers instead of strings
+    parser_version = 2
 
     @classmethod
     def can_parse_file(cls, path):
@@ -503,14 +627,13 @@ class EncLogSHM(AbstractEncLog):
         return matches_class and is_finished
 
     def _parse_summary_data(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            summaries = re.findall(r"""
-                        ^\s+ L (\d+) \s+ (\d+) \s+ \D \s+ # the next is bitrate
-                        (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+)
-                        """, log_text, re.M + re.X)
-            total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                                        """, log_text, re.M + re.X)
+        log_text = self._read_file_text(self.path)
+        summaries = re.findall(r"""
+                    ^\s+ L (\d+) \s+ (\d+) \s+ \D \s+ # the next is bitrate
+                    (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+)
+                    """, log_text, re.M + re.X)
+        total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
+                                    """, log_text, re.M + re.X)
         data = {}
         layer_quantity = int(len(summaries) / 4)
         header_names = ['SUMMARY', 'I', 'P', 'B']
@@ -565,61 +688,59 @@ class EncLogSHM(AbstractEncLog):
 
     def _parse_temporal_data(self):
         # this function extracts temporal values
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            temp_data = re.findall(r"""
-                                ^POC \s+ (\d+) .+? : \s+ (\d+) .+ (\D-\D+) \s \D+,  #Slice
-                                .+ \) \s+ (\d+) \s+ (.+) \s+ \[ (\D+) \s+ (\d+.\d+) \s+ #Y PSNR
-                                \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ # U PSNR
-                                \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ \D+ . # v PSNR
-                                \s+ \[ (\D+) \s+ (\d+) \s+# Encoding time
-                                """, log_text, re.M + re.X)
-
-        # Association between index of data in temp_data and corresponding
-        # output key. Output shape definition is in one place.
-        names = {0: 'Frames', 3: 'Bits', 6: 'Y-PSNR', 8: 'U-PSNR',
-                 10: 'V-PSNR', 12: 'ET'}
-
-        layer_quantity = int(max(temp_data[i][1] for i in range(0, len(temp_data)))) + 1
-        layer_quantity = int(layer_quantity)
+        log_text = self._read_file_text(self.path)
+
+        # Association between index of data in a POC line match and corresponding
+        # output key and type. Output shape definition is in one place.
+        names = {0: ('Frames', int), 3: ('Bits', int), 6: ('Y-PSNR', float), 8: ('U-PSNR', float),
+                 10: ('V-PSNR', float), 12: ('ET', int)}
+        layer_index = 1
+
+        # Define output columns for each layer and fill them with parsed values
+        layer_columns = {}
+        for values in self._iter_poc_line_values(log_text, _SHM_POC_LINE_PATTERN):
+            layer = int(values[layer_index])
+            if layer not in layer_columns:
+                layer_columns[layer] = {name: [] for (name, _) in names.values()}
+            columns = layer_columns[layer]
+            for (index, (name, convert)) in names.items():
+                columns[name].append(convert(values[index]))
+
+        # only use frames (POCs) which are available for all layers
+        frame_quantity = min((len(columns['Frames']) for columns in layer_columns.values()), default=0)
         data = {}
-        for layer in range(0, layer_quantity):  # iterate through layers
-            data2 = {name: [] for (index, name) in names.items()}
-            for j in range(0, int(len(temp_data) / layer_quantity)):  # iterate through frames (POCS)
-                for (index, name) in names.items():
-                    data2[name].append(
-                        (j, temp_data[layer_quantity * j + layer][index])
-                    )
+        for layer in range(0, max(layer_columns, default=-1) + 1):  # iterate through layers
+            columns = layer_columns.get(layer, {name: [] for (name, _) in names.values()})
+            columns = {name: column[:frame_quantity] for (name, column) in columns.items()}
             layerstring = 'layer ' + str(layer)
-            data[layerstring] = data2
+            data[layerstring] = self._temporal_data_from_columns(columns)
         return data
 
     def _parse_config(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()                 # reads the whole text file
-            lines = log_text.split('\n')
-            clean_list = []
-            for one_line in lines:
-                if '=== Common configuration settings === ' in one_line:
-                    break
-                if re.match(r'QP\s+',one_line):
-                    clean_line = one_line.strip(' \n\t\r')
-                    clean_line = re.sub(r'\s+', '', clean_line)
-                    clean_list.append(clean_line)
-            clean_list = [item.split(':', maxsplit=1) for item in clean_list]
-            parsed_config = {}
-            for key, val in clean_list:
-                # Later the differences between the configurations are calculated.
-                # The calculation can not handle lists. Therefore the list elements are joined.
-                # The first element describes the QP value connected to the first layer
-                # and the second QP value connected to the second layer
-                # TODO: connect QP values better to layers
-                if key in parsed_config:
-                    parsed_config.setdefault(key, []).append(val)
-                    parsed_config[key] = '+'.join(parsed_config[key])
-                else:
-                    parsed_config.setdefault(key, []).append(val)
-            self.qp = parsed_config['QP']
+        log_text = self._read_file_text(self.path)
+        lines = log_text.split('\n')
+        clean_list = []
+        for one_line in lines:
+            if '=== Common configuration settings === ' in one_line:
+                break
+            if re.match(r'QP\s+',one_line):
+                clean_line = one_line.strip(' \n\t\r')
+                clean_line = re.sub(r'\s+', '', clean_line)
+                clean_list.append(clean_line)
+        clean_list = [item.split(':', maxsplit=1) for item in clean_list]
+        parsed_config = {}
+        for key, val in clean_list:
+            # Later the differences between the configurations are calculated.
+            # The calculation can not handle lists. Therefore the list elements are joined.
+            # The first element describes the QP value connected to the first layer
+            # and the second QP value connected to the second layer
+            # TODO: connect QP values better to layers
+            if key in parsed_config:
+                parsed_config.setdefault(key, []).append(val)
+                parsed_config[key] = '+'.join(parsed_config[key])
+            else:
+                parsed_config.setdefault(key, []).append(val)
+        self.qp = parsed_config['QP']
         return parsed_config
 
 
@@ -652,34 +773,33 @@ class EncLogVTM360Lib(AbstractEncLog):
         return sequence, config
 
     def _parse_config(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            lines = log_text.split('\n')
-            cleanlist = []
-            # some of the configs should not be interpreted as parameters
-            # those are removed from the cleanlist
-            param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
-                                    'TotalTime', 'VVCSoftware']
-            for one_line in lines:
-                if one_line:
-                    if '-----360 video parameters----' in one_line:
-                        break
-                    if 'Non-environment-variable-controlled' in one_line:
-                        break
-                    if one_line.count(':') == 1:
-                        clean_line = one_line.strip(' \n\t\r')
-                        clean_line = re.sub(r'\s+', '', clean_line)
-                        if not any(re.search(param, clean_line) for param in param_not_considered):
-                            cleanlist.append(clean_line)
-                    elif one_line.count(':') > 1:
-                        if re.search(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
-                            clean_line = re.findall(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
-                                                    one_line, re.X)
-                        else:
-                            clean_line = re.findall(r'\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
-                        for clean_item in clean_line:
-                            if not any(re.search(param, clean_item) for param in param_not_considered):
-                                cleanlist.append(clean_item)
+        log_text = self._read_file_text(self.path)
+        lines = log_text.split('\n')
+        cleanlist = []
+        # some of the configs should not be interpreted as parameters
+        # those are removed from the cleanlist
+        param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
+                                'TotalTime', 'VVCSoftware']
+        for one_line in lines:
+            if one_line:
+                if '-----360 video parameters----' in one_line:
+                    break
+                if 'Non-environment-variable-controlled' in one_line:
+                    break
+                if one_line.count(':') == 1:
+                    clean_line = one_line.strip(' \n\t\r')
+                    clean_line = re.sub(r'\s+', '', clean_line)
+                    if not any(re.search(param, clean_line) for param in param_not_considered):
+                        cleanlist.append(clean_line)
+                elif one_line.count(':') > 1:
+                    if re.search(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
+                        clean_line = re.findall(r'\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
+                                                one_line, re.X)
+                    else:
+                        clean_line = re.findall(r'\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
+                    for clean_item in clean_line:
+                        if not any(re.search(param, clean_item) for param in param_not_considered):
+                            cleanlist.append(clean_item)
 
         parsed_config = dict(item.split(':', maxsplit=1) for item in cleanlist)
 
@@ -698,61 +818,60 @@ class EncLogVTM360Lib(AbstractEncLog):
 
     def _parse_summary_data(self):
 
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()
-            total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                            """, log_text, re.M + re.X)
+        log_text = self._read_file_text(self.path)
+        total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
+                        """, log_text, re.M + re.X)
 
-            # get 360 Lib version                        
-            version360Lib = re.findall(r'-----360Lib\ software\ version\ \[(\d.\d)\]-----', log_text)
-            if not version360Lib:
-                version360Lib = 0
+        # get 360 Lib version                        
+        version360Lib = re.findall(r'-----360Lib\ software\ version\ \[(\d.\d)\]-----', log_text)
+        if not version360Lib:
+            version360Lib = 0
 
-            # dictionary for the parsed data
-            data = {}
+        # dictionary for the parsed data
+        data = {}
 
-            # get the summaries as pair of summary type and summary text, splitting at summary type and capturing it
-            summaries_texts_and_types = re.split('Total Frames',
-                                                log_text)
-            del summaries_texts_and_types[0]  # remove the log text up to the first summary item
+        # get the summaries as pair of summary type and summary text, splitting at summary type and capturing it
+        summaries_texts_and_types = re.split('Total Frames',
+                                            log_text)
+        del summaries_texts_and_types[0]  # remove the log text up to the first summary item
 
-            summaries_texts_and_types = summaries_texts_and_types[0]
-            summaries_texts_and_types = 'Total Frames' + summaries_texts_and_types
-            summary_text = summaries_texts_and_types.strip().splitlines()
+        summaries_texts_and_types = summaries_texts_and_types[0]
+        summaries_texts_and_types = 'Total Frames' + summaries_texts_and_types
+        summary_text = summaries_texts_and_types.strip().splitlines()
 
 
 
 
 
-            # for summary_type, summary_text in zip(summaries_texts_and_types[0::2], summaries_texts_and_types[1::2]):
-            # summary_text = summary_text.strip().splitlines()  # first line is header, second line are the values
+        # for summary_type, summary_text in zip(summaries_texts_and_types[0::2], summaries_texts_and_types[1::2]):
+        # summary_text = summary_text.strip().splitlines()  # first line is header, second line are the values
 
-            # parsing header
-            first_header_item, remaining_items = re.split(r'\|', summary_text[0])  # since first item has a space
-            remaining_items = re.split(r'\s+', remaining_items.strip())
-            header = [first_header_item] + remaining_items
+        # parsing header
+        first_header_item, remaining_items = re.split(r'\|', summary_text[0])  # since first item has a space
+        remaining_items = re.split(r'\s+', remaining_items.strip())
+        header = [first_header_item] + remaining_items
 
-            # parsing values
-            values = re.split(r'\s+', summary_text[1].strip())
-            del values[1]  # remove the letter below the | in the header (a, b, p or i)
+        # parsing values
+        values = re.split(r'\s+', summary_text[1].strip())
+        del values[1]  # remove the letter below the | in the header (a, b, p or i)
 
-            if header[1] != 'Bitrate':
-                raise Exception('Could not parse bitrate.')
-            rate = values[1]
+        if header[1] != 'Bitrate':
+            raise Exception('Could not parse bitrate.')
+        rate = values[1]
             
-            summary_type = 'SUMMARY'
-            data[summary_type] = {}
-            for name, value in zip(header, values):
-                name = name.strip()
-                summary_item = {name: [(float(rate), float(value))]}
+        summary_type = 'SUMMARY'
+        data[summary_type] = {}
+        for name, value in zip(header, values):
+            name = name.strip()
+            summary_item = {name: [(float(rate), float(value))]}
 
-                data[summary_type].update(summary_item)
+            data[summary_type].update(summary_item)
 
-            if summary_type == 'SUMMARY':
-                data['SUMMARY']['Total Time'] = [(float(rate), float(total_time[0]))]
-                data['SUMMARY']['360Lib Version'] = [(float(rate), float(version360Lib[0]))]
+        if summary_type == 'SUMMARY':
+            data['SUMMARY']['Total Time'] = [(float(rate), float(total_time[0]))]
+            data['SUMMARY']['360Lib Version'] = [(float(rate), float(version360Lib[0]))]
 
-            return data
+        return data
 
 
 class EncLogVTM(AbstractEncLog):
@@ -795,46 +914,45 @@ class EncLogVTM(AbstractEncLog):
 
     def _parse_summary_data(self):
 
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()
+        log_text = self._read_file_text(self.path)
 
-            # dictionary for the parsed data
-            data = {}
+        # dictionary for the parsed data
+        data = {}
 
-            # get the summaries as pair of summary type and summary text,
-            # splitting at summary type and capturing it
-            summaries_texts_and_types = re.split('Total Frames', log_text)
-            del summaries_texts_and_types[
-                0]  # remove the log text up to the first summary item
+        # get the summaries as pair of summary type and summary text,
+        # splitting at summary type and capturing it
+        summaries_texts_and_types = re.split('Total Frames', log_text)
+        del summaries_texts_and_types[
+            0]  # remove the log text up to the first summary item
 
-            summaries_texts_and_types = summaries_texts_and_types[0]
-            summaries_texts_and_types = 'Total Frames' + summaries_texts_and_types
-            summary_text = summaries_texts_and_types.strip().splitlines()
+        summaries_texts_and_types = summaries_texts_and_types[0]
+        summaries_texts_and_types = 'Total Frames' + summaries_texts_and_types
+        summary_text = summaries_texts_and_types.strip().splitlines()
 
-            # parsing header
-            first_header_item, remaining_items = re.split(
-                r'\|', summary_text[0])  # since first item has a space
-            remaining_items = re.split(r'\s+', remaining_items.strip())
-            header = [first_header_item] + remaining_items
+        # parsing header
+        first_header_item, remaining_items = re.split(
+            r'\|', summary_text[0])  # since first item has a space
+        remaining_items = re.split(r'\s+', remaining_items.strip())
+        header = [first_header_item] + remaining_items
 
-            # parsing values
-            values = re.split(r'\s+', summary_text[1].strip())
-            del values[
-                1]  # remove the letter below the | in the header (a, b, p or i)
+        # parsing values
+        values = re.split(r'\s+', summary_text[1].strip())
+        del values[
+            1]  # remove the letter below the | in the header (a, b, p or i)
 
-            if header[1] != 'Bitrate':
-                raise Exception('Could not parse bitrate.')
-            rate = values[1]
+        if header[1] != 'Bitrate':
+            raise Exception('Could not parse bitrate.')
+        rate = values[1]
 
-            summary_type = 'SUMMARY'
-            data[summary_type] = {}
-            for name, value in zip(header, values):
-                name = name.strip()
-                summary_item = {name: [(float(rate), float(value))]}
+        summary_type = 'SUMMARY'
+        data[summary_type] = {}
+        for name, value in zip(header, values):
+            name = name.strip()
+            summary_item = {name: [(float(rate), float(value))]}
 
-                data[summary_type].update(summary_item)
+            data[summary_type].update(summary_item)
 
-            return data
+        return data
 
     def _parse_temporal_data(self):
         return {}
@@ -881,96 +999,95 @@ class EncLogVTMRPR(AbstractEncLog):
 
     def _parse_summary_data(self):
 
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()
-
-            # dictionary for the parsed data
-            data = {}
+        log_text = self._read_file_text(self.path)
 
-            # get the summaries as pair of summary type and summary text,
-            # splitting at summary type and capturing it
-            summaries_texts_and_types = re.split('Total Frames', log_text)
-            del summaries_texts_and_types[
-                0]  # remove the log text up to the first summary item
-
-            summaries_texts_and_types = summaries_texts_and_types[0]
-            summaries_texts_and_types = 'Total Frames' + summaries_texts_and_types
-            summary_text = summaries_texts_and_types.strip().splitlines()
-
-            # parsing header
-            first_header_item, remaining_items = re.split(
-                r'\|', summary_text[0])  # since first item has a space
-            remaining_items = re.split(r'\s+', remaining_items.strip())
-            header = [first_header_item] + remaining_items
-
-            # parsing values
-            values = re.split(r'\s+', summary_text[1].strip())
-            del values[
-                1]  # remove the letter below the | in the header (a, b, p or i)
-
-            if header[1] != 'Bitrate':
-                raise Exception('Could not parse bitrate.')
-            rate = values[1]
-
-            summary_type = 'SUMMARY'
-            data[summary_type] = {}
-            for name, value in zip(header, values):
-                name = name.strip()
-                summary_item = {name: [(float(rate), float(value))]}
-
-                data[summary_type].update(summary_item)
-
-            # parse values for PSNR1 and PSNR2
-            header = re.split(r'\s+', summary_text[3].strip())
-            values = re.split(r'\s+', summary_text[4].strip())
-
-            summary_type = header.pop(0)
-            data[summary_type] = {}
-            for name, value in zip(header, values):
-                name = name.strip()
-                summary_item = {name: [(float(rate), float(value))]}
-
-                data[summary_type].update(summary_item)
-
-            # parse values for PSNR1
-            header = re.split(r'\s+', summary_text[5].strip())
-            values = re.split(r'\s+', summary_text[6].strip())
-
-            summary_type = header.pop(0)
-            data[summary_type] = {}
-            for name, value in zip(header, values):
-                name = name.strip()
-                summary_item = {name: [(float(rate), float(value))]}
+        # dictionary for the parsed data
+        data = {}
 
-                data[summary_type].update(summary_item)
+        # get the summaries as pair of summary type and summary text,
+        # splitting at summary type and capturing it
+        summaries_texts_and_types = re.split('Total Frames', log_text)
+        del summaries_texts_and_types[
+            0]  # remove the log text up to the first summary item
+
+        summaries_texts_and_types = summaries_texts_and_types[0]
+        summaries_texts_and_types = 'Total Frames' + summaries_texts_and_types
+        summary_text = summaries_texts_and_types.strip().splitlines()
+
+        # parsing header
+        first_header_item, remaining_items = re.split(
+            r'\|', summary_text[0])  # since first item has a space
+        remaining_items = re.split(r'\s+', remaining_items.strip())
+        header = [first_header_item] + remaining_items
+
+        # parsing values
+        values = re.split(r'\s+', summary_text[1].strip())
+        del values[
+            1]  # remove the letter below the | in the header (a, b, p or i)
+
+        if header[1] != 'Bitrate':
+            raise Exception('Could not parse bitrate.')
+        rate = values[1]
+
+        summary_type = 'SUMMARY'
+        data[summary_type] = {}
+        for name, value in zip(header, values):
+            name = name.strip()
+            summary_item = {name: [(float(rate), float(value))]}
+
+            data[summary_type].update(summary_item)
+
+        # parse values for PSNR1 and PSNR2
+        header = re.split(r'\s+', summary_text[3].strip())
+        values = re.split(r'\s+', summary_text[4].strip())
+
+        summary_type = header.pop(0)
+        data[summary_type] = {}
+        for name, value in zip(header, values):
+            name = name.strip()
+            summary_item = {name: [(float(rate), float(value))]}
+
+            data[summary_type].update(summary_item)
+
+        # parse values for PSNR1
+        header = re.split(r'\s+', summary_text[5].strip())
+        values = re.split(r'\s+', summary_text[6].strip())
+
+        summary_type = header.pop(0)
+        data[summary_type] = {}
+        for name, value in zip(header, values):
+            name = name.strip()
+            summary_item = {name: [(float(rate), float(value))]}
+
+            data[summary_type].update(summary_item)
+
+        # parse values and calculate PSNR-3,
+        # this is the PSNR off all frames including downsampled frames in their
+        # reference picture list
+        bits_ypsnr = re.findall(
+            r"(\d+) bits \[Y (\d+\.\d+) dB.*\(0.50x, 0.50x\).*", log_text)
+        bits = list(map(list, zip(*bits_ypsnr)))[0]
+        bits = list(map(float, bits))
+        bits = sum(bits) / bits.__len__()  # calculate bits per frame
+        y_psnr = list(map(list, zip(*bits_ypsnr)))[1]
+        y_psnr = list(map(float, y_psnr))
+        y_psnr = sum(y_psnr) / y_psnr.__len__()  # calculate average y-psnr
+        data['PSNR3'] = {'Y-PSNR': [(bits, y_psnr)]}
+
+        # parse values and calculate PSNR-4,
+        # this is the PSNR at upsampling points only
+        bits_ypsnr = re.findall(
+            r"(\d+) bits \[Y (\d+\.\d+) dB.*\[L0 \d+(?:\(0.50x, 0.50x\)|\(AddRef\)).*", log_text)
+        bits = list(map(list, zip(*bits_ypsnr)))[0]
+        bits = list(map(float, bits))
+        print(bits.__len__())
+        bits = sum(bits) / bits.__len__()  # calculate bits per frame
+        y_psnr = list(map(list, zip(*bits_ypsnr)))[1]
+        y_psnr = list(map(float, y_psnr))
+        y_psnr = sum(y_psnr) / y_psnr.__len__()  # calculate average y-psnr
+        data['PSNR4'] = {'Y-PSNR': [(bits, y_psnr)]}
 
-            # parse values and calculate PSNR-3,
-            # this is the PSNR off all frames including downsampled frames in their
-            # reference picture list
-            bits_ypsnr = re.findall(
-                r"(\d+) bits \[Y (\d+\.\d+) dB.*\(0.50x, 0.50x\).*", log_text)
-            bits = list(map(list, zip(*bits_ypsnr)))[0]
-            bits = list(map(float, bits))
-            bits = sum(bits) / bits.__len__()  # calculate bits per frame
-            y_psnr = list(map(list, zip(*bits_ypsnr)))[1]
-            y_psnr = list(map(float, y_psnr))
-            y_psnr = sum(y_psnr) / y_psnr.__len__()  # calculate average y-psnr
-            data['PSNR3'] = {'Y-PSNR': [(bits, y_psnr)]}
-
-            # parse values and calculate PSNR-4,
-            # this is the PSNR at upsampling points only
-            bits_ypsnr = re.findall(
-                r"(\d+) bits \[Y (\d+\.\d+) dB.*\[L0 \d+(?:\(0.50x, 0.50x\)|\(AddRef\)).*", log_text)
-            bits = list(map(list, zip(*bits_ypsnr)))[0]
-            bits = list(map(float, bits))
-            print(bits.__len__())
-            bits = sum(bits) / bits.__len__()  # calculate bits per frame
-            y_psnr = list(map(list, zip(*bits_ypsnr)))[1]
-            y_psnr = list(map(float, y_psnr))
-            y_psnr = sum(y_psnr) / y_psnr.__len__()  # calculate average y-psnr
-            data['PSNR4'] = {'Y-PSNR': [(bits, y_psnr)]}
-
-            return data
+        return data
 
     def _parse_temporal_data(self):
         return {}
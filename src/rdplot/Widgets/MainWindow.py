@@ -11,7 +11,7 @@ from PyQt5.uic import loadUiType
 from PyQt5.Qt import Qt
 
 
-from rdplot.SimulationDataItem import dict_tree_from_sim_data_items, PlotData
+from rdplot.SimulationDataItem import PlotData
 from rdplot.Widgets.PlotWidget import PlotWidget
 from rdplot.model import SimDataItemTreeModel, OrderedDictModel, VariableTreeModel, BdTableModel, BdUserGeneratedCurvesTableModel
 from rdplot.view import QRecursiveSelectionModel
@@ -69,6 +69,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # selected if parent is selected
         self._selection_model = QRecursiveSelectionModel(self.simDataItemTreeView.model())
         self.simDataItemTreeView.setSelectionModel(self._selection_model)
+        self.simDataItemTreeView.expanded.connect(self._selection_model.expand)
 
         # Connect list view with model for the selected values of tree view
         self.selectedSimulationDataItemListModel = OrderedDictModel()
@@ -129,9 +130,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.variableTreeView.setSelectionModel(
             self._variable_tree_selection_model
         )
+        self.variableTreeView.expanded.connect(
+            self._variable_tree_selection_model.expand
+        )
 
         # set up combo boxes for rate/psnr and interpolation options
-        self.combo_interp.addItems(["pchip", "pol"])
+        self.combo_interp.addItems(["pchip", "pol", "jvet"])
         self.combo_rate_psnr.addItems(["drate", "dsnr"])
         self.combo_ci.addItems(["average", "worst", "best"])
         self.combo_interp.currentIndexChanged.connect(self.on_combo_box)
@@ -253,20 +257,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Extend superclass behavior by automatically adding the values of
            all selected items in :param: `q_selected` to value list model. """
 
-        selected_q_indexes = q_deselected.indexes()
-
-        q_reselect_indexes = []
-        for q_index in self.simDataItemTreeView.selectedIndexes():
-            if q_index not in selected_q_indexes:
-                q_reselect_indexes.append(q_index)
-
-        # Find all all values that are contained by selected tree items
+        # Find all all values that are contained by selected tree items,
+        # including the sub items, which share the selection of their parent
         tuples = []
-        for q_index in q_selected.indexes() + q_reselect_indexes:
+        for item in self._selection_model.selected_items():
             # Add values, ie. sim data items stored at the item, to the list
             # model.
-            sim_data_items = q_index.internalPointer().values
-            tuples.extend((e.path, e) for e in sim_data_items)
+            tuples.extend((e.path, e) for e in item.values)
 
         # Overwrite all elements in dictionary by selected values
         # Note, that overwriting only issues one `updated` signal, and thus,
@@ -289,56 +286,32 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """
 
         plot_data_collection = []
-        for q_index in self.variableTreeView.selectedIndexes():
-            item = q_index.internalPointer()
+        for item in self._variable_tree_selection_model.selected_items():
             if len(item.values) > 0:
                 plot_data_collection.extend(item.values)
 
         return plot_data_collection
 
     def update_variable_tree(self):
-        """Collect all SimDataItems currently selected, and create variable
-        tree and corresponding data from it. Additionaly reselect all previously
-        selected variables.
+        """Update the variable tree with the data of all SimDataItems currently
+        selected. Only the data of the items, which were added to or removed
+        from the selection, is changed, thus, the tree items and the selection
+        of the variables are preserved.
         """
 
-        # Create a list of all currently selected paths
-        # Note, that *q_index* can not be used directly, because it might
-        # change if the variable tree is recreated
-        selected_path_collection = []
-        for q_index in self.variableTreeView.selectedIndexes():
-            selected_path_collection.append(
-                # Create list of identifiers from path
-                # Note, that the root node is excluded from the path
-                [item.identifier for item in q_index.internalPointer().path[1:]]
-            )
-
-        # Join the data of all currently selected items to a dictionary
-        # tree
         sim_data_items = self.get_selected_simulation_data_items()
-        dict_tree = dict_tree_from_sim_data_items(sim_data_items)
         # check if qp values are the same
         # self.check_qp(sim_data_items)
 
-        # Reset variable tree and update it with *dict_tree*
-        self.variableTreeModel.clear_and_update_from_dict_tree(dict_tree)
+        if not self.variableTreeModel.update_from_sim_data_items(sim_data_items):
+            return
 
         # Auto expand variable tree
         self.variableTreeView.expandToDepth(1)
 
-        # Reselect all variables, which also exist on the new tree
-        for path in selected_path_collection:
-            # Try to reselect, and do nothing, if path does not exist anymore
-            try:
-                # Reselect new item corresponding to the previously selected
-                # path
-                item = self.variableTreeModel.get_item_from_path(*path)
-                self.variableTreeView.selectionModel().select(
-                    self.variableTreeModel._get_index_from_item(item),
-                    QItemSelectionModel.Select,
-                )
-            except KeyError:
-                pass
+        # The values of the selected variables might have changed, without
+        # a change of the selection
+        self.update_plot()
 
     # TODO: it might be that some log files do not have a QP value, therefore the check_qp method must be
     #       implemented in a way that these files are not affected
@@ -376,14 +349,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def check_labels(self):
         selectionmodel = self.variableTreeView.selectionModel()
-        selected = self.variableTreeView.selectedIndexes()
+        selected = self._variable_tree_selection_model.selected_items()
         # return if no comparison needed
         if len(selected) < 2:
             return
         labelx = []
         labely = []
-        for index in selected:
-            x = index.internalPointer()
+        for x in selected:
             if len(x.values) > 0:
                 labelx.append(x.values[0].label[0])
                 labely.append(x.values[0].label[1])
@@ -501,16 +473,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         header = legend[0]
 
         for plot_data in plot_data_collection:
-            # check if plot_data value has a confidence interval
-            # confidence intervals are stored in tuples with three entries
-            # (rate, value, ci-value) instead of (rate, value) in the default case
-            if len(plot_data.values[0]) == 2:
-                values = ((float(x), float(y)) for (x, y) in plot_data.values)
-            else:
-                values = ((float(x), float(y)) for (x, y, z) in plot_data.values)
-
-            sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-            [xs, ys] = list(zip(*sorted_value_pairs))
+            # the confidence interval, if present, is not shown in the table
+            xs = plot_data.sorted_array[:, 0].tolist()
+            ys = plot_data.sorted_array[:, 1].tolist()
 
             # make header
             if plot_data.identifiers[0] not in data_names:
@@ -564,16 +529,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         for plot_data in plot_data_collection:
 
-            # check if plot_data value has a confidence interval
-            # confidence intervals are stored in tuples with three entries
-            # (rate, value, ci-value) instead of (rate, value) in the default case
-            if len(plot_data.values[0]) == 2:
-                values = ((float(x), float(y)) for (x, y) in plot_data.values)
-            else:
-                values = ((float(x), float(y)) for (x, y, z) in plot_data.values)
-
-            sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-            [xs, ys] = list(zip(*sorted_value_pairs))
+            # the confidence interval, if present, is not shown in the table
+            xs = plot_data.sorted_array[:, 0].tolist()
+            ys = plot_data.sorted_array[:, 1].tolist()
 
             # make header, important if more than one plot
             if plot_data.identifiers[0] not in data_names:
@@ -792,6 +750,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 f = open(path, 'r')
                 json_str = f.read()
                 sim_data_items = jsonpickle.decode(json_str)
+                self.simDataItemTreeModel.reset_log_config_tables()
                 self.simDataItemTreeModel.update(sim_data_items,False)
                 f.close()
                 continue
@@ -264,21 +264,14 @@ class PlotWidget(QWidget, Ui_PlotWidget):
         miny = 1e100
         maxy = -miny
         for plot_data in plot_data_collection:
-            if not plot_data.has_ci:
-                values = ((float(x), float(y)) for (x, y) in plot_data.values)
-                sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-                [xs, ys] = list(zip(*sorted_value_pairs))
-            else:
-                # A confidence interval is included in the data
-                values = ((float(x), float(y), float(z)) for (x, y, z) in plot_data.values)
-                sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-                [xs, ys, zs] = list(zip(*sorted_value_pairs))
-            if np.isnan(min(xs)) or np.isnan(max(xs)):
+            xs = plot_data.array[:, 0]
+            ys = plot_data.array[:, 1]
+            if np.isnan(xs.min()) or np.isnan(xs.max()):
                 continue
-            minr = min(min(xs), minr)
-            maxr = max(max(xs), maxr)
-            miny = min(min(ys), miny)
-            maxy = max(max(ys), maxy)
+            minr = min(xs.min(), minr)
+            maxr = max(xs.max(), maxr)
+            miny = min(ys.min(), miny)
+            maxy = max(ys.max(), maxy)
 
         # plot all the lines which are missing yet
         plot_count = 0
@@ -290,15 +283,13 @@ class PlotWidget(QWidget, Ui_PlotWidget):
                 (plot_data.color, plot_data.marker) = self.set_color(plot_data.identifiers[1], plot_data.identifiers[0])
                 plot_data.linestyle = self.set_linestyle(plot_data.path[1])
 
-            # Convert list of pairs of strings to two sorted lists of floats
+            # Take the values sorted by x, which are cached by the plot data
             # Check if plot_data value has a confidence interval
             # Confidence intervals are stored in tuples with three entries
             # (rate, value, ci-value) instead of (rate, value) in the default case
             try:
                 if not plot_data.has_ci:
-                    values = ((float(x), float(y)) for (x, y) in plot_data.values)
-                    sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-                    [xs, ys] = list(zip(*sorted_value_pairs))
+                    [xs, ys] = plot_data.sorted_array.T
 
                     if len(xs) == 1 and np.isnan(xs[0]):
                         xs = [minr, maxr]
@@ -310,9 +301,7 @@ class PlotWidget(QWidget, Ui_PlotWidget):
                     plot_count += 1
                 else:
                     # A confidence interval is included in the data
-                    values = ((float(x), float(y), float(z)) for (x, y, z) in plot_data.values)
-                    sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-                    [xs, ys, zs] = list(zip(*sorted_value_pairs))
+                    [xs, ys, zs] = plot_data.sorted_array.T
 
                     if len(xs) == 1 and np.isnan(xs[0]):
                         xs = [minr, maxr]
@@ -591,4 +580,18 @@ class BDPlotWidget(PlotWidget):
         suptitle = u'\u0394 PSNR = {diff}'.format(diff=avg_diff)
         plt.suptitle(suptitle)
 
-        show(block=False)
\ No newline at end of file
+        show(block=False)
+
+
+def plot_bd(seq, directories, mode, *plot_data):
+    """Plot the curves of a bjontegaard delta in a :class: `BDPlotWidget`.
+    This is the *plot* function of :func: `rdplot.lib.BD.bjontegaard`, which
+    is passed the name of the sequence, the names of the curves, the mode
+    and the data of :func: `BDPlotWidget.bd_plot_dsnr` or
+    :func: `BDPlotWidget.bd_plot_drate`."""
+    bd = BDPlotWidget(seq)
+    bd.create_legend(directories)
+    if mode == 'dsnr':
+        bd.bd_plot_dsnr(*plot_data)
+    else:
+        bd.bd_plot_drate(*plot_data)
@@ -27,6 +27,7 @@ from rdplot.Widgets import MainWindow
 
 import pkg_resources
 import sys
+from multiprocessing import freeze_support
 
 def main():
 
@@ -52,5 +53,7 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
+    # files are parsed by worker processes, which have to work in frozen applications, too
+    freeze_support()
     print("Starting RD-Plot...")
     main()
\ No newline at end of file
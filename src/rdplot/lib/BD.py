@@ -3,58 +3,202 @@
 #   RWTH Aachen University
 #   All Rights Reserved.
 
-import math
-from  math import log10
+# The calculation of the Bjontegaard deltas only depends on numpy, so it can
+# be used without a display or the gui. Plots are drawn by a function passed
+# as *plot*, see :func: `rdplot.Widgets.PlotWidget.plot_bd`.
 
-from rdplot.Widgets.PlotWidget import BDPlotWidget
+import hashlib
+import math
+from collections import OrderedDict
 
 import numpy as np
-from scipy.interpolate import pchip
-from scipy import integrate
 
-def bdrint(rate, dist, low, high):
-    log_rate = sorted([log10(t) for t in rate])
-    log_dist = sorted(dist)
-
-    h = [0] * 3
-    delta = [0] * 3
-    for i in range(0, 3):
-        h[i] = log_dist[i + 1] - log_dist[i]
-        delta[i] = (log_rate[i + 1] - log_rate[i]) / h[i]
-
-    d = [0] * 4
-    d[0] = ((2 * h[0] + h[1]) * delta[0] - h[0] * delta[1]) / (h[0] + h[1])
-    if d[0] * delta[0] < 0:
-        d[0] = 0
-    for i in range(1, 3):
-        d[i] = (3 * h[i - 1] + 3 * h[i]) / ((2 * h[i] + h[i - 1]) / delta[i - 1] + (h[i] + 2 * h[i - 1]) / delta[i])
-    d[3] = ((2 * h[2] + h[1]) * delta[2] - h[2] * delta[1]) / (h[2] + h[1])
-    if d[3] * delta[2] < 0:
-        d[3] = 0
-
-    c = [0] * 3
-    b = [0] * 3
-    for i in range(0, 3):
-        c[i] = (3 * delta[i] - 2 * d[i] - d[i + 1]) / h[i]
-        b[i] = (d[i] - 2 * delta[i] + d[i + 1]) / (h[i] * h[i])
 
-    '''
-    cubic function is rate(i) + s*(d(i) + s*(c(i) + s*(b(i))) where s = x - dist(i)
-    or rate(i) + s*d(i) + s*s*c(i) + s*s*s*b(i)
-    primitive is s*rate(i) + s*s*d(i)/2 + s*s*s*c(i)/3 + s*s*s*s*b(i)/4
-    '''
-    result = 0
+class LruCache:
+    """Cache with a bounded number of entries, which evicts the least
+    recently used entries first.
+
+    :param max_size: Maximal number of entries
+    :type max_size: :class: `int`
+    """
 
-    for i in range(0, 3):
-        s0 = max(log_dist[i], low) - log_dist[i]
-        s1 = min(log_dist[i + 1], high) - log_dist[i]
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
 
-        result += (s1 - s0) * log_rate[i]
-        result += (s1 * s1 - s0 * s0) * d[i] / 2
-        result += (s1 * s1 * s1 - s0 * s0 * s0) * c[i] / 3
-        result += (s1 * s1 * s1 * s1 - s0 * s0 * s0 * s0) * b[i] / 4
+    def get(self, key, default=None):
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
 
-    return result
+    def __setitem__(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Bjontegaard deltas calculated without plotting, and fits of single curves
+# for the batch calculation. Both are keyed by the content hashes of the
+# curves, the mode, the interpolation and the confidence interval modes.
+bd_result_cache = LruCache(100000)
+bd_fit_cache = LruCache(20000)
+
+
+def curve_key(curve):
+    """Get a hash of the content of *curve*, which identifies equal curves
+    in the caches
+
+    :param curve: Array of points (rate, psnr) or (rate, psnr, ci)
+
+    :rtype: :class: `tuple` of the shape and the digest of the points
+    """
+    curve = np.ascontiguousarray(curve, dtype=float)
+    return curve.shape, hashlib.blake2b(curve.tobytes(), digest_size=16).digest()
+
+
+def _hermite_cubics(x, y, d):
+    """Get the coefficients of the cubic pieces of hermite interpolations of
+    the rows of *x* and *y* with the derivatives *d* at the points. Each
+    piece is y[i] + d[i] * s + c[i] * s^2 + b[i] * s^3 with s = x - x[i].
+
+    :rtype: :class: `np.ndarray` of shape (curves, points - 1, 4), highest
+        power first
+    """
+    h = np.diff(x, axis=1)
+    m = np.diff(y, axis=1) / h
+    c = (3 * m - 2 * d[:, :-1] - d[:, 1:]) / h
+    b = (d[:, :-1] - 2 * m + d[:, 1:]) / (h * h)
+    return np.stack((b, c, d[:, :-1], y[:, :-1]), axis=-1)
+
+
+def _pchip_edge_derivatives(h0, h1, m0, m1):
+    """Get the derivatives of pchips at the first or last points, with the
+    one sided three point formula, which preserves the shape"""
+    d = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+    d = np.where(np.sign(d) != np.sign(m0), 0, d)
+    return np.where((np.sign(m0) != np.sign(m1)) & (np.abs(d) > 3 * np.abs(m0)), 3 * m0, d)
+
+
+def _pchip_derivatives(x, y):
+    """Get the derivatives at the points of the rows of *x* and *y* for the
+    piecewise cubic hermite interpolation, like
+    :class: `scipy.interpolate.PchipInterpolator` does. The derivatives are
+    the weighted harmonic mean of the slopes of the neighbouring intervals,
+    or zero at local extrema."""
+    h = np.diff(x, axis=1)
+    m = np.diff(y, axis=1) / h
+
+    d = np.empty_like(x)
+    w1 = 2 * h[:, 1:] + h[:, :-1]
+    w2 = h[:, 1:] + 2 * h[:, :-1]
+    harmonic_mean = (w1 / m[:, :-1] + w2 / m[:, 1:]) / (w1 + w2)
+    is_extremum = (np.sign(m[:, 1:]) != np.sign(m[:, :-1])) | (m[:, 1:] == 0) | (m[:, :-1] == 0)
+    d[:, 1:-1] = np.where(is_extremum, 0, 1 / harmonic_mean)
+    d[:, 0] = _pchip_edge_derivatives(h[:, 0], h[:, 1], m[:, 0], m[:, 1])
+    d[:, -1] = _pchip_edge_derivatives(h[:, -1], h[:, -2], m[:, -1], m[:, -2])
+    return d
+
+
+def _jvet_derivatives(x, y):
+    """Get the derivatives at the points of the rows of *x* and *y* for the
+    piecewise cubic interpolation of the JVET common test conditions, which
+    is used by bdrint. Like pchip, the weighted harmonic mean of the slopes
+    of the neighbouring intervals is used, but without setting the
+    derivatives at local extrema to zero."""
+    h = np.diff(x, axis=1)
+    m = np.diff(y, axis=1) / h
+
+    d = np.empty_like(x)
+    d[:, 1:-1] = 3 * (h[:, :-1] + h[:, 1:]) / ((2 * h[:, 1:] + h[:, :-1]) / m[:, :-1] +
+                                               (h[:, 1:] + 2 * h[:, :-1]) / m[:, 1:])
+    d[:, 0] = ((2 * h[:, 0] + h[:, 1]) * m[:, 0] - h[:, 0] * m[:, 1]) / (h[:, 0] + h[:, 1])
+    d[:, -1] = ((2 * h[:, -1] + h[:, -2]) * m[:, -1] - h[:, -1] * m[:, -2]) / (h[:, -1] + h[:, -2])
+    d[:, 0] = np.where(d[:, 0] * m[:, 0] < 0, 0, d[:, 0])
+    d[:, -1] = np.where(d[:, -1] * m[:, -1] < 0, 0, d[:, -1])
+    return d
+
+
+class PiecewiseCubic:
+    """Piecewise cubic function, which is evaluated by calling it, and which
+    is integrated exactly. Outside of the breaks, the first and the last
+    piece are extrapolated.
+
+    :param x: :class: `np.ndarray` of the increasing breaks
+    :param cubics: :class: `np.ndarray` of shape (pieces, 4) with the
+        coefficients of the pieces in the coordinate *x - x[i]*, highest
+        power first
+    """
+
+    def __init__(self, x, cubics):
+        self.x = x
+        self.cubics = cubics
+
+    def __call__(self, v):
+        v = np.asarray(v, dtype=float)
+        piece = np.clip(np.searchsorted(self.x, v, side='right') - 1, 0, len(self.cubics) - 1)
+        s = v - self.x[piece]
+        cubics = self.cubics[piece]
+        return ((cubics[..., 0] * s + cubics[..., 1]) * s + cubics[..., 2]) * s + cubics[..., 3]
+
+    def integrate(self, a, b):
+        """Integrate the function from *a* to *b*"""
+        coefficients = _hermite_antiderivatives(self.x[None, :], self.cubics[None, :])
+        fits = BdCurveFits(self.x[None, :], coefficients, np.array([len(self.cubics)]))
+        return fits.integrate(0, a, b)
+
+
+def _piecewise_cubic(x, y, derivatives):
+    """Interpolate the points *x*, *y*, where *x* has to be strictly
+    increasing, with hermite cubics with the *derivatives* at the points
+
+    :rtype: :class: `PiecewiseCubic`
+    """
+    x = np.asarray(x, dtype=float)[None, :]
+    y = np.asarray(y, dtype=float)[None, :]
+    if len(x[0]) < 3 or np.any(np.diff(x) <= 0):
+        raise ValueError("x has to contain at least three strictly increasing values")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cubics = _hermite_cubics(x, y, derivatives(x, y))
+    return PiecewiseCubic(x[0], cubics[0])
+
+
+def pchip_cubic(x, y):
+    """Interpolate the points *x*, *y* with piecewise cubic hermite
+    interpolating polynomials, like :func: `scipy.interpolate.pchip`
+
+    :param x: At least three strictly increasing values of the x coordinate
+    :param y: Values of the y coordinate
+
+    :rtype: :class: `PiecewiseCubic`
+    """
+    return _piecewise_cubic(x, y, _pchip_derivatives)
+
+
+def jvet_cubic(x, y):
+    """Interpolate the points *x*, *y* piecewise cubic like the JVET common
+    test conditions do. Like there, *x* and *y* are sorted independently,
+    as rate distortion curves are monotonic.
+
+    :param x: At least three values of the x coordinate
+    :param y: Values of the y coordinate
+
+    :rtype: :class: `PiecewiseCubic`
+    """
+    return _piecewise_cubic(np.sort(x), np.sort(y), _jvet_derivatives)
+
+
+def bdrint(rate, dist, low, high):
+    """Integrate the logarithmic rate over the distortion from *low* to
+    *high*, for any number of points of a rate distortion curve"""
+    return jvet_cubic(dist, np.log10(rate)).integrate(low, high)
 
 
 # function for bjontegaard
@@ -72,9 +216,10 @@ def bdrateStd(rate1, dist1, rate2, dist2):
     return bdrate
 
 
-def bdsnr(rate1, psnr1, rate2, psnr2, interpol, seq, directories, testmode):
+def bdsnr(rate1, psnr1, rate2, psnr2, interpol, seq='', directories=(), plot=None):
     """"
-    take parameters of 2 lines with some configuration and calculate bjontegaard statistics
+    take parameters of 2 lines with some configuration and calculate bjontegaard statistics.
+    If *plot* is given, it is called with *seq*, *directories*, the mode and the plot data.
 
     """
 
@@ -117,19 +262,26 @@ def bdsnr(rate1, psnr1, rate2, psnr2, interpol, seq, directories, testmode):
 
             return out
 
-    elif interpol == 'pchip':
+    elif interpol in ('pchip', 'jvet'):
         pv = lambda p, v: p(v)
+        interpolate = pchip_cubic if interpol == 'pchip' else jvet_cubic
 
-#        pp1 = pchip(x1, y1)
-#        pp2 = pchip(x2, y2)
+        # the rates have to be increasing for the interpolation
+        order1 = np.argsort(x1, kind='stable')
+        order2 = np.argsort(x2, kind='stable')
+        try:
+            pp1 = interpolate(x1[order1], y1[order1])
+            pp2 = interpolate(x2[order2], y2[order2])
+        except ValueError:
+            return np.nan
 
         def find_diff(poly1, poly2, max_int, min_int):
-            # find integrals
-#            int1 = integrate.quad(poly1, min_int, max_int)
-#            int2 = integrate.quad(poly2, min_int, max_int)
+            # find integrals, which are exact for the cubic pieces
+            int1 = poly1.integrate(min_int, max_int)
+            int2 = poly2.integrate(min_int, max_int)
 
             # calculate average difference
-#            out = (int2[0] - int1[0]) / (max_int - min_int)
+            out = (int2 - int1) / (max_int - min_int)
 
             return out
     else:
@@ -150,16 +302,14 @@ def bdsnr(rate1, psnr1, rate2, psnr2, interpol, seq, directories, testmode):
 
     avg_diff = find_diff(pp1, pp2, max_int, min_int)
 
-    if not testmode:
-
-        bd = BDPlotWidget(seq)
-        bd.create_legend(directories)
-        bd.bd_plot_dsnr(p1, p2, xi1, xi2, min_int, max_int, y1min, y1max, y2min, y2max, x1, x2, y1, y2, avg_diff)
+    if plot is not None:
+        plot(seq, directories, 'dsnr', p1, p2, xi1, xi2, min_int, max_int, y1min, y1max, y2min, y2max, x1, x2, y1, y2,
+             avg_diff)
 
     return avg_diff
 
 
-def brate(rate1, psnr1, rate2, psnr2, interpol, seq, directories, testmode):
+def brate(rate1, psnr1, rate2, psnr2, interpol, seq='', directories=(), plot=None):
     # integration interval
     min_int = max([min(psnr1), min(psnr2)])
     max_int = min([max(psnr1), max(psnr2)])
@@ -202,22 +352,23 @@ def brate(rate1, psnr1, rate2, psnr2, interpol, seq, directories, testmode):
 
             return out
 
-    elif interpol == 'pchip':
+    elif interpol in ('pchip', 'jvet'):
         pv = lambda p, v: p(v)
+        interpolate = pchip_cubic if interpol == 'pchip' else jvet_cubic
 
         try:
-            pp1 = pchip(y1, x1)
-            pp2 = pchip(y2, x2)
+            pp1 = interpolate(y1, x1)
+            pp2 = interpolate(y2, x2)
         except ValueError:
             return np.nan
 
         def find_diff(poly1, poly2, max_int, min_int):
-            # find integrals
-            int1 = integrate.quad(poly1, min_int, max_int)
-            int2 = integrate.quad(poly2, min_int, max_int)
+            # find integrals, which are exact for the cubic pieces
+            int1 = poly1.integrate(min_int, max_int)
+            int2 = poly2.integrate(min_int, max_int)
 
             # calculate average difference
-            out = (int2[0] - int1[0]) / (max_int - min_int)
+            out = (int2 - int1) / (max_int - min_int)
 
             return out
     else:
@@ -242,17 +393,35 @@ def brate(rate1, psnr1, rate2, psnr2, interpol, seq, directories, testmode):
     y1max = pv(pp1, max_int)
     y2max = pv(pp2, max_int)
 
-    if not testmode:
-        bd = BDPlotWidget(seq)
-        bd.create_legend(directories)
-        bd.bd_plot_drate(p1, p2, xi1, xi2, min_int, max_int, y1min, y1max, y2min, y2max, rate1, psnr1, rate2, psnr2,
-                         avg_diff)
+    if plot is not None:
+        plot(seq, directories, 'drate', p1, p2, xi1, xi2, min_int, max_int, y1min, y1max, y2min, y2max, rate1, psnr1,
+             rate2, psnr2, avg_diff)
 
     return avg_diff
 
 
 def bjontegaard(curve1, curve2, mode='dsnr', interpol='pol', seq='', d=list(), testmode=False, ci1_mode='average',
-                ci2_mode='average'):
+                ci2_mode='average', plot=None):
+    """
+    Bjontegaard metric calculation, see :func: `_bjontegaard`. The curves
+    are only plotted, if a *plot* function is given and not in *testmode*.
+    Without plotting, the results are cached.
+    """
+    if testmode:
+        plot = None
+    if plot is not None:
+        return _bjontegaard(curve1, curve2, mode, interpol, seq, d, ci1_mode, ci2_mode, plot)
+
+    key = (curve_key(curve1), curve_key(curve2), mode, interpol, ci1_mode, ci2_mode)
+    result = bd_result_cache.get(key)
+    if result is None:
+        result = _bjontegaard(curve1, curve2, mode, interpol, seq, d, ci1_mode, ci2_mode)
+        bd_result_cache[key] = result
+    return result
+
+
+def _bjontegaard(curve1, curve2, mode='dsnr', interpol='pol', seq='', d=list(), ci1_mode='average',
+                 ci2_mode='average', plot=None):
     """
     Bjontegaard metric calculation
     Bjontegaard's metric allows to compute the average gain in PSNR or the
@@ -270,6 +439,8 @@ def bjontegaard(curve1, curve2, mode='dsnr', interpol='pol', seq='', d=list(), t
     interpol:
         'pol'   -   third order polynomial interpolation
         'pchip' -   piecewise cubic interpolation
+        'jvet'  -   piecewise cubic interpolation of the JVET common test
+                    conditions, see :func: `jvet_cubic`
 
 
     python version of code written by (c) 2010 Giuseppe Valenzise
@@ -277,9 +448,9 @@ def bjontegaard(curve1, curve2, mode='dsnr', interpol='pol', seq='', d=list(), t
 
     """
 
-    if interpol not in ['pol', 'pchip']:
-        print("Wrong interpolation type was given. Use 'pol' for polynomial and 'pchip' for piecewise cubic " \
-              "interpolation.")
+    if interpol not in ['pol', 'pchip', 'jvet']:
+        print("Wrong interpolation type was given. Use 'pol' for polynomial, 'pchip' for piecewise cubic or 'jvet' " \
+              "for the piecewise cubic interpolation of the JVET common test conditions.")
         exit(1)
 
     # sort rate
@@ -315,20 +486,267 @@ def bjontegaard(curve1, curve2, mode='dsnr', interpol='pol', seq='', d=list(), t
         rate2 = [math.log(i[0]) for i in curve2]
 
     if mode == 'dsnr':
-        return bdsnr(rate1, psnr1, rate2, psnr2, interpol, seq, d, testmode)
+        return bdsnr(rate1, psnr1, rate2, psnr2, interpol, seq, d, plot)
     elif mode == 'drate':
-        # this branch will never be executed because of line 273
-        if interpol == 'pchip4':
-            rate1 = [i[0] for i in curve1]
-            rate2 = [i[0] for i in curve2]
-            return bdrateStd(rate1, psnr1, rate2, psnr2)
-        else:
-            return brate(rate1, psnr1, rate2, psnr2, interpol, seq, d, testmode)
+        return brate(rate1, psnr1, rate2, psnr2, interpol, seq, d, plot)
     else:
         print("Wrong mode was given. Use either 'dsnr' or 'rate' mode.")
         exit(1)
 
 
+class BdCurveFits:
+    """Curves fitted once for the calculation of many Bjontegaard deltas. The
+    antiderivatives of the fitted curves are stored as piecewise polynomials,
+    stacked into arrays, so the integrals over the overlap intervals of many
+    pairs of curves are evaluated at once, without fitting any curve again.
+
+    Piece *i* of curve *n* is the polynomial *coefficients[n, i]*, highest
+    power first, in the local coordinate *x - breaks[n, i]*. Curves with
+    less pieces are padded, and curves, which could not be fitted, have a
+    nan interval.
+
+    :param breaks: :class: `np.ndarray` of shape (curves, pieces + 1)
+    :param coefficients: :class: `np.ndarray` of shape (curves, pieces, order)
+    :param pieces: :class: `np.ndarray` with the number of pieces per curve
+    """
+
+    def __init__(self, breaks, coefficients, pieces):
+        self.breaks = breaks
+        self.coefficients = coefficients
+        self.pieces = pieces
+
+    @property
+    def lower(self):
+        return self.breaks[:, 0]
+
+    @property
+    def upper(self):
+        return self.breaks[np.arange(len(self.breaks)), self.pieces]
+
+    def antiderivative(self, index, x):
+        """Evaluate the antiderivatives of the curves at *index* at *x*. Both
+        arrays are broadcast against each other."""
+        index, x = np.broadcast_arrays(index, x)
+        breaks = self.breaks[index]
+        # Find the piece containing x, values at the upper end of the
+        # interval are evaluated by the last piece
+        piece = np.sum(breaks[..., 1:-1] <= x[..., None], axis=-1)
+        piece = np.minimum(piece, self.pieces[index] - 1)
+        coefficients = self.coefficients[index, piece]
+        s = x - np.take_along_axis(breaks, piece[..., None], axis=-1)[..., 0]
+
+        # Horner's scheme
+        result = np.zeros(x.shape)
+        for k in range(coefficients.shape[-1]):
+            result = result * s + coefficients[..., k]
+        return result
+
+    def integrate(self, index, lower, upper):
+        """Integrate the curves at *index* from *lower* to *upper*"""
+        return self.antiderivative(index, upper) - self.antiderivative(index, lower)
+
+
+def _curve_coordinates(curve, mode, ci_shift):
+    """Get the coordinates, over which a curve is fitted for the mode, ie.
+    the psnr over the logarithmic rate for 'dsnr', and the logarithmic rate
+    over the psnr for 'drate'. The psnr is shifted by *ci_shift* times the
+    confidence interval, if the curve has one."""
+    curve = np.asarray(curve, dtype=float)
+    rate = np.log(curve[:, 0])
+    psnr = curve[:, 1]
+    if ci_shift and curve.shape[1] > 2:
+        psnr = psnr + ci_shift * curve[:, 2]
+    if mode == 'dsnr':
+        return rate, psnr
+    return psnr, rate
+
+
+def _fit_polynomials(x, y):
+    """Fit third order polynomials to the rows of *x* and *y*, which are
+    stacked curves with the same number of points, in the coordinate
+    *x - x.min()* of each curve. The least squares problems are solved for
+    all curves at once, with scaled columns like :func: `np.polyfit`.
+    Curves with less than four points have many fitting polynomials. Like
+    :func: `np.polyfit`, the one with the least norm in the coordinate *x*
+    is chosen.
+
+    :rtype: :class: `tuple` of the breaks of shape (curves, 2) and the
+        coefficients of the antiderivatives of shape (curves, 1, 5)
+    """
+    lower = x.min(axis=1, keepdims=True)
+    is_underdetermined = x.shape[1] < 4
+    s = x if is_underdetermined else x - lower
+    vandermonde = s[..., None] ** np.arange(3, -1, -1)
+    scale = np.sqrt(np.sum(vandermonde * vandermonde, axis=1, keepdims=True))
+    scale[scale == 0] = 1
+    if is_underdetermined:
+        pseudo_inverse = np.linalg.pinv(vandermonde / scale, rcond=x.shape[1] * np.finfo(float).eps)
+        polynomials = np.matmul(pseudo_inverse, y[..., None])[..., 0] / scale[:, 0, :]
+        # Shift the polynomials to the coordinate x - x.min() by repeated
+        # synthetic division
+        for i in range(3):
+            for j in range(1, 4 - i):
+                polynomials[:, j] += lower[:, 0] * polynomials[:, j - 1]
+    else:
+        q, r = np.linalg.qr(vandermonde / scale)
+        polynomials = np.linalg.solve(r, np.matmul(np.swapaxes(q, 1, 2), y[..., None]))[..., 0] / scale[:, 0, :]
+
+    # Integrate the polynomials
+    coefficients = np.zeros((len(x), 1, 5))
+    coefficients[:, 0, :4] = polynomials / np.arange(4, 0, -1)
+    return np.hstack((lower, x.max(axis=1, keepdims=True))), coefficients
+
+
+def _fit_pchips(x, y):
+    """Fit piecewise cubic hermite interpolating polynomials to the rows of
+    *x* and *y*, which are stacked curves with the same number of points.
+    The derivatives at the points are chosen like
+    :class: `scipy.interpolate.PchipInterpolator` does, and the cubic pieces
+    are integrated analytically. Curves with repeated values of *x* can not
+    be interpolated, and get nan coefficients.
+
+    :rtype: :class: `tuple` of the breaks of shape (curves, points) and the
+        coefficients of the antiderivatives of shape (curves, points - 1, 5)
+    """
+    order = np.argsort(x, axis=1, kind='stable')
+    x = np.take_along_axis(x, order, axis=1)
+    y = np.take_along_axis(y, order, axis=1)
+    return x, _hermite_antiderivatives(x, _hermite_cubics(x, y, _pchip_derivatives(x, y)))
+
+
+def _fit_jvet_cubics(x, y):
+    """Fit the piecewise cubic interpolation of the JVET common test
+    conditions, see :func: `jvet_cubic`, to the rows of *x* and *y*, which
+    are stacked curves with the same number of points.
+
+    :rtype: :class: `tuple` of the breaks of shape (curves, points) and the
+        coefficients of the antiderivatives of shape (curves, points - 1, 5)
+    """
+    x = np.sort(x, axis=1)
+    y = np.sort(y, axis=1)
+    return x, _hermite_antiderivatives(x, _hermite_cubics(x, y, _jvet_derivatives(x, y)))
+
+
+def _hermite_antiderivatives(x, cubics):
+    """Integrate the cubic pieces of hermite interpolations of the rows of
+    *x*, see :func: `_hermite_cubics`. The antiderivative of the piece *i*
+    is y[i] * s + d[i] * s^2 / 2 + c[i] * s^3 / 3 + b[i] * s^4 / 4 plus the
+    integral over the previous pieces. Curves with repeated values of *x*
+    can not be interpolated, and get nan coefficients.
+
+    :rtype: :class: `np.ndarray` of shape (curves, points - 1, 5)
+    """
+    h = np.diff(x, axis=1)
+    (b, c, d, y) = np.moveaxis(cubics, -1, 0)
+    integrals = h * (y + h * (d / 2 + h * (c / 3 + h * b / 4)))
+    constants = np.cumsum(integrals, axis=1) - integrals
+    coefficients = np.stack((b / 4, c / 3, d / 2, y, constants), axis=-1)
+
+    coefficients[np.any(h <= 0, axis=1)] = np.nan
+    return coefficients
+
+
+def fit_bd_curves(curves, mode='dsnr', interpol='pol', ci_shift=0, min_points=4):
+    """Fit each of the *curves* once, for calculating Bjontegaard deltas with
+    :func: `bjontegaard_batch`. Curves with less than *min_points* points,
+    curves with less points than the interpolation needs, ie. three for
+    'pchip' and 'jvet', and curves which are None, are not fitted, and all
+    their deltas are nan. The fits are cached, so equal curves are not
+    fitted again.
+
+    :param curves: :class: `list` of arrays of points (rate, psnr) or
+        (rate, psnr, ci), or None
+    :param mode: 'dsnr' or 'drate', see :func: `bjontegaard`
+    :param interpol: 'pol', 'pchip' or 'jvet', see :func: `bjontegaard`
+    :param ci_shift: Factor of the confidence interval added to the psnr,
+        ie. -1, 0 or 1
+    :param min_points: Minimum number of points of the fitted curves
+
+    :rtype: :class: `BdCurveFits`
+    """
+    if interpol == 'pol':
+        fit = _fit_polynomials
+    elif interpol == 'pchip':
+        fit = _fit_pchips
+        min_points = max(min_points, 3)
+    elif interpol == 'jvet':
+        fit = _fit_jvet_cubics
+        min_points = max(min_points, 3)
+    else:
+        raise ValueError("Wrong interpolation method: %s" % interpol)
+
+    # Look up the fits of the curves in the cache. The missing curves with
+    # the same number of points are fitted together.
+    n = len(curves)
+    fitted = [None] * n
+    keys = {}
+    by_length = {}
+    for (i, curve) in enumerate(curves):
+        if curve is None or len(curve) < max(min_points, 1):
+            continue
+        keys[i] = (curve_key(curve), mode, interpol, ci_shift)
+        fitted[i] = bd_fit_cache.get(keys[i])
+        if fitted[i] is None:
+            by_length.setdefault(len(curve), []).append(i)
+
+    for indexes in by_length.values():
+        coordinates = [_curve_coordinates(curves[i], mode, ci_shift) for i in indexes]
+        x = np.array([xy[0] for xy in coordinates])
+        y = np.array([xy[1] for xy in coordinates])
+        with np.errstate(all='ignore'):
+            (group_breaks, group_coefficients) = fit(x, y)
+        for (j, i) in enumerate(indexes):
+            fitted[i] = (group_breaks[j].copy(), group_coefficients[j].copy())
+            bd_fit_cache[keys[i]] = fitted[i]
+
+    # Stack the fits of the curves with the same number of pieces, padding
+    # the curves with less pieces
+    by_pieces = {}
+    for (i, f) in enumerate(fitted):
+        if f is not None:
+            by_pieces.setdefault(len(f[1]), []).append(i)
+    pieces = np.ones(n, dtype=int)
+    breaks = np.full((n, max(by_pieces, default=1) + 1), np.nan)
+    coefficients = np.zeros((n, breaks.shape[1] - 1, 5))
+    for (count, indexes) in by_pieces.items():
+        pieces[indexes] = count
+        breaks[indexes, :count + 1] = [fitted[i][0] for i in indexes]
+        breaks[indexes, count + 1:] = np.inf
+        coefficients[indexes, :count] = [fitted[i][1] for i in indexes]
+    return BdCurveFits(breaks, coefficients, pieces)
+
+
+def bjontegaard_batch(fits1, index1, fits2, index2, mode='dsnr'):
+    """Calculate the Bjontegaard deltas between many pairs of fitted curves at
+    once. The curves *index1* of *fits1* are the anchors, and the index
+    arrays are broadcast against each other, eg. a column of anchors and a
+    matrix of tested curves gives a matrix of deltas.
+
+    :param fits1: :class: `BdCurveFits` of the anchors
+    :param index1: :class: `np.ndarray` of indexes into *fits1*
+    :param fits2: :class: `BdCurveFits` of the tested curves, fitted with
+        the same mode and interpolation as *fits1*
+    :param index2: :class: `np.ndarray` of indexes into *fits2*
+    :param mode: 'dsnr' or 'drate', see :func: `bjontegaard`
+
+    :rtype: :class: `np.ndarray` of deltas, nan for curves without fit
+    """
+    index1, index2 = np.broadcast_arrays(index1, index2)
+
+    with np.errstate(all='ignore'):
+        # integration interval
+        min_int = np.maximum(fits1.lower[index1], fits2.lower[index2])
+        max_int = np.minimum(fits1.upper[index1], fits2.upper[index2])
+
+        int1 = fits1.integrate(index1, min_int, max_int)
+        int2 = fits2.integrate(index2, min_int, max_int)
+        avg_diff = (int2 - int1) / (max_int - min_int)
+
+    if mode == 'drate':
+        return (np.exp(avg_diff) - 1) * 100
+    return avg_diff
+
+
 # if __name__ == '__main__':
 #     c1 = [(1000, 28.47), (1200, 32.07), (1400, 34.77), (1600, 36.87)]
 #     c2 = [(900, 28.9), (1100, 32.5), (1300, 35.2), (1500, 37.3)]
@@ -0,0 +1,114 @@
+##################################################################################################
+#    This file is part of RDPlot - A gui for creating rd plots based on pyqt and matplotlib
+#    <https://git.rwth-aachen.de/IENT-Software/rd-plot-gui>
+#    Copyright (C) 2017  Institut fuer Nachrichtentechnik, RWTH Aachen University, GERMANY
+#
+#    This program is free software; you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation; either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+##################################################################################################
+from fnmatch import fnmatch
+from os import scandir
+
+
+class FileFilter:
+    """Selects the files of a directory, which are passed to the parsers.
+    Files are rejected by their name and size only, i.e. without reading
+    them. Thereby, large bitstreams and reconstructions next to the logs do
+    not have to be checked by the parsers.
+
+    :param include_patterns: Glob patterns, of which a file name has to match
+        at least one
+    :type include_patterns: :class: `list` of :class: `str`
+
+    :param exclude_patterns: Glob patterns of file and directory names, which
+        are skipped
+    :type exclude_patterns: :class: `list` of :class: `str`
+
+    :param max_depth: Maximal depth of sub directories, which are searched.
+        0 only searches the directory itself, None searches all sub directories
+    :type max_depth: :class: `int` or None
+
+    :param max_file_size: Maximal size of a file in bytes, or None
+    :type max_file_size: :class: `int` or None
+    """
+
+    # Raw video data and bitstreams, which are typically stored next to the logs
+    default_exclude_patterns = ['*.yuv', '*.rgb', '*.raw', '*.bin', '*.bit', '*.str', '*.hevc', '*.h265', '*.264',
+                                '*.h264', '*.266', '*.vvc', '*.mp4', '*.mkv']
+
+    def __init__(self, include_patterns=None, exclude_patterns=None, max_depth=0, max_file_size=None):
+        self.include_patterns = ['*'] if include_patterns is None else list(include_patterns)
+        self.exclude_patterns = (list(self.default_exclude_patterns) if exclude_patterns is None
+                                 else list(exclude_patterns))
+        self.max_depth = max_depth
+        self.max_file_size = max_file_size
+
+    def is_name_excluded(self, name):
+        return any(fnmatch(name, pattern) for pattern in self.exclude_patterns)
+
+    def is_name_included(self, name):
+        return (any(fnmatch(name, pattern) for pattern in self.include_patterns)
+                and not self.is_name_excluded(name))
+
+    def is_member_accepted(self, member_name, size):
+        """Check, if the member of an archive with the name *member_name* and
+        *size* bytes is accepted. Members are checked like the files of
+        directories, but regardless of their depth, as archives typically
+        contain a whole tree of results.
+
+        :rtype: :class: `bool`
+        """
+        *directory_names, file_name = member_name.split('/')
+        if any(self.is_name_excluded(directory_name) for directory_name in directory_names):
+            return False
+        if self.max_file_size is not None and size > self.max_file_size:
+            return False
+        return self.is_name_included(file_name)
+
+    def iter_file_paths(self, directory_path):
+        """Generator of the paths of all accepted files in the directory at
+        *directory_path* and its sub directories up to *max_depth*. The files
+        of a directory are generated in the order of their names, before the
+        ones of its sub directories. Symbolic links to directories are not
+        followed, to avoid cycles.
+
+        :rtype: generator of :class: `str`
+        """
+        directories = [(directory_path, 0)]
+        while directories:
+            path, depth = directories.pop()
+            try:
+                with scandir(path) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            sub_directories = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if ((self.max_depth is None or depth < self.max_depth)
+                                and not self.is_name_excluded(entry.name)):
+                            sub_directories.append((entry.path, depth + 1))
+                        continue
+                    if not entry.is_file() or not self.is_name_included(entry.name):
+                        continue
+                    if self.max_file_size is not None and entry.stat().st_size > self.max_file_size:
+                        continue
+                except OSError:
+                    continue
+                yield entry.path
+
+            # directories is used as a stack, thus push in reverse order
+            directories.extend(reversed(sub_directories))
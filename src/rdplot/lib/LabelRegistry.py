@@ -0,0 +1,110 @@
+##################################################################################################
+#    This file is part of RDPlot - A gui for creating rd plots based on pyqt and matplotlib
+#    <https://git.rwth-aachen.de/IENT-Software/rd-plot-gui>
+#    Copyright (C) 2017  Institut fuer Nachrichtentechnik, RWTH Aachen University, GERMANY
+#
+#    This program is free software; you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation; either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+##################################################################################################
+from types import MappingProxyType
+
+
+class _LabelNode:
+    """Node of the tree of a :class: `LabelRegistry`"""
+    __slots__ = ('children', 'default')
+
+    def __init__(self, children, default):
+        self.children = children
+        self.default = default
+
+
+class LabelRegistry:
+    """Immutable lookup of the axis labels of the variables of a simulation
+    data item class. Labels are resolved once per variable path, and are taken
+    from a cache afterwards.
+
+    The labels are given as a tree of nested dicts, which is keyed by the keys
+    of the variable paths. The leaves are tuples of x- and y-axis label. For
+    keys, which are not in a :class: `collections.defaultdict` node, the
+    default of the node is used. Nodes may be shared and may refer to their
+    parents, e.g. layers, which are labeled like their parent. The tree is
+    copied, thus, changing it afterwards has no effect.
+
+    :param labels: Tree of labels
+    :type labels: :class: `dict`
+
+    :param default_function: Optional function, which computes the label for
+        a path from its keys, if the path is not found in *labels*
+    :type default_function: :class: `function`
+    """
+
+    def __init__(self, labels=None, default_function=None):
+        self._root = self._freeze(labels if labels is not None else {}, {})
+        self._default_function = default_function
+        # resolved labels by tuple of keys
+        self._cache = {}
+
+    @classmethod
+    def _freeze(cls, node, frozen_nodes):
+        # keep shared and recursive nodes
+        if id(node) in frozen_nodes:
+            return frozen_nodes[id(node)]
+
+        default_factory = getattr(node, 'default_factory', None)
+        children = {}
+        frozen_node = _LabelNode(MappingProxyType(children), default_factory() if default_factory else None)
+        frozen_nodes[id(node)] = frozen_node
+        for key, value in node.items():
+            children[key] = cls._freeze(value, frozen_nodes) if isinstance(value, dict) else value
+        return frozen_node
+
+    def get_label(self, keys):
+        """Get the label of the variable at the path given by *keys*.
+
+        :param keys: Variable/Path for which to get the labels
+        :type keys: :class: `list` of :class: `str`
+
+        :return: tuple of labels: (x-axis label, y-axis label), or None if the
+            path ends at an inner node
+        :raises KeyError: if the path is not known and there is no default
+        """
+        keys = tuple(keys)
+        try:
+            return self._cache[keys]
+        except KeyError:
+            pass
+
+        label = self._resolve(keys)
+        self._cache[keys] = label
+        return label
+
+    def _resolve(self, keys):
+        node = self._root
+        for key in keys:
+            if key in node.children:
+                entry = node.children[key]
+            elif node.default is not None:
+                entry = node.default
+            elif self._default_function is not None:
+                return self._default_function(keys)
+            else:
+                raise KeyError(key)
+
+            if not isinstance(entry, _LabelNode):
+                return entry
+            node = entry
+
+        if self._default_function is not None:
+            return self._default_function(keys)
+        return None
@@ -0,0 +1,176 @@
+##################################################################################################
+#    This file is part of RDPlot - A gui for creating rd plots based on pyqt and matplotlib
+#    <https://git.rwth-aachen.de/IENT-Software/rd-plot-gui>
+#    Copyright (C) 2017  Institut fuer Nachrichtentechnik, RWTH Aachen University, GERMANY
+#
+#    This program is free software; you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation; either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+##################################################################################################
+import pickle
+import sqlite3
+import time
+from os import makedirs
+from os.path import abspath, dirname
+from threading import Lock
+
+from rdplot.SimulationDataItem import stat_file
+
+
+class ParseCache:
+    """Persistent cache of parsed simulation data items, stored in an SQLite
+    database. The items parsed from a file are stored together with the
+    absolute path, the modification time and the size of the file, and the
+    *parser_version* of the parser class. An entry is only used, if all of
+    them are unchanged.
+
+    If the stored items exceed *max_size* bytes, the least recently used
+    entries are evicted.
+
+    :param database_path: Path of the SQLite database file
+    :type database_path: :class: `str`
+
+    :param max_size: Maximal size of the stored items in bytes
+    :type max_size: :class: `int`
+    """
+
+    # Number of changes after which the database is committed
+    commit_interval = 100
+
+    def __init__(self, database_path, max_size=512 * 1024 ** 2):
+        self.max_size = max_size
+
+        makedirs(dirname(abspath(database_path)), exist_ok=True)
+        # the cache is created in the gui thread, but used in the parser thread
+        self._connection = sqlite3.connect(database_path, timeout=10, check_same_thread=False)
+        self._lock = Lock()
+        self._uncommitted_count = 0
+
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    path TEXT PRIMARY KEY,
+                    mtime INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    parser_version INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    data_size INTEGER NOT NULL,
+                    data BLOB NOT NULL
+                )""")
+            self._connection.execute('CREATE INDEX IF NOT EXISTS items_last_access ON items (last_access)')
+            self._connection.commit()
+            self._total_size = self._connection.execute('SELECT COALESCE(SUM(data_size), 0) FROM items').fetchone()[0]
+
+    @staticmethod
+    def _get_file_key(path):
+        path = abspath(path)
+        # members of archives are stored with the modification time and size of
+        # their archive
+        file_stat = stat_file(path)
+        return path, file_stat.st_mtime_ns, file_stat.st_size
+
+    def get(self, path):
+        """Get the items parsed from the file at *path*
+
+        :rtype: :class: `list` of simulation data items, or None if there are no
+            valid items in the cache
+        """
+        try:
+            path, mtime, size = self._get_file_key(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT parser_version, data FROM items WHERE path=? AND mtime=? AND size=?',
+                (path, mtime, size)).fetchone()
+            if row is None:
+                return None
+            parser_version, data = row
+
+            try:
+                item_list = pickle.loads(data)
+            except Exception:
+                # e.g. the parser class was renamed or removed
+                item_list = []
+            # the items have to be parsed again, if the parser changed
+            if not item_list or any(getattr(type(item), 'parser_version', None) != parser_version
+                                    for item in item_list):
+                self._delete(path)
+                return None
+
+            self._connection.execute('UPDATE items SET last_access=? WHERE path=?', (time.time(), path))
+            self._count_change()
+        return item_list
+
+    def put(self, path, item_list):
+        """Store the *item_list* parsed from the file at *path*. Note, that all
+        items have to be created by the same parser class.
+        """
+        if not item_list:
+            return
+        try:
+            path, mtime, size = self._get_file_key(path)
+        except OSError:
+            return
+        parser_version = getattr(type(item_list[0]), 'parser_version', 0)
+        data = pickle.dumps(item_list, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+
+        with self._lock:
+            self._delete(path)
+            self._connection.execute(
+                'INSERT INTO items (path, mtime, size, parser_version, last_access, data_size, data)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (path, mtime, size, parser_version, time.time(), len(data), data))
+            self._total_size += len(data)
+            self._evict()
+            self._count_change()
+
+    def flush(self):
+        """Write all changes to the database file"""
+        with self._lock:
+            self._connection.commit()
+            self._uncommitted_count = 0
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def _delete(self, path):
+        row = self._connection.execute('SELECT data_size FROM items WHERE path=?', (path,)).fetchone()
+        if row is not None:
+            self._connection.execute('DELETE FROM items WHERE path=?', (path,))
+            self._total_size -= row[0]
+
+    def _evict(self):
+        """Remove the least recently used entries, until the cache is not
+        larger than its maximal size"""
+        while self._total_size > self.max_size:
+            rows = self._connection.execute(
+                'SELECT path, data_size FROM items ORDER BY last_access LIMIT 100').fetchall()
+            if not rows:
+                break
+            for path, data_size in rows:
+                self._connection.execute('DELETE FROM items WHERE path=?', (path,))
+                self._total_size -= data_size
+                if self._total_size <= self.max_size:
+                    break
+
+    def _count_change(self):
+        self._uncommitted_count += 1
+        if self._uncommitted_count >= self.commit_interval:
+            self._connection.commit()
+            self._uncommitted_count = 0
@@ -17,7 +17,9 @@
 #    along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 ##################################################################################################
+from bisect import bisect_left, bisect_right
 from collections import deque
+from functools import cmp_to_key
 from os.path import sep
 import numpy as np
 from PyQt5 import QtWidgets, QtCore
@@ -28,8 +30,10 @@ from PyQt5.QtCore import QAbstractListModel, QAbstractItemModel, QAbstractTableM
 from PyQt5.QtGui import QBrush
 
 import matplotlib.pyplot as plt
+from rdplot.SimulationDataItem import PlotData, iter_sim_data_item_values
 from rdplot.SimulationDataItemClasses.EncoderLogs import AbstractEncLog
-from rdplot.lib.BD import bjontegaard
+from rdplot.lib.BD import bjontegaard, bjontegaard_batch, fit_bd_curves
+from rdplot.Widgets.PlotWidget import plot_bd
 from string import Template
 from tabulate import tabulate
 import pkg_resources
@@ -43,6 +47,10 @@ def compare_strings_case_insensitive(first, second):
     return first.casefold() > second.casefold()
 
 
+def _identity(value):
+    return value
+
+
 # -------------------------------------------------------------------------------
 
 
@@ -61,12 +69,76 @@ class AmbiguousSimDataItems(ModelError):
     pass
 
 
+class LogConfigTable:
+    """Table of the log configs of sim data items, which is used to find the
+    parameters, whose values differ between the items. As most parameters are
+    equal for all items, the log config of the first item is kept as reference,
+    and only the parameters of an item, which deviate from the reference, are
+    counted by value. The deviating parameters are found by the symmetric
+    difference of the items of the log configs, which does not require a loop
+    over all parameters in python. Thus, log configs can be added
+    incrementally, and the varying parameters are found without comparing the
+    log configs of the items with each other.
+    """
+
+    def __init__(self):
+        self.item_count = 0
+        self._reference = None
+        # Number of items by (parameter, value) pairs deviating from the
+        # reference, either in the items or in the reference
+        self._deviation_counts = {}
+
+    def add(self, log_config):
+        """Add the *log_config* of an item to the table
+
+        :param log_config: :class: `dict` of parameters and their values
+        """
+        self.item_count += 1
+        if self._reference is None:
+            self._reference = dict(log_config)
+            return
+        for pair in log_config.items() ^ self._reference.items():
+            self._deviation_counts[pair] = self._deviation_counts.get(pair, 0) + 1
+
+    def get_varying_parameters(self, value_filter=()):
+        """Get the parameters, which do not have the same value for all items,
+        together with their distinct values. A parameter is also varying, if it
+        is missing in the log config of some items.
+
+        :param value_filter: Values containing one of these strings are ignored,
+            and parameters without other values are omitted
+        :type value_filter: :class: `list` of :class: `str`
+
+        :rtype: :class: `dict` of parameters and :class: `list`s of values
+        """
+        # A parameter is varying, if one of its pairs deviates from the
+        # reference. Its values are the value in the reference, if any, and
+        # the deviating values of the items.
+        varying_parameters = {}
+        for (parameter, value) in self._deviation_counts:
+            if parameter not in varying_parameters:
+                varying_parameters[parameter] = []
+                if parameter in self._reference:
+                    varying_parameters[parameter].append(self._reference[parameter])
+            if value not in varying_parameters[parameter]:
+                varying_parameters[parameter].append(value)
+        for (parameter, values) in varying_parameters.items():
+            varying_parameters[parameter] = [value for value in values
+                                             if all(x not in value for x in value_filter)]
+        return {parameter: values for (parameter, values) in varying_parameters.items() if values}
+
+
 # noinspection PyMethodOverriding
 class OrderedDictModel(QAbstractListModel):
     """Subclass of :class: `QAbstractListModel` implementing an
     :class: `OrderedDict`, whose keys are also the items of the qt list. If
     used with a :class: `QListView`, the keys are displayed.
 
+    The items are stored in a :class: `dict`, and the keys additionally in a
+    sorted list, in which the position of a key is found by bisection. Thus,
+    looking up items and rows, and inserting keys only require logarithmic
+    time in the number of keys.
+
     :param *args:    All args forwarded to parent class
     :param **kwargs: All keyword args forwarded to parent class
 
@@ -74,7 +146,8 @@ class OrderedDictModel(QAbstractListModel):
     keys/items. If used with the methods :func: `update_from_tuples`, :func:
     `clear_and_update_from_tuples` or :func: `remove_keys` it is especially
     efficient, as it allows updating the model with a collection of
-    keys/items, but emitting the *items_changed* signal only once.
+    keys/items, but emitting the *items_changed* signal only once. Also the
+    views are only notified once per collection.
     """
 
     items_changed = pyqtSignal()
@@ -82,14 +155,27 @@ class OrderedDictModel(QAbstractListModel):
     def __init__(self, *args, compare_keys_function=None, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Function to compare keys. This function defines the order of the keys
+        # Function to compare keys. This function defines the order of the keys.
+        # The keys are sorted using a sort key derived from the function. Keys
+        # are compared directly by default, which is much faster.
         if compare_keys_function is None:
             def compare_keys_function(first, second):
                 return first > second
+            self._get_sort_key = _identity
+        else:
+            def compare(first, second):
+                if compare_keys_function(first, second):
+                    return 1
+                if compare_keys_function(second, first):
+                    return -1
+                return 0
+            self._get_sort_key = cmp_to_key(compare)
         self._compare_keys_function = compare_keys_function
 
+        # Sorted keys, their sort keys for bisection, and items by key
         self._keys = []
-        self._items = []
+        self._sort_keys = []
+        self._items = {}
 
     # Qt interface methods
 
@@ -98,9 +184,9 @@ class OrderedDictModel(QAbstractListModel):
 
     def data(self, q_index, role):
         if q_index.isValid() and role == Qt.DisplayRole:
-            for index, (key, item) in enumerate(self.items()):
-                if index == q_index.row():
-                    return QVariant(key)
+            row = q_index.row()
+            if 0 <= row < len(self._keys):
+                return QVariant(self._keys[row])
         return QVariant()
 
     # Reimplemented dictionary methods.
@@ -108,10 +194,10 @@ class OrderedDictModel(QAbstractListModel):
     # custom methods, so that *items_changed* is emitted correctly.
 
     def __getitem__(self, key):
-        return self._items[self._keys.index(key)]
+        return self._items[key]
 
     def __setitem__(self, key, item):
-        self.update((key, item))
+        self.update_from_tuples([(key, item)])
 
     def pop(self, key):
         item = self[key]
@@ -122,7 +208,7 @@ class OrderedDictModel(QAbstractListModel):
         return iter(self._keys)
 
     def __contains__(self, key):
-        return key in self._keys
+        return key in self._items
 
     def __len__(self):
         return len(self._keys)
@@ -134,44 +220,85 @@ class OrderedDictModel(QAbstractListModel):
         return str(self)
 
     def values(self):
-        return list(self._items)
+        return [self._items[key] for key in self._keys]
 
     def items(self):
-        return list(zip(self._keys, self._items))
+        return [(key, self._items[key]) for key in self._keys]
 
     # Implement specific methods
     # Note, that these methods allow update of whole ranges of data and emit
     # the *items_changed* signal afterwards. This allows more efficient update
     # behavior.
 
+    def get_row(self, key):
+        """Get the row of *key* in the list.
+
+        :param key: Key present in the dictionary
+
+        :rtype: :class: `int`
+        """
+
+        if key not in self._items:
+            raise KeyError(key)
+
+        # Keys can be equal with respect to the compare function, without being
+        # equal themselves, so the equal range is searched for the key
+        row = bisect_left(self._sort_keys, self._get_sort_key(key))
+        while self._keys[row] != key:
+            row += 1
+        return row
+
     def update_from_tuples(self, tuples):
         """Add/replace items to the dictionary specified in the iterable :param:
         *tuples* of (key, item) pairs. Emit *items_changed* afterwards.
         """
 
+        # Items of present keys are just replaced, as the displayed keys do not
+        # change
+        new_items = {}
         for key, item in tuples:
-            # If the key is already present, just update its item and continue
-            if key in self:
-                self._items[self._keys.index(key)] = item
-                continue
+            if key in self._items:
+                self._items[key] = item
+            else:
+                new_items[key] = item
 
-            # Else search the insertion position by comparision
-            index_insert = len(self)
-            for index, key_other in enumerate(self):
-                # If the key is bigger, then insert key/item here
-                if self._compare_keys_function(key_other, key):
-                    index_insert = index
-                    break
-
-            # Call Qt interface functions and add/replace item corresponding
-            # to key
-            self.beginInsertRows(QModelIndex(), index_insert, index_insert + 1)
-            self._keys.insert(index_insert, key)
-            self._items.insert(index_insert, item)
-            self.endInsertRows()
+        if len(new_items) > 0:
+            self._insert_keys(new_items)
 
         self.items_changed.emit()
 
+    def _insert_keys(self, new_items):
+        """Insert the keys of the dictionary *new_items*, which are not present
+        yet, and their items. If all keys are inserted at the same position,
+        e.g. if a single key is inserted, the insertion is reported to the
+        views. Otherwise, the keys are merged and the model is reset.
+
+        :param new_items: :class: `dict` of new keys and their items
+        """
+
+        new_keys = sorted(new_items, key=self._get_sort_key)
+        new_sort_keys = [self._get_sort_key(key) for key in new_keys]
+
+        # New keys are inserted after equal keys
+        row_first = bisect_right(self._sort_keys, new_sort_keys[0])
+        row_last = bisect_right(self._sort_keys, new_sort_keys[-1])
+
+        if row_first == row_last:
+            self.beginInsertRows(QModelIndex(), row_first, row_first + len(new_keys) - 1)
+            self._keys[row_first:row_first] = new_keys
+            self._sort_keys[row_first:row_first] = new_sort_keys
+            self._items.update(new_items)
+            self.endInsertRows()
+            return
+
+        # Note, that sorting the concatenation of the sorted lists merges them
+        # in linear time
+        self.beginResetModel()
+        self._keys = sorted(self._keys + new_keys, key=self._get_sort_key)
+        self._sort_keys = [self._get_sort_key(key) for key in self._keys]
+        self._items.update(new_items)
+        self.endResetModel()
+
     def clear_and_update_from_tuples(self, tuples):
         """Clear the dictionary and update it the (key, item) pairs specified
         in *tuples*. Emit *items_changed* afterwards.
@@ -179,36 +306,42 @@ class OrderedDictModel(QAbstractListModel):
         :param tuples: Iterable of tuples of (key, item) which are added
             to the dictionary."""
 
-        # Call Qt interface functions and remove all keys and corresponding
-        # items from the dictionary
-        self.beginRemoveRows(QModelIndex(), 0, len(self) - 1)
-        self._keys.clear()
-        self._items.clear()
-        self.endRemoveRows()
+        # Replace all keys and items at once and reset the views
+        self.beginResetModel()
+        self._items = dict(tuples)
+        self._keys = sorted(self._items, key=self._get_sort_key)
+        self._sort_keys = [self._get_sort_key(key) for key in self._keys]
+        self.endResetModel()
 
-        # Update it with (key, item) pairs specified by *tuples*. The update
-        # method emits *items_changed*.
-        self.update_from_tuples(tuples)
+        self.items_changed.emit()
 
     def remove_keys(self, keys):
         """Remove all keys and corresponding items specified in iterable
-        from dictionary. Emit *items_changed* afterwards.
+        from dictionary. Emit *items_changed* afterwards. Keys, which are not
+        present, are ignored.
 
         :param keys: *keys* which are removed from dictionary together with
             the corresponding items
         """
 
-        # Iterate to find index corresponding to key in ordered dict
-        for key in keys:
-            for index, key_other in enumerate(self):
-                if key_other == key:
-                    break
+        rows = sorted({self.get_row(key) for key in keys if key in self._items})
 
-            # Call Qt interface functions and remove key and corresponding item
-            self.beginRemoveRows(QModelIndex(), index, index + 1)
-            self._keys.pop(index)
-            self._items.pop(index)
+        # If the rows are contiguous, the removal is reported to the views,
+        # otherwise the views are reset
+        if len(rows) > 0 and rows[-1] - rows[0] + 1 == len(rows):
+            self.beginRemoveRows(QModelIndex(), rows[0], rows[-1])
+            for key in self._keys[rows[0]:rows[-1] + 1]:
+                del self._items[key]
+            del self._keys[rows[0]:rows[-1] + 1]
+            del self._sort_keys[rows[0]:rows[-1] + 1]
             self.endRemoveRows()
+        elif len(rows) > 0:
+            self.beginResetModel()
+            for row in rows:
+                del self._items[self._keys[row]]
+            self._keys = [key for key in self._keys if key in self._items]
+            self._sort_keys = [self._get_sort_key(key) for key in self._keys]
+            self.endResetModel()
 
         self.items_changed.emit()
 
@@ -242,6 +375,10 @@ class OrderedDictTreeItem(QObject):
 
     The *values* property corresponds to some set of data.
 
+    The children are indexed by their identifiers, and the position of a new
+    child is found by bisection. The rows of the children are cached, and only
+    recomputed, if a cached row turns out to be outdated.
+
     :param identifier: Unique/hashable identifier of the item. The item is
         referenced from the parent item by using this identifier.
     :param parent: Parent item
@@ -256,10 +393,17 @@ class OrderedDictTreeItem(QObject):
         super().__init__()
         self._identifier = identifier
         self._parent = parent
+        # Cached row of the item relative to its parent
+        self._row = 0
 
+        # Ordered children, their sort keys for bisection, and children by
+        # identifier
         self._children = []
-        if children is not None:
-            self.extend(children)
+        self._sort_keys = []
+        self._children_by_identifier = {}
+        # Parts of the identifiers of the children, which are displayed, see
+        # :func: `get_unique_identifier_parts`
+        self._unique_identifier_parts = None
 
         self.values = set() if values is None else values
 
@@ -268,6 +412,17 @@ class OrderedDictTreeItem(QObject):
                 return first > second
         self._compare_identifiers_function = compare_identifiers_function
 
+        def compare(first, second):
+            if compare_identifiers_function(first, second):
+                return 1
+            if compare_identifiers_function(second, first):
+                return -1
+            return 0
+        self._get_sort_key = cmp_to_key(compare)
+
+        if children is not None:
+            self._update(children)
+
     # Properties for private attributes
 
     @property
@@ -283,6 +438,54 @@ class OrderedDictTreeItem(QObject):
         # Copy the list of children
         return list(self._children)
 
+    @property
+    def row(self):
+        """Position of the item among the children of its parent"""
+        # The cached row is outdated, if children were inserted or removed
+        # before the item. Then, the rows of all children are updated.
+        if self._parent is not None:
+            siblings = self._parent._children
+            if self._row >= len(siblings) or siblings[self._row] is not self:
+                self._parent._update_rows()
+        return self._row
+
+    def child(self, row):
+        """Get the child at *row* without copying the list of children"""
+        return self._children[row]
+
+    def get_insertion_row(self, identifier):
+        """Get the row, at which a child with *identifier* is inserted by
+        :func: `_add`.
+
+        :rtype: :class: `int`
+        """
+
+        if identifier in self._children_by_identifier:
+            return self._children_by_identifier[identifier].row
+        # Children are inserted after children with equal identifiers
+        return bisect_right(self._sort_keys, self._get_sort_key(identifier))
+
+    def get_unique_identifier_parts(self):
+        """Get the parts of the identifiers of the children, which are
+        not shared by all children, joined with spaces. The identifiers are
+        split at path separators. The result is cached until the children
+        change.
+
+        :rtype: :class: `list` of :class: `str` in the order of the children
+        """
+
+        if self._unique_identifier_parts is None:
+            identifier_parts = [child.identifier.split(sep) for child in self._children]
+            # Parts, which are contained by the identifiers of all children
+            common_parts = set(identifier_parts[0]) if identifier_parts else set()
+            for parts in identifier_parts[1:]:
+                common_parts.intersection_update(parts)
+            self._unique_identifier_parts = [
+                " ".join(part for part in parts if part not in common_parts)
+                for parts in identifier_parts
+            ]
+        return self._unique_identifier_parts
+
     # Special functions/properties
 
     @property
@@ -299,7 +502,7 @@ class OrderedDictTreeItem(QObject):
         while len(items) != 0:
             item = items.pop()
 
-            items.extend(item.children)
+            items.extend(item._children)
             if len(item) == 0:
                 leafs.append(item)
 
@@ -339,38 +542,56 @@ class OrderedDictTreeItem(QObject):
 
     def _add(self, child):
         child._parent = self
+        self._unique_identifier_parts = None
+
+        # If child is already present overwrite it
+        present_child = self._children_by_identifier.get(child.identifier)
+        if present_child is not None:
+            row = present_child.row
+            present_child._parent = None
+            self._children[row] = child
+            self._children_by_identifier[child.identifier] = child
+            child._row = row
+            return
 
-        # Find the insertion index of the child, and do insertion.
-        for index, identifier in enumerate(self):
-            # If child is already present overwrite it
-            if identifier == child.identifier:
-                self._children[index] = child
-                return
-            # If the identifier is bigger than the current one, and thus,
-            # all identifiers before, do insertion here
-            if self._compare_identifiers_function(identifier, child.identifier):
-                self._children.insert(index, child)
-                return
-
-        # If no position has been found, just append the element
-        self._children.append(child)
+        # Insert the child after all children with smaller or equal
+        # identifiers
+        sort_key = self._get_sort_key(child.identifier)
+        row = bisect_right(self._sort_keys, sort_key)
+        self._children.insert(row, child)
+        self._sort_keys.insert(row, sort_key)
+        self._children_by_identifier[child.identifier] = child
+        child._row = row
 
     def _update(self, children):
         for child in children:
-            self.add(child)
+            self._add(child)
 
     def _remove(self, child):
-        child._parent = None
-        self._children.remove(child)
+        row = child.row
+        self._remove_rows(row, row)
+
+    def _remove_rows(self, first, last):
+        """Remove the children from row *first* to row *last*, inclusively"""
+        for child in self._children[first:last + 1]:
+            child._parent = None
+            del self._children_by_identifier[child.identifier]
+        del self._children[first:last + 1]
+        del self._sort_keys[first:last + 1]
+        self._unique_identifier_parts = None
+
+    def _update_rows(self):
+        for (row, child) in enumerate(self._children):
+            child._row = row
 
     # Reimplemented some dictionary functions
 
     def __getitem__(self, identifier):
         """Get child by *identifier*"""
 
-        for child in self._children:
-            if child.identifier == identifier:
-                return child
+        child = self._children_by_identifier.get(identifier)
+        if child is not None:
+            return child
 
         raise KeyError("Key {key} not found in item {item}".format(
             key=identifier,
@@ -386,12 +607,9 @@ class OrderedDictTreeItem(QObject):
         for child in self._children:
             yield child.identifier
 
-    def __contains(self, identifier):
+    def __contains__(self, identifier):
         """Check for identifier ie. key in *children*"""
-        for identifier_child in self:
-            if identifier_child == identifier:
-                return True
-        return False
+        return identifier in self._children_by_identifier
 
     def __str__(self):
         return str(self.identifier)
@@ -403,6 +621,10 @@ class OrderedDictTreeItem(QObject):
 
 # noinspection PyMethodOverriding
 class OrderedDictTreeModel(QAbstractItemModel):
+    # Number of ranges of removed rows, above which the model is reset instead
+    # of notifying the views about each range, see :func: `remove_items`
+    remove_reset_threshold = 256
+
     def __init__(self, *args, default_item_values=None, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -429,16 +651,15 @@ class OrderedDictTreeModel(QAbstractItemModel):
         if not self.hasIndex(row, column, q_parent_index):
             return QModelIndex()
         if q_parent_index.isValid():
-            item = q_parent_index.internalPointer().children[row]
+            item = q_parent_index.internalPointer().child(row)
             return self.createIndex(row, 0, item)
-        return self.createIndex(row, column, self.root.children[row])
+        return self.createIndex(row, column, self.root.child(row))
 
     def parent(self, q_parent_index):
         if q_parent_index.isValid():
             parent = q_parent_index.internalPointer().parent
             if parent != self.root:
-                row = parent.parent.children.index(parent)
-                return self.createIndex(row, 0, parent)
+                return self.createIndex(parent.row, 0, parent)
         return QModelIndex()
 
     def rowCount(self, q_parent_index):
@@ -455,16 +676,9 @@ class OrderedDictTreeModel(QAbstractItemModel):
     def data(self, q_parent_index=QModelIndex(), q_role=Qt.DisplayRole):
         if q_parent_index.isValid():
             if q_role == Qt.DisplayRole:
-                siblings = q_parent_index.internalPointer().parent.children
-                if len(siblings) > 1:
-                    sibling_identifiers = []
-                    sibling_identifiers += [sibling.identifier.split(sep) for sibling in siblings]
-                    unique_part = []
-                    for c in sibling_identifiers:
-                        result = list(filter(lambda x: all(x in l for l in sibling_identifiers) == False, c))
-                        unique_part.append(" ".join(result))
-
-                    return unique_part[q_parent_index.row()]
+                parent = q_parent_index.internalPointer().parent
+                if len(parent) > 1:
+                    return parent.get_unique_identifier_parts()[q_parent_index.row()]
                 else:
                     path = str(q_parent_index.internalPointer())
                     return path
@@ -514,12 +728,7 @@ class OrderedDictTreeModel(QAbstractItemModel):
         # Callback, which is used to create items not already present at the
         # *path*
         def create_item(key, item_parent, q_index_parent):
-            # Always add as last child
-            row = len(item_parent)
-            for index, identifier in enumerate(item_parent):
-                if compare_strings_case_insensitive(key, identifier):
-                    row = index
-                    break
+            row = item_parent.get_insertion_row(key)
             # Call Qt update functions
             self.beginInsertRows(q_index_parent, row, row)
             item = OrderedDictTreeItem(
@@ -593,38 +802,19 @@ class OrderedDictTreeModel(QAbstractItemModel):
 
     def _get_index_parent_from_item(self, item):
         """Get the :class: `QModelIndex` *q_parent_index* of the parent item of
-        *item*. Note, that the tree has to walked up and down again
-        to find the index, so performance depends on the depth of the tree.
+        *item*.
 
         :param item: The parent index of this item is found.
 
         :rtype: :class: `QModelIndex*
         """
 
-        # Return invalid index if *item* is the root item
-        if item.parent is None:
+        # Return invalid index if *item* or its parent is the root item
+        if item.parent is None or item.parent.parent is None:
             return QModelIndex()
 
-        # Walk the tree up the chain of parent items until the root item
-        # to find the *path*
-        path_queue = deque()
-        other = item.parent
-        while True:
-            path_queue.appendleft(other)
-            # Break if *other* is the root item
-            if other.parent is None:
-                break
-            other = other.parent
-        path = list(path_queue)
-
-        # Walk the path down again to the *item* and create
-        # QModelIndex along the way.
-        q_index_parent = QModelIndex()
-        for (parent, item) in zip(path[:-1], path[1:]):
-            row = parent.children.index(item)
-            q_index_parent = self.index(row, 0, q_index_parent)
-
-        return q_index_parent
+        # The row of the parent is cached by the parent item itself
+        return self.createIndex(item.parent.row, 0, item.parent)
 
     def _get_index_from_item(self, item):
         """Get the :class: `QModelIndex` corresponding to a given *item*.
@@ -638,17 +828,7 @@ class OrderedDictTreeModel(QAbstractItemModel):
         if item.parent is None:
             return QModelIndex()
 
-        q_index_parent = self._get_index_parent_from_item(item)
-
-        # If the **parent** item is not the root item, create the index
-        # corresponding to *item* and return it.
-        if q_index_parent.isValid():
-            row = q_index_parent.internalPointer().children.index(item)
-            return self.index(row, 0, q_index_parent)
-
-        # If the **parent** item is the root item, create index and return it.
-        row = self.root.children.index(item)
-        return self.index(row, 0, QModelIndex())
+        return self.createIndex(item.row, 0, item)
 
     def _get_row_from_item_and_index_parent(self, item, q_index_parent):
         """Get the row of an *item* in reference to its parent at
@@ -660,62 +840,122 @@ class OrderedDictTreeModel(QAbstractItemModel):
         :rtype: :class: `Int`
         """
 
-        if q_index_parent.isValid():
-            return q_index_parent.internalPointer().children.index(item)
-        # If the *q_index_parent* is invalid, default to root being
-        # parent
-        return self.root.children.index(item)
+        return item.row
 
     def remove_item(self, item, q_index_parent=None):
-        """Remove *item* from the tree. Additionally to the item itself, all sub
-        items are removed. Also, all items above *item* in the tree are removed,
-        if they do not have any other children, do not contain any values and
-        are not the root item. Note, that due to these additional procedures,
-        which have to be done, removal of an item requires some performance.
+        """Remove *item* from the tree, see :func: `remove_items`.
 
         :param item: Item to be removed :class: `OrderedDictTreeItem`
-        :param q_index_parent: :class: `QModelIndex` of the parent of *item*
+        :param q_index_parent: Not needed anymore, as items know their rows.
+            Only kept for compatibility.
         """
 
-        # If the parent index is not known, look it up
-        if q_index_parent is None:
-            q_index_parent = self._get_index_parent_from_item(item)
+        self.remove_items([item])
 
-        # Get the row position of the *item* relative to its parent
-        row = self._get_row_from_item_and_index_parent(item, q_index_parent)
+    def remove_items(self, items):
+        """Remove all *items* from the tree. Additionally to the items
+        themselves, all sub items are removed. Also, all items above the
+        removed items in the tree are removed, if they do not have any other
+        children, do not contain any values and are not the root item.
 
-        # Before removing *item* itself, recursively remove all sub items, if
-        # there are any
-        if len(item) > 0:
-            q_index = self.index(row, 0, q_index_parent)
-            for child in item:
-                self.remove_item(item[child], q_index)
+        The rows removed from a parent are joined to contiguous ranges, and
+        the views are notified once per range. If there are more than
+        *remove_reset_threshold* ranges, the model is reset instead.
 
-        parent = item.parent
+        :param items: Iterable of :class: `OrderedDictTreeItem`s to be removed
+        """
 
-        if parent:  # todo: this check is necessary. fixing a bug. Still, how can parent be None?
-            # Remove *item* itself and notify view
-            self.beginRemoveRows(q_index_parent, row, row)
-            parent._remove(item)
-            self.endRemoveRows()
+        # Items, whose ancestors are removed as well, are removed together
+        # with the ancestors. The root and detached items are ignored.
+        item_ids = {id(item) for item in items}
+        topmost_items = []
+        for item in items:
+            if item.parent is None:
+                continue
+            ancestor = item.parent
+            while ancestor is not None and id(ancestor) not in item_ids:
+                ancestor = ancestor.parent
+            if ancestor is None:
+                topmost_items.append(item)
+
+        row_ranges = self._get_row_ranges(topmost_items)
+        reset = len(row_ranges) > self.remove_reset_threshold
+        if reset:
+            self.beginResetModel()
 
-            # Remove parent item recursively if
+        while len(row_ranges) > 0:
+            parents = {}
+            for (parent, first, last) in row_ranges:
+                if not reset:
+                    self.beginRemoveRows(self._get_index_from_item(parent), first, last)
+                parent._remove_rows(first, last)
+                if not reset:
+                    self.endRemoveRows()
+                parents[id(parent)] = parent
+
+            # Remove parent items as well, if
             # * the parent item has no children
             # * the parent item does not contain any values
             # * the parent item is not the root item
-            condition = (
-                len(parent) == 0
-                and len(parent.values) == 0
-                and parent.parent is not None
-            )
-            if condition:
-                self.remove_item(parent, self.parent(q_index_parent))
+            # Note, that parents already removed with one of their ancestors
+            # are detached from the tree, and thus, do not have a parent
+            row_ranges = self._get_row_ranges([
+                parent for parent in parents.values()
+                if len(parent) == 0 and len(parent.values) == 0 and parent.parent is not None
+            ])
+
+        if reset:
+            self.endResetModel()
+
+    @staticmethod
+    def _get_row_ranges(items):
+        """Join the rows of *items* with the same parent to contiguous ranges.
+        The ranges of a parent are sorted descending, so that they can be
+        removed one after another.
+
+        :param items: Iterable of :class: `OrderedDictTreeItem`s
+
+        :rtype: :class: `list` of :class: `tuple`s of parent item, first row
+            and last row
+        """
+
+        rows_by_parent = {}
+        for item in items:
+            (_, rows) = rows_by_parent.setdefault(id(item.parent), (item.parent, set()))
+            rows.add(item.row)
+
+        row_ranges = []
+        for (parent, rows) in rows_by_parent.values():
+            rows = sorted(rows, reverse=True)
+            last = first = rows[0]
+            for row in rows[1:]:
+                if row != first - 1:
+                    row_ranges.append((parent, first, last))
+                    last = row
+                first = row
+            row_ranges.append((parent, first, last))
+        return row_ranges
+
+    def _find_item(self, *path):
+        """Get the item at *path* like :func: `get_item_from_path`, but without
+        creating indexes. None is returned, if the path does not exist.
+
+        :rtype: :class: `OrderedDictTreeItem` or None
+        """
+
+        item = self.root
+        for identifier in path:
+            if identifier not in item:
+                return None
+            item = item[identifier]
+        return item
 
     def clear(self):
         """Remove all items except the *root* item from the tree."""
 
-        for child in self.root:
-            self.remove_item(self.root[child], QModelIndex())
+        self.beginResetModel()
+        self.root._remove_rows(0, len(self.root) - 1)
+        self.endResetModel()
 
     def __repr__(self):
         return str(self.root.dict_tree)
@@ -739,6 +979,17 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.dialog = AttributesDialog()
+        self.reset_log_config_tables()
+
+    def reset_log_config_tables(self):
+        """Forget the log configs of the items added so far, and the choices of
+        the parameters made for them. Has to be called, before the items of a
+        new parser run are added.
+        """
+        # Tables of the log configs, and the varying parameters together with
+        # the chosen parameters by class of the sim data items
+        self._log_config_tables = {}
+        self._parameter_choices = {}
 
     # Implement *add*, *update* and remove to add/remove sim data items to the
     # tree.
@@ -762,7 +1013,6 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
 
         """
         additional_param_found = []
-        all_log_configs = {}
         diff_dict = {}
 
         # build up a diff dict in order let the software handle multiple configuration parameters
@@ -772,16 +1022,21 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
         # are not parameters
         # if you want to simulate with your own parameters, make sure that they appear in the
         # logfile
+        # The log configs are collected in tables per class, which are kept for all items
+        # of a parser run, see :func: `reset_log_config_tables`. Thus, parameters
+        # differing between the batches of items emitted by the parser are found as well.
         try:
             self.dialog.chosen_par.clear()
             self.dialog.not_chosen_par.clear()
             self.dialog.reset = True
             QP_added = False
+            sim_classes = []
             for sim_data_item in sim_data_items:
-                if sim_data_item.__class__ not in all_log_configs:
-                    all_log_configs[sim_data_item.__class__] = []
-                    diff_dict[sim_data_item.__class__] = {}
-                all_log_configs[sim_data_item.__class__].append(sim_data_item.log_config)
+                if sim_data_item.__class__ not in self._log_config_tables:
+                    self._log_config_tables[sim_data_item.__class__] = LogConfigTable()
+                if sim_data_item.__class__ not in sim_classes:
+                    sim_classes.append(sim_data_item.__class__)
+                self._log_config_tables[sim_data_item.__class__].add(sim_data_item.log_config)
                 # create list for all configuration parameters of the simulation_data_item
                 # this configuration parameters will be displayed in the VariableTreeModel
                 # If a qp parameter is available, we keep it as default in the List.
@@ -794,27 +1049,24 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
                     self.dialog.chosen_par.addItems(['QP'])
                     QP_added = True
             value_filter = ['.yuv', '.bin', '.hevc', '.jem']
-            key_filter = []
-            for sim_class in all_log_configs.keys():
-                for i in range(len(all_log_configs[sim_class]) - 1):
-                    current_item, next_item = all_log_configs[sim_class][i], all_log_configs[sim_class][i + 1]
-                    for (key, value) in set(current_item.items()) ^ set(next_item.items()):
-                        if all(y not in key for y in key_filter):
-                            if all(x not in value for x in value_filter):
-                                if key not in diff_dict[sim_class]:
-                                    diff_dict[sim_class][key] = []
-                                    diff_dict[sim_class][key].append(value)
-                                else:
-                                    if value not in diff_dict[sim_class][key]:
-                                        diff_dict[sim_class][key].append(value)
+            for sim_class in sim_classes:
+                diff_dict[sim_class] = self._log_config_tables[sim_class].get_varying_parameters(value_filter)
 
                 # dialog window which displays all parameters with varying values in a list
                 # the user can drag the parameters, he wants to analyse further into an other list
                 # the order of the parameters in the list determines the order of the parameter tree
                 if diff_dict[sim_class]:
-                    self.dialog.not_chosen_par.addItems([item for item in diff_dict[sim_class] if item != 'QP'])
+                    parameters = [item for item in diff_dict[sim_class] if item != 'QP']
+                    self.dialog.not_chosen_par.addItems(parameters)
                     if self.dialog.not_chosen_par:
-                        self.dialog.exec_()
+                        # the choice is only requested again, if other parameters vary, than
+                        # in the previous batches of items of the parser run
+                        previous_choice = self._parameter_choices.get(sim_class)
+                        if previous_choice is not None and previous_choice[0] == parameters:
+                            self.dialog.restore_choice(previous_choice[1])
+                        else:
+                            self.dialog.exec_()
+                        self._parameter_choices[sim_class] = (parameters, self.dialog.get_choice())
                     for i in range(len(self.dialog.not_chosen_par)):
                         diff_dict[sim_class].pop(self.dialog.not_chosen_par.item(i).text(), None)
                 additional_param_found.append(sim_class)
@@ -824,11 +1076,12 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
             # This is for conformance with rd data written out by older versions of rdplot
             pass
 
+        additional_params = self.dialog.get_choice()
         for sim_data_item in sim_data_items:
 
             has_additional_params = False
             if sim_data_item.__class__ in additional_param_found:
-                sim_data_item.additional_params = [self.dialog.chosen_par.item(i).text() for i in range(len(self.dialog.chosen_par))]
+                sim_data_item.additional_params = list(additional_params)
                 has_additional_params = True
 
             # Get *item* of the tree corresponding to *sim_data_item*
@@ -860,10 +1113,14 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
 
         :param sim_data_items: Iterable collection of :class: `SimDataItem`s to be removed
         """
+        # Get the *items* of the tree corresponding to *sim_data_items* and
+        # remove them at once
+        items = []
         for sim_data_item in sim_data_items:
-            # Get *item* of the tree corresponding to *sim_data_item*
-            item = self.create_path(*sim_data_item.tree_identifier_list)
-            self.remove_item(item)
+            item = self._find_item(*sim_data_item.tree_identifier_list)
+            if item is not None:
+                items.append(item)
+        self.remove_items(items)
 
         self.items_changed.emit()
 
@@ -881,41 +1138,154 @@ class VariableTreeModel(OrderedDictTreeModel):
     def __init__(self, *args, **kwargs):
         # Use lists as default item value
         super().__init__(*args, default_item_values=[], **kwargs)
+        self._reset_sim_data_items()
+
+    def _reset_sim_data_items(self):
+        # Sim data items, whose data is contained by the tree, by their id,
+        # together with the keys of the PlotData objects they contribute to.
+        # A key is a pair of the path and the identifiers of a PlotData object.
+        self._sim_data_items = {}
+        # Values contributed to the PlotData objects by the sim data items,
+        # and the PlotData objects themselves by key
+        self._plot_data_contributions = {}
+        self._plot_data = {}
+
+    def update_from_sim_data_items(self, sim_data_items):
+        """Update the tree, so that it contains the data of exactly the
+        *sim_data_items*. The data is joined like by :func:
+        `dict_tree_from_sim_data_items`, but only the PlotData objects, to
+        which sim data items added or removed since the last call contribute,
+        are changed. Thus, the cost depends on the change, and not on the
+        number of *sim_data_items*, and all other tree items stay untouched,
+        including their selection. Emit *items_changed* afterwards, if the
+        tree was changed.
+
+        :param sim_data_items: Iterable of :class: `SimDataItem`s
+
+        :rtype: :class: `bool`, True if the tree was changed
+        """
+
+        sim_data_items = {id(sim_data_item): sim_data_item for sim_data_item in sim_data_items}
+        removed_ids = [sim_data_item_id for sim_data_item_id in self._sim_data_items
+                       if sim_data_item_id not in sim_data_items]
+        added_items = [sim_data_item for (sim_data_item_id, sim_data_item) in sim_data_items.items()
+                       if sim_data_item_id not in self._sim_data_items]
+        if not removed_ids and not added_items:
+            return False
+
+        # Keys of all PlotData objects, which have to be updated. Note, that
+        # a dict is used as ordered set, so new PlotData objects are added in
+        # the order of the sim data items.
+        changed_keys = {}
+
+        for sim_data_item_id in removed_ids:
+            (_, keys) = self._sim_data_items.pop(sim_data_item_id)
+            for key in keys:
+                del self._plot_data_contributions[key][sim_data_item_id]
+                changed_keys[key] = None
+
+        for sim_data_item in added_items:
+            keys = {}
+            for (identifiers, path, values) in iter_sim_data_item_values(sim_data_item):
+                key = (tuple(path), tuple(identifiers))
+                contributions = self._plot_data_contributions.setdefault(key, {})
+                # The values are kept as float arrays, which are compact and
+                # are joined without converting them again
+                values = PlotData.to_array(values)
+                if id(sim_data_item) in contributions:
+                    values = np.concatenate((contributions[id(sim_data_item)], values))
+                contributions[id(sim_data_item)] = values
+                keys[key] = None
+                changed_keys[key] = None
+            self._sim_data_items[id(sim_data_item)] = (sim_data_item, list(keys))
+
+        # New PlotData objects are collected by path, so each tree item is only
+        # looked up once, and emptied tree items are removed at once
+        new_plot_data_lists = {}
+        emptied_items = []
+        for key in changed_keys:
+            plot_data = self._update_plot_data(key, emptied_items)
+            if plot_data is not None:
+                new_plot_data_lists.setdefault(key[0], []).append(plot_data)
+
+        self.remove_items(emptied_items)
+        for (path, plot_data_list) in new_plot_data_lists.items():
+            self.create_path(*path).values.extend(plot_data_list)
+
+        self.items_changed.emit()
+        return True
 
-    def update_from_dict_tree(self, dict_tree):
-        """ Update the tree from *dict_tree* . Keys create tree items, and the
-        leafs of the dictionary tree are appended as values to the corresponding
-        tree items.
+    def _update_plot_data(self, key, emptied_items):
+        """Join the values contributed by the sim data items to the PlotData
+        object at *key* again. The PlotData object is created, if it does
+        not exist yet, and removed, if no values are left. A created PlotData
+        object is returned, and has to be added to the tree by the caller.
 
-        :param dict_tree: tree of nested :class: `dict`s
+        :param key: :class: `tuple` of path and identifiers
+        :param emptied_items: :class: `list`, to which tree items are
+            appended, which do not contain any values or children anymore
+
+        :rtype: :class: `PlotData` or None
         """
 
-        pairs = deque(([key], item) for (key, item) in dict_tree.items())
-        while len(pairs) != 0:
-            (path, item) = pairs.pop()
+        (path, identifiers) = key
+        contributions = self._plot_data_contributions[key]
+        plot_data = self._plot_data.get(key)
+
+        if len(contributions) == 0:
+            del self._plot_data_contributions[key]
+            del self._plot_data[key]
+            self._remove_plot_data(plot_data, emptied_items)
+            return None
+
+        # Join the values in the order of the paths of the sim data items, as
+        # the selected sim data items are ordered by their path
+        sim_data_item_ids = sorted(
+            contributions,
+            key=lambda sim_data_item_id: self._sim_data_items[sim_data_item_id][0].path
+        )
+        values = np.concatenate([contributions[sim_data_item_id] for sim_data_item_id in sim_data_item_ids])
 
-            if isinstance(item, dict):
-                pairs.extend(
-                    (path + [key], item) for key, item in item.items()
-                )
-                continue
+        if plot_data is not None:
+            plot_data.values = values
+            return None
 
-            tree_item = self.create_path(*path)
-            tree_item.values.extend(item)
+        sim_data_item = self._sim_data_items[sim_data_item_ids[0]][0]
+        label = sim_data_item._get_label(list(path))
+        plot_data = PlotData(list(identifiers), values, list(path), label)
+        self._plot_data[key] = plot_data
+        return plot_data
 
-        self.items_changed.emit()
+    def _remove_plot_data(self, plot_data, emptied_items):
+        """Remove *plot_data* from the values of its tree item. The tree item
+        is appended to *emptied_items*, if it does not contain any values or
+        children anymore.
 
-    def clear_and_update_from_dict_tree(self, dict_tree):
-        # TODO This needs to be called two times, what obviously should not
-        # be the case
-        self.clear()
-        self.clear()
-        self.update_from_dict_tree(dict_tree)
+        :param plot_data: :class: `PlotData`
+        :param emptied_items: :class: `list` of :class: `OrderedDictTreeItem`s
+        """
+
+        item = self._find_item(*plot_data.path)
+        # Note, that PlotData objects are compared by identity
+        for (index, value) in enumerate(item.values):
+            if value is plot_data:
+                del item.values[index]
+                break
+
+        if len(item.values) == 0 and len(item) == 0:
+            emptied_items.append(item)
+
+    def clear(self):
+        super().clear()
+        self._reset_sim_data_items()
 
 
 # This is the model for storing the bd table
 # noinspection PyMethodOverriding
 class BdTableModel(QAbstractTableModel):
+    # Cells of curves with less points are left empty
+    _min_bd_points = 4
+
     def __init__(self, parent=None, *args):
         super(BdTableModel, self).__init__()
         self._data = np.empty(shape=[0, 0])
@@ -926,6 +1296,16 @@ class BdTableModel(QAbstractTableModel):
         self._anchor_index = 0
         self._plot_data_collection = []
 
+        # Function plotting the curves of a bd, see bjontegaard
+        self.plot_bd = plot_bd
+
+        # The curves of the table without duplicate points, and their fits
+        # by mode, interpolation and shift of the confidence interval. Thus,
+        # the fits are only looked up again, if the plot data collection
+        # changes.
+        self._curves = []
+        self._bd_fits = {}
+
     def getAnchorIdentifier(self):
         return self._horizontal_headers[self._anchor_index] if len(self._horizontal_headers) else ''
 
@@ -971,6 +1351,8 @@ class BdTableModel(QAbstractTableModel):
         self._data = np.empty(shape=[0, 0])
         self._horizontal_headers = []
         self._vertical_headers = []
+        self._curves = []
+        self._bd_fits = {}
         self.headerDataChanged.emit(Qt.Horizontal, 0, self._data.shape[1])
         self.headerDataChanged.emit(Qt.Vertical, 0, self._data.shape[0])
 
@@ -990,14 +1372,14 @@ class BdTableModel(QAbstractTableModel):
 
         seq_set = set()
         config_set = set()
-        identifier_list = []
+        identifier_set = set()
         for i in plot_data_collection:
             # there is no reason for calculating a bjontegaard, if we want to plot
             # several variables from the same sequence and config, so return in that case
-            # otherwise append the identifiers to the list and go on
-            if identifier_list.__contains__(i.identifiers):
+            # otherwise add the identifiers to the set and go on
+            if tuple(i.identifiers) in identifier_set:
                 return
-            identifier_list.append(i.identifiers)
+            identifier_set.add(tuple(i.identifiers))
 
             seq_set.add(i.identifiers[0])
             config_set.add('+'.join(i.identifiers[1:]))
@@ -1041,6 +1423,15 @@ class BdTableModel(QAbstractTableModel):
 
         self._plot_data_collection = plot_data_collection
 
+        # The curves of the cells, row by row. Cells without plot data
+        # have no curve.
+        plot_data_by_cell = {(x.identifiers[0], '+'.join(x.identifiers[1:])): x for x in plot_data_collection}
+        self._curves = [
+            self._unique_points(plot_data_by_cell[(seq, config)].sorted_array)
+            if (seq, config) in plot_data_by_cell else None
+            for seq in seq_set for config in config_set
+        ]
+
         self._data = np.zeros((len(seq_set) + 1, len(config_set)))
         allowed_units = [("kbps","dB"),("kbps","s"),("kbps","VMAFScore"),("kbps","MOS")]
         if all(collection.label in allowed_units for collection in plot_data_collection):
@@ -1087,78 +1478,73 @@ class BdTableModel(QAbstractTableModel):
             anchor = self._horizontal_headers[anchor_index]
             self._anchor_index = anchor_index
 
-        # iterate over all rows (sequences) and columns (configurations)
-        # of the table. Calculate one bd for each cell and store it in the
-        # model. Emit in the very end the dataChanged signal
-        row = 0
-        anchor_row = [x.identifiers[0] for x in self._plot_data_collection if x.identifiers[1] == anchor][0]
-        for seq in self._vertical_headers:
-            # the AVG seq is actually not a sequence, so just skip it
-            if seq == 'AVG':
-                continue
-            col = 0
-            for config in self._horizontal_headers:
-                # for the anchor vs anchor measurement the bd is zero,
-                # so just skip that case
-                if config == anchor:
-                    col += 1
-                    continue
-                # determine the identifiers of the current cell
-                identifiers_tmp = [seq, config]
-
-                # if the anchor configuration is not available for the current seq continue
-                if len([x for x in self._plot_data_collection if
-                        '+'.join(x.identifiers).__eq__('+'.join([identifiers_tmp[0], anchor]))]) == 0:
-                    self._data[row, col] = np.nan
-                    col += 1
-                    continue
-
-                # get the rd values for curve c1 which is the anchor
-                c1 = [x for x in self._plot_data_collection if
-                      '+'.join(x.identifiers).__eq__('+'.join([identifiers_tmp[0], anchor]))]
+        # Calculate the bds of all cells of the table at once. The curves
+        # of the anchor column are compared to the curves of each column.
+        seq_count = len(self._vertical_headers) - 1
+        config_count = len(self._horizontal_headers)
+        cells = np.arange(seq_count * config_count).reshape(seq_count, config_count)
+        (anchor_fits, fits) = self._get_bd_fits(bd_option, interp_option, ci_mode)
+        self._data[:-1, :] = bjontegaard_batch(anchor_fits, cells[:, [self._anchor_index]], fits, cells, bd_option)
+        # for the anchor vs anchor measurement the bd is zero
+        self._data[:-1, self._anchor_index] = 0
 
-                # set the ci mode values for c1
-                ci1_mode = ci_mode if c1[0].has_ci else 'average'
+        if not bd_plot:
+            self._plot_bds(bd_option, interp_option, ci_mode)
 
-                # sort the rd values for curve c1
-                curve1 = sorted(list(set(c1[0].values)))  # remove duplicates, this is just a workaround for the moment
-
-                # if the configuration is not available for the current seq continue
-                if len([x for x in self._plot_data_collection if
-                        '+'.join(x.identifiers).__eq__('+'.join(identifiers_tmp))]) == 0:
-                    self._data[row, col] = np.nan
-                    col += 1
-                    continue
-
-                # get the rd values for curve c2
-                c2 = [x for x in self._plot_data_collection
-                      if '+'.join(x.identifiers).__eq__('+'.join(identifiers_tmp))]
+        # calculate the AVG rate savings or delta psnr and round the output to something meaningful
+        self._data[-1, :] = np.mean(self._data[:-1, :][~np.isnan(self._data[:-1, :]).any(axis=1)], axis=0)
+        self._data = np.around(self._data, decimals=2)
 
-                # set the ci mode values for c2
-                ci2_mode = ci_mode if c2[0].has_ci else 'average'
+        self.dataChanged.emit(self.index(0, 0), self.index(seq_count, config_count - 1))
 
-                # sort the rd values for curve c2
-                curve2 = sorted(list(set(c2[0].values))) # remove duplicates, this is just a workaround for the moment
+    def _get_bd_fits(self, bd_option, interp_option, ci_mode):
+        """Get the fits of the curves of the table for the anchor and for the
+        compared curves. They only differ, if the confidence intervals are
+        taken into account, as the best case for the anchor is the worst case
+        for the other curves, and vice versa. Curves are fitted only once per
+        mode, interpolation and confidence interval.
 
-                # if a simulation does not contain at least 4 rate points,
-                # we do not want to calculate the bd
-                if len(curve1) < 4 or len(curve2) < 4:
-                    self._data[row, col] = np.nan
-                    col += 1
+        :rtype: :class: `tuple` of :class: `BdCurveFits`
+        """
+        ci_shift = {'best': 1, 'worst': -1}.get(ci_mode, 0)
+        fits = []
+        for shift in (-ci_shift, ci_shift):
+            key = (bd_option, interp_option, shift)
+            if key not in self._bd_fits:
+                self._bd_fits[key] = fit_bd_curves(self._curves, bd_option, interp_option, shift,
+                                                   self._min_bd_points)
+            fits.append(self._bd_fits[key])
+        return tuple(fits)
+
+    @staticmethod
+    def _unique_points(array):
+        """Sort the points of *array* and remove duplicates, like
+        :func: `np.unique` with axis 0, but without its overhead per call.
+        Removing the duplicates is just a workaround for the moment."""
+        # Points sorted by strictly increasing rates are unique already
+        rates = array[:, 0]
+        if np.all(rates[1:] > rates[:-1]):
+            return array
+        array = array[np.lexsort(array.T[::-1])]
+        is_unique = np.ones(len(array), dtype=bool)
+        is_unique[1:] = np.any(array[1:] != array[:-1], axis=1)
+        return array[is_unique]
+
+    def _plot_bds(self, bd_option, interp_option, ci_mode):
+        """Plot the curves of the cells with a bd, compared to the anchor"""
+        anchor = self._horizontal_headers[self._anchor_index]
+        config_count = len(self._horizontal_headers)
+        for (row, seq) in enumerate(self._vertical_headers[:-1]):
+            c1 = self._curves[row * config_count + self._anchor_index]
+            for (col, config) in enumerate(self._horizontal_headers):
+                if col == self._anchor_index or np.isnan(self._data[row, col]):
                     continue
-
-                # calculate the bd, actually this can be extended by some plots
-                configs = [anchor, identifiers_tmp[1]]
-                self._data[row, col] = bjontegaard(curve1, curve2, bd_option, interp_option, 'BD Plot ' + seq, configs,
-                                                   bd_plot, ci1_mode, ci2_mode)
-                col += 1
-            row += 1
-
-        # calculate the AVG rate savings or delta psnr and round the output to something meaningful
-        self._data[row, :] = np.mean(self._data[:-1, :][~np.isnan(self._data[:-1, :]).any(axis=1)], axis=0)
-        self._data = np.around(self._data, decimals=2)
-
-        self.dataChanged.emit(self.index(0, 0), self.index(row, col))
+                c2 = self._curves[row * config_count + col]
+                # the confidence interval is the third column of a curve
+                ci1_mode = ci_mode if c1.shape[1] == 3 else 'average'
+                ci2_mode = ci_mode if c2.shape[1] == 3 else 'average'
+                bjontegaard(c1, c2, bd_option, interp_option, 'BD Plot ' + seq, [anchor, config], False,
+                            ci1_mode, ci2_mode, plot=self.plot_bd)
 
     def export_to_latex(self, filename):
         seqs = [seq.split('_')[0] for seq in self._vertical_headers]
@@ -1179,6 +1565,10 @@ class BdTableModel(QAbstractTableModel):
 
 
 class BdUserGeneratedCurvesTableModel(BdTableModel):
+    # The bds of user generated curves are calculated for any number of
+    # points, as far as the interpolation allows
+    _min_bd_points = 1
+
     def __init__(self):
         super().__init__()
 
@@ -1259,6 +1649,7 @@ class BdUserGeneratedCurvesTableModel(BdTableModel):
         self.endInsertRows()
 
         self._plot_data_collection = plot_data_collection
+        self._curves = [self._unique_points(curve.sorted_array) for curve in plot_data_collection]
 
         self._data = np.zeros((len(self._vertical_headers), 1))
         allowed_units = [("kbps", "dB"), ("kbps", "s"), ("kbps", "VMAFScore"), ("kbps", "MOS")]
@@ -1276,23 +1667,24 @@ class BdUserGeneratedCurvesTableModel(BdTableModel):
         if self.rowCount(self) == 0 and self.columnCount(self) == 0:
             return
 
-        anchor_curve = self._plot_data_collection[self._anchor_index]
-        c1 = sorted(list(set(anchor_curve.values)))
-        ci1_mode = ci_mode if anchor_curve.has_ci else 'average'
-        index = 0
-        table_index = 0
-        curve_names = [self._horizontal_headers]
-        for curve_name in self._vertical_headers:
-            if curve_name != 'AVG':
-                curve_names.append(curve_name)
-        for curve in self._plot_data_collection:
-            if index != self._anchor_index:
-                c2 = sorted(list(set(curve.values)))
-                ci2_mode = ci_mode if curve.has_ci else 'average'
-                self._data[table_index, 0] = bjontegaard(c1, c2, bd_option, interp_option, 'BD Plot', curve_names, bd_plot,
-                                                         ci1_mode, ci2_mode)
-                table_index += 1
-            index += 1
+        # Calculate the bds of all curves compared to the anchor at once
+        curve_indexes = [index for index in range(len(self._curves)) if index != self._anchor_index]
+        (anchor_fits, fits) = self._get_bd_fits(bd_option, interp_option, ci_mode)
+        self._data[:-1, 0] = bjontegaard_batch(anchor_fits, self._anchor_index, fits, curve_indexes, bd_option)
+        table_index = len(curve_indexes)
+
+        if not bd_plot:
+            c1 = self._curves[self._anchor_index]
+            # the confidence interval is the third column of a curve
+            ci1_mode = ci_mode if c1.shape[1] == 3 else 'average'
+            curve_names = [self._horizontal_headers] + self._vertical_headers[:-1]
+            for (row, index) in enumerate(curve_indexes):
+                if np.isnan(self._data[row, 0]):
+                    continue
+                c2 = self._curves[index]
+                ci2_mode = ci_mode if c2.shape[1] == 3 else 'average'
+                bjontegaard(c1, c2, bd_option, interp_option, 'BD Plot', curve_names, bd_plot, ci1_mode, ci2_mode,
+                            plot=self.plot_bd)
 
         # calculate the AVG rate savings or delta psnr and round the output to something meaningful
         self._data[table_index, 0] = np.mean(np.array(self._data[:-1, 0]), axis=0)
@@ -1332,6 +1724,19 @@ class AttributesDialog(QDialog):
         main_layout.addWidget(ok_button)
         ok_button.clicked.connect(self.close)
 
+    def get_choice(self):
+        """Get the chosen parameters in their order"""
+        return [self.chosen_par.item(i).text() for i in range(len(self.chosen_par))]
+
+    def restore_choice(self, chosen_parameters):
+        """Move the *chosen_parameters* to the list of chosen parameters, like
+        they were chosen by the user"""
+        for parameter in chosen_parameters:
+            for item in self.not_chosen_par.findItems(parameter, QtCore.Qt.MatchExactly):
+                self.not_chosen_par.takeItem(self.not_chosen_par.row(item))
+        self.chosen_par.clear()
+        self.chosen_par.addItems(chosen_parameters)
+
     def paintEvent(self, event):
         if self.reset:
             self.message_shown.emit()
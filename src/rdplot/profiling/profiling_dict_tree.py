@@ -0,0 +1,42 @@
+# measures the time to join the data of many simulation data items to the
+# variable tree, which is done every time the selection of items changes.
+# The parsed example logs are copied with different configs to get 10k items.
+# result can be checked with snakeviz:
+# pip install snakeviz
+# snakeviz dict_tree.stats on the command line
+
+import cProfile
+import sys
+import time
+from copy import copy
+from os import path
+
+from PyQt5 import QtWidgets
+
+from rdplot.SimulationDataItem import SimulationDataItemFactory, dict_tree_from_sim_data_items
+
+TEST_DIR = path.join(path.dirname(path.abspath(__file__)), '..', 'tests')
+SIMULATION_DATA_ITEM_CLASSES_PATH = path.normpath(path.join(TEST_DIR, '../SimulationDataItemClasses'))
+LOG_DIR = path.join(TEST_DIR, 'test_logs/exampleSimLogDirs/HM-14.0')
+
+ITEM_COUNT = 10000
+
+app = QtWidgets.QApplication(sys.argv)
+factory = SimulationDataItemFactory.from_path(SIMULATION_DATA_ITEM_CLASSES_PATH)
+parsed_items = factory.create_item_list_from_directory(LOG_DIR)
+
+# copy the parsed items to different configs
+sim_data_items = []
+for config_index in range(ITEM_COUNT // len(parsed_items) + 1):
+    for parsed_item in parsed_items:
+        sim_data_item = copy(parsed_item)
+        sim_data_item.config = parsed_item.config + '_%d' % config_index
+        sim_data_items.append(sim_data_item)
+sim_data_items = sim_data_items[:ITEM_COUNT]
+
+for item_count in [ITEM_COUNT // 10, ITEM_COUNT]:
+    start_time = time.perf_counter()
+    dict_tree_from_sim_data_items(sim_data_items[:item_count])
+    print('%d items: %.3f s' % (item_count, time.perf_counter() - start_time))
+
+cProfile.run('dict_tree_from_sim_data_items(sim_data_items)', 'dict_tree.stats')
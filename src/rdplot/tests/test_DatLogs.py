@@ -1,10 +1,12 @@
 import unittest
 from rdplot.SimulationDataItemClasses import EncoderLogs, DatLogs
 from rdplot.SimulationDataItem import AbstractSimulationDataItem
-from rdplot.SimulationDataItem import SimulationDataItemFactory
+from rdplot.SimulationDataItem import SimulationDataItemFactory, SimulationDataItemError
 from PyQt5 import QtWidgets
 # import SimulationDataItem
 from os import path, listdir
+from tempfile import TemporaryDirectory
+import weakref
 import sys
 
 # path to test module (this file)
@@ -259,6 +261,60 @@ class TestDatLogs(unittest.TestCase):
                 self.assertTrue(can_parse_file)
                 print('Can parse %s with %s' % (log_path, type(cls_list[0])))
 
+    def test_xml_dat_log(self):
+        frames = ''.join('<Frame%d><PsnrY><Unit>dB</Unit><Value>%d.5</Value></PsnrY></Frame%d>' % (frame, frame, frame)
+                         for frame in range(3))
+        xml = ('<?xml version="1.0" encoding="utf-8"?>\n<Logfile>'
+               '<SeqName><Value>RaceHorses</Value></SeqName><QP><Value>22</Value></QP>'
+               '<Rate><Unit>kbps</Unit><Value>100</Value></Rate><PsnrY><Unit>dB</Unit><Value>40.5</Value></PsnrY>'
+               '<temporal_data>' + frames + '</temporal_data></Logfile>')
+
+        with TemporaryDirectory() as temp_dir:
+            log_path = path.join(temp_dir, 'RaceHorses_QP22.xml')
+            with open(log_path, 'w') as log:
+                log.write(xml)
+            # detection only reads up to the root element, thus, a broken
+            # document is detected, but cannot be parsed
+            broken_log_path = path.join(temp_dir, 'broken.xml')
+            with open(broken_log_path, 'w') as log:
+                log.write(xml[:-5])
+            other_xml_path = path.join(temp_dir, 'other.xml')
+            with open(other_xml_path, 'w') as log:
+                log.write('<Other><QP><Value>22</Value></QP></Other>')
+
+            self.assertTrue(DatLogs.XMLDatLog.can_parse_file(log_path))
+            self.assertTrue(DatLogs.XMLDatLog.can_parse_file(broken_log_path))
+            self.assertFalse(DatLogs.XMLDatLog.can_parse_file(other_xml_path))
+            with self.assertRaises(SimulationDataItemError):
+                DatLogs.XMLDatLog(broken_log_path)
+
+            item = DatLogs.XMLDatLog(log_path)
+            self.assertEqual((item.sequence, item.qp), ('RaceHorses', '22'))
+            self.assertEqual(item.summary_data, {'QP': [(100.0, 22.0)], 'PsnrY': [(100.0, 40.5)]})
+            self.assertEqual(item.temporal_data, {'PsnrY': [(0, 0.5), (1, 1.5), (2, 2.5)]})
+            self.assertEqual(item._get_label(['Summary', 'PsnrY']), ('kbps', 'dB'))
+            self.assertEqual(item._get_label(['Temporal', 'PsnrY']), ('Frame', 'dB'))
+            self.assertFalse(hasattr(item, 'sim_data'))
+
+            # the shared label registries must not keep the item alive
+            item_reference = weakref.ref(item)
+            del item
+            self.assertIsNone(item_reference())
+
+    def test_declared_encoding_of_decoded_text(self):
+        xml = ('<?xml version="1.0" encoding="ISO-8859-1"?>\n<Logfile>'
+               '<SeqName><Value>Caf\u00e9</Value></SeqName><QP><Value>22</Value></QP>'
+               '<Rate><Unit>kbps</Unit><Value>100</Value></Rate></Logfile>')
+
+        with TemporaryDirectory() as temp_dir:
+            log_path = path.join(temp_dir, 'Cafe_QP22.xml')
+            with open(log_path, 'w', encoding='utf-8') as log:
+                log.write(xml)
+
+            self.assertTrue(DatLogs.XMLDatLog.can_parse_file(log_path))
+            item = DatLogs.XMLDatLog(log_path)
+            self.assertEqual(item.sequence, 'Caf\u00e9')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,15 @@
 import unittest
 from rdplot.SimulationDataItemClasses import EncoderLogs, DatLogs
 from rdplot.SimulationDataItem import AbstractSimulationDataItem
-from rdplot.SimulationDataItem import SimulationDataItemFactory
+from rdplot.SimulationDataItem import SimulationDataItemFactory, FileSignature
 # import SimulationDataItem
 from os import path, listdir
+from tempfile import TemporaryDirectory
+import bz2
+import gzip
+import lzma
+import tarfile
+import zipfile
 from PyQt5 import QtWidgets
 import sys
 
@@ -259,6 +265,129 @@ class TestEncoderLogs(unittest.TestCase):
                 self.assertTrue(can_parse_file)
                 print('Can parse %s with %s' % (log_path, type(cls_list[0])))
 
+    def test_parallel_parsing_equals_serial_parsing(self):
+        log_dir = path.join(TEST_DIR, 'test_logs/exampleSimLogDirs/HM-14.0')
+        serial_items = self._factory.create_item_list_from_directory(log_dir)
+
+        parser_pool = self._factory.create_parser_pool(2)
+        try:
+            parallel_items = []
+            for item_list in self._factory.iter_item_lists_from_directory(log_dir, parser_pool):
+                parallel_items.extend(item_list)
+        finally:
+            parser_pool.shutdown()
+
+        self.assertEqual(len(serial_items), len(parallel_items))
+        for serial_item, parallel_item in zip(serial_items, parallel_items):
+            with self.subTest(log_path=serial_item.path):
+                self.assertEqual(serial_item.path, parallel_item.path)
+                self.assertEqual(type(serial_item).__name__, type(parallel_item).__name__)
+                self.assertEqual(serial_item.summary_data, parallel_item.summary_data)
+                self.assertEqual(serial_item.temporal_data, parallel_item.temporal_data)
+                self.assertEqual(serial_item.log_config, parallel_item.log_config)
+
+    def test_signature_detection_equals_full_text_detection(self):
+        # markers used by the encoder log parsers for detection
+        patterns = [r'^HM \s software', r'^SHM \s software', r'^VVCSoftware', r'Y-PSNR_(?:DYN_)?VP0',
+                    r'Y-E2ESPSNR', r'PSNR1', r'Total\ Time']
+
+        # use small windows, to also test reading head and tail separately
+        class SmallFileSignature(FileSignature):
+            head_size = 8 * 1024
+            tail_size = 8 * 1024
+
+        for signature_class in [FileSignature, SmallFileSignature]:
+            for log_path in self.log_paths:
+                with self.subTest(log_path=log_path, signature_class=signature_class):
+                    signature = signature_class.from_path(log_path, path.getsize(log_path))
+                    for pattern in patterns:
+                        self.assertEqual(AbstractSimulationDataItem._is_file_text_matching_re_pattern(log_path,
+                                                                                                      pattern),
+                                         signature.matches_re_pattern(pattern))
+
+    def test_compressed_signature_reads_tail_on_demand(self):
+        log_path = path.join(TEST_DIR, 'test_logs/exampleSimLogDirs/HM-14.0',
+                             'HOMC1noHODS0LDP-BQSquare_416x240_60_encoder+lowdelay+P+main_FTBE100_QP28_enc.log')
+
+        class SmallFileSignature(FileSignature):
+            head_size = 1024
+            tail_size = 1024
+
+        with TemporaryDirectory() as temp_dir:
+            compressed_log_path = path.join(temp_dir, path.basename(log_path) + '.gz')
+            with open(log_path, 'rb') as log, open(compressed_log_path, 'wb') as compressed_log:
+                compressed_log.write(gzip.compress(log.read()))
+
+            signature = SmallFileSignature.from_path(log_path, path.getsize(log_path))
+            compressed_signature = SmallFileSignature.from_path(compressed_log_path,
+                                                                path.getsize(compressed_log_path))
+            self.assertFalse(compressed_signature.is_complete)
+            self.assertEqual(signature.head, compressed_signature.head)
+            # only the head has been decompressed so far
+            self.assertIsNotNone(compressed_signature._read_tail)
+            self.assertTrue(compressed_signature.matches_re_pattern(r'^HM \s software'))
+            self.assertIsNotNone(compressed_signature._read_tail)
+            self.assertTrue(compressed_signature.matches_re_pattern(r'Total\ Time'))
+            self.assertEqual(signature.tail, compressed_signature.tail)
+
+    def test_compressed_logs_equal_uncompressed_logs(self):
+        log_dir = path.join(TEST_DIR, 'test_logs/exampleSimLogDirs/HM-14.0')
+        log_names = sorted(listdir(log_dir))[:3]
+
+        with TemporaryDirectory() as temp_dir:
+            for extension, compress in [('.gz', gzip.compress), ('.xz', lzma.compress), ('.bz2', bz2.compress)]:
+                for log_name in log_names:
+                    with self.subTest(log_name=log_name, extension=extension):
+                        log_path = path.join(log_dir, log_name)
+                        compressed_log_path = path.join(temp_dir, log_name + extension)
+                        with open(log_path, 'rb') as log, open(compressed_log_path, 'wb') as compressed_log:
+                            compressed_log.write(compress(log.read()))
+
+                        item, = self._factory.create_item_from_file(log_path)
+                        compressed_item, = self._factory.create_item_from_file(compressed_log_path)
+                        self.assertIs(type(item), type(compressed_item))
+                        self.assertEqual(item.sequence, compressed_item.sequence)
+                        self.assertEqual(item.summary_data, compressed_item.summary_data)
+                        self.assertEqual(item.temporal_data, compressed_item.temporal_data)
+                        self.assertEqual(item.log_config, compressed_item.log_config)
+
+    def test_archive_members_equal_files(self):
+        log_dir = path.join(TEST_DIR, 'test_logs/exampleSimLogDirs/HM-14.0')
+        log_names = sorted(listdir(log_dir))
+        items = {path.basename(item.path): item for item in self._factory.create_item_list_from_directory(log_dir)}
+
+        with TemporaryDirectory() as temp_dir:
+            tar_path = path.join(temp_dir, 'results.tar.gz')
+            with tarfile.open(tar_path, 'w:gz') as archive:
+                for log_name in log_names:
+                    archive.add(path.join(log_dir, log_name), 'HM-14.0/' + log_name)
+            zip_path = path.join(temp_dir, 'results.zip')
+            with zipfile.ZipFile(zip_path, 'w') as archive:
+                for log_name in log_names:
+                    archive.write(path.join(log_dir, log_name), 'HM-14.0/' + log_name)
+                # files, which are not logs, are skipped
+                archive.writestr('HM-14.0/rec.bin', bytes(range(256)))
+
+            parser_pool = self._factory.create_parser_pool(2)
+            try:
+                for archive_path in [tar_path, zip_path]:
+                    for pool in [None, parser_pool]:
+                        archive_items = [item for item_list in self._factory.iter_item_lists_from_archive(archive_path,
+                                                                                                          pool)
+                                         for item in item_list]
+                        self.assertEqual(len(archive_items), len(items))
+                        for archive_item in archive_items:
+                            with self.subTest(path=archive_item.path, pool=pool):
+                                item = items[path.basename(archive_item.path)]
+                                self.assertEqual(archive_item.path, path.join(archive_path, 'HM-14.0',
+                                                                              path.basename(item.path)))
+                                self.assertEqual(archive_item.config, path.join(archive_path, 'HM-14.0'))
+                                self.assertIs(type(item), type(archive_item))
+                                self.assertEqual(item.summary_data, archive_item.summary_data)
+                                self.assertEqual(item.temporal_data, archive_item.temporal_data)
+            finally:
+                parser_pool.shutdown()
+
 
 if __name__ == '__main__':
     unittest.main()
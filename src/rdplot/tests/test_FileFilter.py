@@ -0,0 +1,41 @@
+import unittest
+from rdplot.lib.FileFilter import FileFilter
+from os import makedirs, path
+from tempfile import TemporaryDirectory
+
+
+class TestFileFilter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        # campaign directory with logs next to reconstructions and bitstreams
+        for relative_path, size in [('a_enc.log', 10), ('a_rec.yuv', 10), ('a.bin', 10), ('large_enc.log', 1000),
+                                    ('QP22/b_enc.log', 10), ('QP22/b_rec.yuv', 10), ('QP22/sub/c_enc.log', 10),
+                                    ('QP22/sub/c.xml', 10), ('.git/d_enc.log', 10)]:
+            file_path = path.join(self.temp_dir.name, relative_path)
+            makedirs(path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w') as file:
+                file.write('x' * size)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _get_relative_paths(self, file_filter):
+        return [path.relpath(file_path, self.temp_dir.name).replace(path.sep, '/')
+                for file_path in file_filter.iter_file_paths(self.temp_dir.name)]
+
+    def test_default_filter_skips_videos_and_sub_directories(self):
+        self.assertEqual(self._get_relative_paths(FileFilter()), ['a_enc.log', 'large_enc.log'])
+
+    def test_recursive_filter(self):
+        file_filter = FileFilter(exclude_patterns=FileFilter.default_exclude_patterns + ['.git'], max_depth=None)
+        self.assertEqual(self._get_relative_paths(file_filter),
+                         ['a_enc.log', 'large_enc.log', 'QP22/b_enc.log', 'QP22/sub/c.xml', 'QP22/sub/c_enc.log'])
+
+        file_filter.max_depth = 1
+        file_filter.include_patterns = ['*.log']
+        file_filter.max_file_size = 100
+        self.assertEqual(self._get_relative_paths(file_filter), ['a_enc.log', 'QP22/b_enc.log'])
+
+
+if __name__ == '__main__':
+    unittest.main()
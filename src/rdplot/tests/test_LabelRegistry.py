@@ -0,0 +1,48 @@
+import unittest
+from collections import defaultdict
+from rdplot.lib.LabelRegistry import LabelRegistry
+from rdplot.SimulationDataItemClasses import EncoderLogs
+
+
+class TestLabelRegistry(unittest.TestCase):
+    def test_label_tree(self):
+        labels = {'Temporal': defaultdict(lambda: ('Frame', 'dB'))}
+        labels['Temporal']['layer 0'] = labels['Temporal']
+        labels['Temporal']['Bits'] = ('Frame', 'bits')
+        registry = LabelRegistry(labels)
+
+        self.assertEqual(registry.get_label(['Temporal', 'Bits']), ('Frame', 'bits'))
+        self.assertEqual(registry.get_label(['Temporal', 'Y-PSNR']), ('Frame', 'dB'))
+        self.assertEqual(registry.get_label(['Temporal', 'layer 0', 'layer 0', 'Bits']), ('Frame', 'bits'))
+        self.assertIsNone(registry.get_label(['Temporal']))
+        with self.assertRaises(KeyError):
+            registry.get_label(['Summary', 'Bits'])
+
+        # the registry is not changed by changes of the tree
+        labels['Temporal']['Bits'] = ('Frame', 'kbit')
+        self.assertEqual(registry.get_label(['Temporal', 'Bits']), ('Frame', 'bits'))
+
+    def test_default_function(self):
+        calls = []
+
+        def create_label(keys):
+            calls.append(keys)
+            return 'QP', keys[-1]
+
+        registry = LabelRegistry(default_function=create_label)
+        self.assertEqual(registry.get_label(['Analyser', 'Bits']), ('QP', 'Bits'))
+        self.assertEqual(registry.get_label(['Analyser', 'Bits']), ('QP', 'Bits'))
+        # labels are computed once per path
+        self.assertEqual(len(calls), 1)
+
+    def test_encoder_log_labels(self):
+        get_label = EncoderLogs.AbstractEncLog._get_label
+        self.assertEqual(get_label(['EncLogHM', 'Summary', 'SUMMARY', 'Bitrate']), ('kbps', 'bits'))
+        self.assertEqual(get_label(['EncLogHM', 'Summary', 'I Slices', 'Y-PSNR']), ('kbps', 'dB'))
+        self.assertEqual(get_label(['EncLogSHM', 'Summary', 'SUMMARY', 'layer 1', 'Total Time']), ('kbps', 'sec'))
+        self.assertEqual(get_label(['EncLogHM', 'Summary', 'PSNR1', 'Frames']), ('kbps', 'Frames'))
+        self.assertEqual(get_label(['EncLogSHM', 'Temporal', 'layer 1', 'ET']), ('Frame', 'sec'))
+
+
+if __name__ == '__main__':
+    unittest.main()
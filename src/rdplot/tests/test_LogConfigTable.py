@@ -0,0 +1,43 @@
+import gc
+import sys
+import unittest
+
+from PyQt5 import QtWidgets
+
+
+class TestLogConfigTable(unittest.TestCase):
+    def setUp(self):
+        # the model module can only be imported with a running application
+        self.app = QtWidgets.QApplication(sys.argv)
+        from rdplot.model import LogConfigTable
+        self.table = LogConfigTable()
+
+    def tearDown(self):
+        del self.table
+        gc.collect()
+        self.app.exit()
+
+    def test_equal_parameters_are_not_varying(self):
+        for qp in ['22', '27', '22']:
+            self.table.add({'QP': qp, 'GOPSize': '8'})
+        self.assertEqual(self.table.get_varying_parameters(), {'QP': ['22', '27']})
+
+    def test_missing_parameters_are_varying(self):
+        self.table.add({'QP': '22'})
+        self.table.add({'QP': '22', 'ALF': '1'})
+        self.table.add({'ALF': '1'})
+        varying_parameters = self.table.get_varying_parameters()
+        self.assertEqual(varying_parameters, {'QP': ['22'], 'ALF': ['1']})
+
+    def test_filtered_values_are_ignored(self):
+        self.table.add({'QP': '22', 'InputFile': 'a.yuv'})
+        self.table.add({'QP': '27', 'InputFile': 'b.yuv'})
+        self.assertEqual(self.table.get_varying_parameters(['.yuv']), {'QP': ['22', '27']})
+
+    def test_single_item_has_no_varying_parameters(self):
+        self.table.add({'QP': '22'})
+        self.assertEqual(self.table.get_varying_parameters(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sys
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QModelIndex, Qt
+
+
+class TestOrderedDictModel(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication(sys.argv)
+        # the model module sets up matplotlib for qt, which requires the
+        # application
+        from rdplot.model import OrderedDictModel, compare_strings_case_insensitive
+
+        self.model = OrderedDictModel()
+        self.case_insensitive_model = OrderedDictModel(compare_keys_function=compare_strings_case_insensitive)
+
+        # count the notifications of the views
+        self.notifications = []
+        self.model.rowsInserted.connect(lambda parent, first, last: self.notifications.append(('insert', first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: self.notifications.append(('remove', first, last)))
+        self.model.modelReset.connect(lambda: self.notifications.append(('reset',)))
+
+    def tearDown(self):
+        # the models have to be deleted before the application
+        del self.model
+        del self.case_insensitive_model
+        self.app.exit()
+
+    def get_displayed_keys(self, model):
+        return [model.data(model.index(row, 0, QModelIndex()), Qt.DisplayRole) for row in range(model.rowCount(QModelIndex()))]
+
+    def test_keys_are_sorted(self):
+        self.model.update_from_tuples([('c', 3), ('a', 1)])
+        self.model.update_from_tuples([('b', 2), ('a', 4)])
+
+        self.assertEqual(list(self.model), ['a', 'b', 'c'])
+        self.assertEqual(self.model.values(), [4, 2, 3])
+        self.assertEqual(self.get_displayed_keys(self.model), ['a', 'b', 'c'])
+        self.assertEqual(self.model['b'], 2)
+        self.assertIn('c', self.model)
+        self.assertNotIn('d', self.model)
+        self.assertEqual(self.model.get_row('c'), 2)
+
+        self.case_insensitive_model.update_from_tuples([('b', 1), ('C', 2), ('A', 3)])
+        self.assertEqual(list(self.case_insensitive_model), ['A', 'b', 'C'])
+
+    def test_views_are_notified_once_per_update(self):
+        self.model.update_from_tuples([('b', 0), ('a', 0), ('c', 0)])
+        self.model.update_from_tuples([('e', 0), ('d', 0)])
+        self.model.remove_keys(['b', 'c'])
+        self.assertEqual(self.notifications, [('insert', 0, 2), ('insert', 3, 4), ('remove', 1, 2)])
+
+        # keys at different positions are merged
+        self.notifications.clear()
+        self.model.update_from_tuples([('b', 0), ('f', 0)])
+        self.model.remove_keys(['a', 'f', 'x'])
+        self.assertEqual(self.notifications, [('reset',), ('reset',)])
+        self.assertEqual(list(self.model), ['b', 'd', 'e'])
+
+    def test_clear_and_update_from_tuples(self):
+        self.model.update_from_tuples([('a', 0), ('b', 0)])
+        self.model.clear_and_update_from_tuples([('d', 1), ('c', 2)])
+        self.assertEqual(self.model.items(), [('c', 2), ('d', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import gc
+import random
+import sys
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QModelIndex
+from PyQt5.QtTest import QAbstractItemModelTester
+
+
+class TestOrderedDictTreeModel(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication(sys.argv)
+        # the model module sets up matplotlib for qt, which requires the
+        # application
+        from rdplot.model import OrderedDictTreeModel
+
+        self.model = OrderedDictTreeModel()
+
+    def tearDown(self):
+        # the model and its items have to be deleted before the application
+        del self.model
+        gc.collect()
+        self.app.exit()
+
+    def assert_rows_are_consistent(self, item):
+        for (row, child) in enumerate(item.children):
+            self.assertEqual(child.row, row)
+            self.assertIs(item[child.identifier], child)
+            self.assertEqual(self.model._get_index_from_item(child).row(), row)
+            self.assertIs(self.model._get_index_from_item(child).internalPointer(), child)
+            self.assert_rows_are_consistent(child)
+
+    def test_children_are_sorted_case_insensitive(self):
+        for identifier in ['b', 'D', 'a', 'C']:
+            self.model.create_path('sequence', identifier)
+
+        self.assertEqual(list(self.model.root['sequence']), ['a', 'b', 'C', 'D'])
+        self.assertIn('C', self.model.root['sequence'])
+        self.assertNotIn('c', self.model.root['sequence'])
+        self.assertIs(self.model.get_item_from_path('sequence', 'C'), self.model.root['sequence']['C'])
+
+    def test_rows_are_updated(self):
+        # checks the consistency of the model after each change
+        tester = QAbstractItemModelTester(self.model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+
+        random.seed(0)
+        paths = [('seq%d' % random.randrange(5), 'config%d' % random.randrange(10), 'QP%d' % random.randrange(4))
+                 for _ in range(60)]
+        for path in paths:
+            self.model.create_path(*path)
+        self.assert_rows_are_consistent(self.model.root)
+
+        for path in paths[::3]:
+            try:
+                item = self.model.get_item_from_path(*path)
+            except KeyError:
+                continue
+            self.model.remove_item(item)
+        self.assert_rows_are_consistent(self.model.root)
+        del tester
+
+    def test_remove_items(self):
+        tester = QAbstractItemModelTester(self.model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+        removed_ranges = []
+        self.model.rowsRemoved.connect(lambda parent, first, last: removed_ranges.append((first, last)))
+
+        for config in range(6):
+            for qp in range(2):
+                self.model.create_path('seq', 'config%d' % config, 'QP%d' % qp)
+        self.model.create_path('other', 'config0', 'QP0')
+
+        items = [self.model.get_item_from_path('seq', 'config%d' % config, 'QP%d' % qp)
+                 for config in [1, 2, 4] for qp in range(2)]
+        # items below removed items are removed with them
+        items.append(self.model.get_item_from_path('other', 'config0', 'QP0'))
+        items.append(self.model.get_item_from_path('other'))
+        self.model.remove_items(items)
+
+        # empty parents are removed as well
+        self.assertEqual(list(self.model.root), ['seq'])
+        self.assertEqual(list(self.model.root['seq']), ['config0', 'config3', 'config5'])
+        self.assert_rows_are_consistent(self.model.root)
+        # one range per parent and one range of parents
+        self.assertCountEqual(removed_ranges, [(0, 0)] + [(0, 1)] * 3 + [(4, 4), (1, 2)])
+
+        # many ranges reset the model
+        self.model.remove_reset_threshold = 1
+        reset = []
+        self.model.modelReset.connect(lambda: reset.append(True))
+        self.model.remove_items([self.model.get_item_from_path('seq', 'config%d' % config) for config in [0, 5]])
+        self.assertEqual(reset, [True])
+        self.assertEqual(list(self.model.root['seq']), ['config3'])
+        del tester
+
+    def test_displayed_identifiers_omit_common_parts(self):
+        self.model.create_path('logs/a/seq')
+        self.model.create_path('logs/b/seq')
+        displayed = [self.model.data(self.model.index(row, 0, QModelIndex())) for row in range(2)]
+        self.assertEqual(displayed, ['a', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from rdplot.SimulationDataItemClasses import EncoderLogs
+from rdplot.lib.ParseCache import ParseCache
+from os import path, utime
+from shutil import copy
+from tempfile import TemporaryDirectory
+
+# path to test module (this file)
+TEST_DIR = path.dirname(path.abspath(__file__))
+
+LOG_DIR = path.join(TEST_DIR, 'test_logs/exampleSimLogDirs/HM-14.0')
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.cache = ParseCache(path.join(self.temp_dir.name, 'cache', 'parse_cache.sqlite'))
+
+        # copy some logs, to be able to modify them
+        self.log_paths = []
+        for qp in [28, 32, 36, 40]:
+            log_path = path.join(LOG_DIR, 'HOMC1noHODS0LDP-BQSquare_416x240_60_encoder+lowdelay+P+main_FTBE100_QP%d_enc.log'
+                                 % qp)
+            self.log_paths.append(copy(log_path, self.temp_dir.name))
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_get_stored_items(self):
+        log_path = self.log_paths[0]
+        self.assertIsNone(self.cache.get(log_path))
+
+        item = EncoderLogs.EncLogHM(log_path)
+        self.cache.put(log_path, [item])
+        cached_items = self.cache.get(log_path)
+
+        self.assertEqual(len(cached_items), 1)
+        self.assertIsInstance(cached_items[0], EncoderLogs.EncLogHM)
+        self.assertEqual(cached_items[0].path, item.path)
+        self.assertEqual(cached_items[0].summary_data, item.summary_data)
+        self.assertEqual(cached_items[0].temporal_data, item.temporal_data)
+        self.assertEqual(cached_items[0].log_config, item.log_config)
+
+    def test_items_are_persistent(self):
+        log_path = self.log_paths[0]
+        self.cache.put(log_path, [EncoderLogs.EncLogHM(log_path)])
+        self.cache.close()
+
+        self.cache = ParseCache(path.join(self.temp_dir.name, 'cache', 'parse_cache.sqlite'))
+        self.assertIsNotNone(self.cache.get(log_path))
+
+    def test_modified_file_is_not_taken_from_cache(self):
+        log_path = self.log_paths[0]
+        self.cache.put(log_path, [EncoderLogs.EncLogHM(log_path)])
+
+        utime(log_path, ns=(0, 0))
+        self.assertIsNone(self.cache.get(log_path))
+
+    def test_changed_parser_version_is_not_taken_from_cache(self):
+        log_path = self.log_paths[0]
+        self.cache.put(log_path, [EncoderLogs.EncLogHM(log_path)])
+
+        parser_version = EncoderLogs.EncLogHM.parser_version
+        try:
+            EncoderLogs.EncLogHM.parser_version = parser_version + 1
+            self.assertIsNone(self.cache.get(log_path))
+        finally:
+            EncoderLogs.EncLogHM.parser_version = parser_version
+
+    def test_least_recently_used_items_are_evicted(self):
+        items = [EncoderLogs.EncLogHM(log_path) for log_path in self.log_paths]
+        self.cache.put(self.log_paths[0], [items[0]])
+        item_size = self.cache._total_size
+        # space for three items
+        self.cache.max_size = 3.5 * item_size
+
+        self.cache.put(self.log_paths[1], [items[1]])
+        self.cache.put(self.log_paths[2], [items[2]])
+        self.assertIsNotNone(self.cache.get(self.log_paths[0]))
+        self.cache.put(self.log_paths[3], [items[3]])
+
+        self.assertIsNotNone(self.cache.get(self.log_paths[0]))
+        self.assertIsNone(self.cache.get(self.log_paths[1]))
+        self.assertIsNotNone(self.cache.get(self.log_paths[2]))
+        self.assertIsNotNone(self.cache.get(self.log_paths[3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
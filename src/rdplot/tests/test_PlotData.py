@@ -0,0 +1,37 @@
+import unittest
+
+from rdplot.SimulationDataItem import PlotData
+
+
+class TestPlotData(unittest.TestCase):
+    def test_values_are_converted_to_floats(self):
+        plot_data = PlotData(['seq', 'config'], [(2, '31.5'), (1, '30.25')], ['Temporal', 'Y-PSNR'])
+
+        self.assertEqual(plot_data.values, [(2.0, 31.5), (1.0, 30.25)])
+        self.assertEqual(plot_data.array.dtype, float)
+        self.assertFalse(plot_data.has_ci)
+
+    def test_sorted_array_is_updated_with_values(self):
+        plot_data = PlotData(['seq', 'config'], [(3, 33), (1, 31), (2, 32), (1, 30)])
+        self.assertEqual(plot_data.sorted_array.tolist(), [[1, 31], [1, 30], [2, 32], [3, 33]])
+
+        plot_data.extend([(0, 29)])
+        self.assertEqual(plot_data.sorted_array[:, 0].tolist(), [0, 1, 1, 2, 3])
+
+        plot_data.values = [(5, 35), (4, 34)]
+        self.assertEqual(plot_data.sorted_array.tolist(), [[4, 34], [5, 35]])
+
+    def test_confidence_interval(self):
+        plot_data = PlotData(['seq', 'config'], [(1000, 35.1, 0.2), (500, 32.4, 0.3)])
+
+        self.assertTrue(plot_data.has_ci)
+        self.assertEqual(plot_data.sorted_array[:, 2].tolist(), [0.3, 0.2])
+
+    def test_arrays_are_read_only(self):
+        plot_data = PlotData(['seq', 'config'], [(1, 30), (2, 31)])
+        with self.assertRaises(ValueError):
+            plot_data.array[0, 1] = 0
+
+
+if __name__ == '__main__':
+    unittest.main()
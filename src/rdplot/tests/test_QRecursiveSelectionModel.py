@@ -0,0 +1,123 @@
+import gc
+import random
+import sys
+import unittest
+
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QItemSelectionModel
+
+
+class TestQRecursiveSelectionModel(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication(sys.argv)
+        # the model module sets up matplotlib for qt, which requires the
+        # application
+        from rdplot.model import VariableTreeModel
+        from rdplot.view import QRecursiveSelectionModel
+
+        self.model = VariableTreeModel()
+        for sequence in range(3):
+            for config in range(4):
+                for qp in range(5):
+                    self.model.create_path('seq%d' % sequence, 'config%d' % config, 'QP%d' % qp)
+        self.model.items_changed.emit()
+        self.selection_model = QRecursiveSelectionModel(self.model)
+
+    def tearDown(self):
+        # the models and their items have to be deleted before the application
+        del self.selection_model
+        del self.model
+        gc.collect()
+        self.app.exit()
+
+    def get_index(self, *path):
+        return self.model._get_index_from_item(self.model.get_item_from_path(*path))
+
+    def get_sub_items(self, *path):
+        items = []
+        items_to_walk = [self.model.get_item_from_path(*path)]
+        while items_to_walk:
+            item = items_to_walk.pop()
+            items.append(item)
+            items_to_walk.extend(item.children)
+        return items
+
+    def assert_selected_items(self, items):
+        self.assertEqual({id(item) for item in self.selection_model.selected_items()},
+                         {id(item) for item in items})
+        self.assertEqual(len(self.selection_model.selected_items()), len(items))
+
+    def test_sub_items_share_selection(self):
+        self.selection_model.select(self.get_index('seq1'), QItemSelectionModel.Select)
+
+        # only the index itself is stored in the selection
+        self.assertEqual(len(self.selection_model.selectedIndexes()), 1)
+        self.assert_selected_items(self.get_sub_items('seq1'))
+        self.assertTrue(self.selection_model.is_recursively_selected(self.get_index('seq1', 'config2', 'QP3')))
+        self.assertFalse(self.selection_model.is_recursively_selected(self.get_index('seq0', 'config2', 'QP3')))
+
+    def test_expanded_indexes_have_explicit_selection(self):
+        self.selection_model.select(self.get_index('seq1'), QItemSelectionModel.Select)
+        self.selection_model.expand(self.get_index('seq1', 'config2'))
+
+        self.assertTrue(self.selection_model.isSelected(self.get_index('seq1', 'config2')))
+        self.assertTrue(self.selection_model.isSelected(self.get_index('seq1', 'config2', 'QP3')))
+        self.assertFalse(self.selection_model.isSelected(self.get_index('seq1', 'config1', 'QP3')))
+        self.assert_selected_items(self.get_sub_items('seq1'))
+
+        # the selection of expanded sub items changes with their parent
+        self.selection_model.select(self.get_index('seq1'), QItemSelectionModel.Deselect)
+        self.assertFalse(self.selection_model.isSelected(self.get_index('seq1', 'config2', 'QP3')))
+        self.assert_selected_items([])
+
+    def test_deselect_sub_item(self):
+        self.selection_model.select(self.get_index('seq1'), QItemSelectionModel.Select)
+        self.selection_model.select(self.get_index('seq1', 'config2'), QItemSelectionModel.Deselect)
+
+        items = self.get_sub_items('seq1')
+        removed_ids = {id(item) for item in self.get_sub_items('seq1', 'config2')}
+        self.assert_selected_items([item for item in items if id(item) not in removed_ids])
+
+    def test_inserted_rows_are_selected(self):
+        self.selection_model.expand(self.get_index('seq1'))
+        self.selection_model.select(self.get_index('seq1'), QItemSelectionModel.Select)
+        signals = []
+        self.selection_model.selectionChanged.connect(lambda selected, deselected: signals.append(selected))
+
+        # below an expanded and an unexpanded parent
+        self.model.create_path('seq1', 'config9', 'QP0')
+        self.model.create_path('seq1', 'config0', 'QP9')
+        self.model.create_path('seq0', 'config9', 'QP0')
+        self.model.items_changed.emit()
+
+        self.assertEqual(len(signals), 1)
+        self.assertTrue(self.selection_model.isSelected(self.get_index('seq1', 'config9')))
+        self.assertFalse(self.selection_model.is_recursively_selected(self.get_index('seq0', 'config9')))
+        self.assert_selected_items(self.get_sub_items('seq1'))
+
+    def test_random_selections(self):
+        # compare with the selection of all sub items one by one
+        random.seed(0)
+        paths = [('seq0',), ('seq1',), ('seq1', 'config1'), ('seq2', 'config3'),
+                 ('seq0', 'config0', 'QP0'), ('seq2', 'config3', 'QP4')]
+        selected = {}
+        for _ in range(100):
+            path = random.choice(paths)
+            if random.random() < 0.3:
+                self.selection_model.expand(self.get_index(*path))
+                continue
+            command = random.choice([QItemSelectionModel.Select, QItemSelectionModel.Deselect,
+                                     QItemSelectionModel.ClearAndSelect])
+            self.selection_model.select(self.get_index(*path), command)
+            if command == QItemSelectionModel.ClearAndSelect:
+                selected = {}
+            for item in self.get_sub_items(*path):
+                if command == QItemSelectionModel.Deselect:
+                    selected.pop(id(item), None)
+                else:
+                    selected[id(item)] = item
+            self.assert_selected_items(selected.values())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import pickle
+import unittest
+
+import jsonpickle
+
+from rdplot.SimulationDataItemClasses.EncoderLogs import TemporalData
+
+
+class TestTemporalData(unittest.TestCase):
+    def test_columns_are_accessed_as_pairs(self):
+        temporal_data = TemporalData({'Bits': [1200, 800], 'Y-PSNR': [35.5, 34.25]})
+
+        self.assertEqual(sorted(temporal_data), ['Bits', 'Y-PSNR'])
+        self.assertEqual(temporal_data['Bits'], [(0, 1200), (1, 800)])
+        self.assertEqual(temporal_data['Y-PSNR'], [(0, 35.5), (1, 34.25)])
+        self.assertIsInstance(temporal_data['Bits'][0][1], int)
+
+    def test_from_pairs_converts_strings(self):
+        temporal_data = TemporalData.from_pairs({'Y-PSNR': [(3, '35.5'), (4, '34.25')]})
+
+        self.assertIsInstance(temporal_data, TemporalData)
+        self.assertEqual(temporal_data['Y-PSNR'], [(3, 35.5), (4, 34.25)])
+
+    def test_from_pairs_keeps_columns_with_different_frames(self):
+        pairs = {'Bits': [(0, 1200)], 'Y-PSNR': [(1, 35.5)]}
+        self.assertIs(TemporalData.from_pairs(pairs), pairs)
+
+    def test_serialization(self):
+        # The module may have been imported again by loading the parser
+        # classes, and pickle requires the current class
+        from rdplot.SimulationDataItemClasses.EncoderLogs import TemporalData
+        temporal_data = TemporalData({'Y-PSNR': [35.5, 34.25]})
+
+        self.assertEqual(dict(pickle.loads(pickle.dumps(temporal_data))), dict(temporal_data))
+        # rd files contain a plain dict of pairs
+        decoded = jsonpickle.decode(jsonpickle.encode(temporal_data))
+        self.assertEqual(decoded, {'Y-PSNR': [(0, 35.5), (1, 34.25)]})
+
+
+if __name__ == '__main__':
+    unittest.main()
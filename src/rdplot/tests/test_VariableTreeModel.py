@@ -0,0 +1,69 @@
+import unittest
+import sys
+from os import path, listdir
+from PyQt5 import QtWidgets
+
+from rdplot.SimulationDataItem import dict_tree_from_sim_data_items
+from rdplot.SimulationDataItemClasses import EncoderLogs
+
+# path to test module (this file)
+TEST_DIR = path.dirname(path.abspath(__file__))
+
+LOG_DIR = path.join(TEST_DIR, 'test_logs/exampleSimLogDirs/HM-14.0')
+
+
+def plot_data_by_path(dict_tree, keys=()):
+    """Flatten a tree of dicts with lists of PlotData objects at the leafs"""
+    # the dict tree of an empty model is the value list of the root item
+    if not isinstance(dict_tree, dict):
+        return
+    for key, item in dict_tree.items():
+        if isinstance(item, dict):
+            yield from plot_data_by_path(item, keys + (key,))
+        elif isinstance(item, list):
+            yield keys + (key,), [(plot_data.identifiers, plot_data.values, plot_data.label) for plot_data in item]
+
+
+class TestVariableTreeModel(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication(sys.argv)
+        # the model module sets up matplotlib for qt, which requires the
+        # application
+        from rdplot.model import VariableTreeModel
+
+        log_paths = sorted(path.join(LOG_DIR, file_name) for file_name in listdir(LOG_DIR)
+                           if file_name.endswith('_enc.log'))
+        self.items = [EncoderLogs.EncLogHM(log_path) for log_path in log_paths]
+        self.model = VariableTreeModel()
+
+    def tearDown(self):
+        self.app.exit()
+
+    def assert_model_equals_dict_tree(self, sim_data_items):
+        expected = dict(plot_data_by_path(dict_tree_from_sim_data_items(sim_data_items)))
+        actual = dict(plot_data_by_path(self.model.root.dict_tree))
+        self.assertEqual(actual.keys(), expected.keys())
+        for keys in expected:
+            # PlotData objects of a leaf are compared independent of the order
+            self.assertCountEqual(actual[keys], expected[keys])
+
+    def test_update_from_sim_data_items(self):
+        # add and remove items in steps, with items of the same config before
+        # and after the changed items
+        for selection in [self.items[:2], self.items[:5], self.items[1:6], self.items[3:4], self.items, []]:
+            self.model.update_from_sim_data_items(selection)
+            self.assert_model_equals_dict_tree(selection)
+
+    def test_unchanged_tree_items_are_preserved(self):
+        self.model.update_from_sim_data_items(self.items[:2])
+        item = self.model.get_item_from_path('EncLogHM', 'Summary', 'SUMMARY', 'Y-PSNR')
+        plot_data = item.values[0]
+
+        self.assertTrue(self.model.update_from_sim_data_items(self.items[:3]))
+        self.assertIs(self.model.get_item_from_path('EncLogHM', 'Summary', 'SUMMARY', 'Y-PSNR'), item)
+        self.assertIs(item.values[0], plot_data)
+        self.assertFalse(self.model.update_from_sim_data_items(self.items[:3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,22 +1,23 @@
-import unittest
+import os
+import subprocess
 import sys
-from rdplot.lib.BD import bjontegaard
-from PyQt5 import QtWidgets
+import unittest
+
+import numpy as np
+import rdplot
+from rdplot.lib.BD import bjontegaard, bjontegaard_batch, bdrateStd, fit_bd_curves, LruCache, bd_fit_cache, \
+    bd_result_cache
 
 
 class TestBD(unittest.TestCase):
 
     def setUp(self):
         # set up inputs and outputs
-        self.app = QtWidgets.QApplication(sys.argv)
         self.curve1 = [(937.0112, 45.5074), (1405.4792, 47.0002), (3438.7128, 49.9565), (6448.6368, 52.1459)]
         self.curve2 = [(822.0064, 45.7215), (1608.9144, 47.6227), (3086.912, 50.1394), (5784.7696, 52.3339)]
         self.output_rate = -11.502942790194147
         self.output_dsnr = 0.406082378790395
 
-    def tearDown(self):
-        self.app.exit()
-
     def testBjontegaard(self):
         with self.subTest(mode='drate'):
             self.assertAlmostEqual(bjontegaard(self.curve1, self.curve2, mode='drate', testmode=True), self.output_rate,
@@ -25,6 +26,116 @@ class TestBD(unittest.TestCase):
             self.assertAlmostEqual(bjontegaard(self.curve1, self.curve2, mode='dsnr', testmode=True), self.output_dsnr,
                                    delta=0.01)
 
+    def testBjontegaardPchip(self):
+        with self.subTest(mode='drate'):
+            self.assertAlmostEqual(bjontegaard(self.curve1, self.curve2, mode='drate', interpol='pchip',
+                                               testmode=True), -11.374, delta=0.001)
+        with self.subTest(mode='dsnr'):
+            self.assertAlmostEqual(bjontegaard(self.curve1, self.curve2, mode='dsnr', interpol='pchip',
+                                               testmode=True), 0.4061, delta=0.0001)
+
+    def testJvetCubic(self):
+        (rate1, psnr1) = zip(*self.curve1)
+        (rate2, psnr2) = zip(*self.curve2)
+        self.assertAlmostEqual(bdrateStd(rate1, psnr1, rate2, psnr2), -11.374, delta=0.001)
+        self.assertAlmostEqual(bjontegaard(self.curve1, self.curve2, mode='drate', interpol='jvet', testmode=True),
+                               -11.374, delta=0.001)
+
+        # eight rate points, where the psnr is linear in the logarithmic
+        # rate, so the deltas of shifted rates are known exactly
+        rates = np.geomspace(200, 20000, 8)
+        curve1 = list(zip(rates, 28 + 10 * np.log10(rates)))
+        curve2 = list(zip(rates * 0.9, 28 + 10 * np.log10(rates)))
+        expected = {'drate': -10, 'dsnr': -10 * np.log10(0.9)}
+        for (mode, delta) in expected.items():
+            with self.subTest(mode=mode):
+                self.assertAlmostEqual(bjontegaard(curve1, curve2, mode, 'jvet', testmode=True), delta)
+                fits = fit_bd_curves([curve1, curve2], mode, 'jvet')
+                self.assertAlmostEqual(bjontegaard_batch(fits, 0, fits, 1, mode), delta)
+
+    def testBjontegaardBatch(self):
+        curves = [self.curve1, self.curve2, None, self.curve2[:3], [(r * 1.1, p) for (r, p) in self.curve1]]
+        for mode in ['drate', 'dsnr']:
+            for interpol in ['pol', 'pchip', 'jvet']:
+                fits = fit_bd_curves(curves, mode, interpol)
+                deltas = bjontegaard_batch(fits, np.array([[0], [1]]), fits, np.arange(len(curves)), mode)
+                with self.subTest(mode=mode, interpol=interpol):
+                    self.assertEqual(deltas.shape, (2, 5))
+                    self.assertAlmostEqual(deltas[0, 0], 0)
+                    self.assertTrue(np.isnan(deltas[:, 2:4]).all())
+                    if mode == 'dsnr':
+                        self.assertAlmostEqual(deltas[0, 1], -deltas[1, 0])
+                    else:
+                        self.assertAlmostEqual((1 + deltas[0, 1] / 100) * (1 + deltas[1, 0] / 100), 1)
+                    for (anchor, curve) in [(0, 1), (0, 4), (1, 4)]:
+                        self.assertAlmostEqual(
+                            deltas[anchor, curve],
+                            bjontegaard(curves[anchor], curves[curve], mode, interpol, testmode=True),
+                            delta=1e-8
+                        )
+
+    def testBjontegaardBatchWithLessPoints(self):
+        curves = [self.curve1[:3], self.curve2[1:], self.curve2[:2]]
+        for mode in ['drate', 'dsnr']:
+            for interpol in ['pol', 'pchip', 'jvet']:
+                fits = fit_bd_curves(curves, mode, interpol, min_points=1)
+                deltas = bjontegaard_batch(fits, 0, fits, np.arange(len(curves)), mode)
+                with self.subTest(mode=mode, interpol=interpol):
+                    for curve in range(1, len(curves)):
+                        expected = bjontegaard(curves[0], curves[curve], mode, interpol, testmode=True)
+                        if np.isnan(expected):
+                            # pchip and jvet need three points
+                            self.assertTrue(np.isnan(deltas[curve]))
+                        else:
+                            self.assertAlmostEqual(deltas[curve], expected, delta=1e-8)
+
+    def testLruCache(self):
+        cache = LruCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.get('a'), 1)
+        # 'b' is the least recently used entry now
+        cache['c'] = 3
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+    def testCachedResults(self):
+        bd_result_cache.clear()
+        bd_fit_cache.clear()
+
+        result = bjontegaard(self.curve1, self.curve2, mode='drate', testmode=True)
+        self.assertEqual(len(bd_result_cache), 1)
+        # equal curves hit the cache, other options do not
+        self.assertEqual(bjontegaard(list(self.curve1), np.array(self.curve2), mode='drate', testmode=True), result)
+        self.assertEqual(len(bd_result_cache), 1)
+        bjontegaard(self.curve1, self.curve2, mode='dsnr', testmode=True)
+        self.assertEqual(len(bd_result_cache), 2)
+
+        fits = fit_bd_curves([self.curve1, self.curve2], 'drate', 'pchip')
+        self.assertEqual(len(bd_fit_cache), 2)
+        cached_fits = fit_bd_curves([self.curve2, None, self.curve1], 'drate', 'pchip')
+        self.assertEqual(len(bd_fit_cache), 2)
+        np.testing.assert_array_equal(cached_fits.coefficients[[2, 0]], fits.coefficients)
+
+    def testHeadlessImport(self):
+        # the bd calculation must not import qt or matplotlib, so it can be
+        # used without a display
+        code = 'import sys, rdplot.lib.BD; print(sorted({"PyQt5", "matplotlib", "scipy"} & set(sys.modules)))'
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(rdplot.__file__)))
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), '[]')
+
+    def testPlotFunction(self):
+        plots = []
+        plot = lambda seq, directories, mode, *plot_data: plots.append((seq, directories, mode, plot_data[-1]))
+        result = bjontegaard(self.curve1, self.curve2, 'drate', 'pchip', 'BD Plot', ['a', 'b'], plot=plot)
+        self.assertEqual(plots, [('BD Plot', ['a', 'b'], 'drate', result)])
+        # nothing is plotted in testmode
+        bjontegaard(self.curve1, self.curve2, 'dsnr', 'pchip', 'BD Plot', ['a', 'b'], testmode=True, plot=plot)
+        self.assertEqual(len(plots), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -38,5 +38,50 @@ class TestCsvLogs(unittest.TestCase):
                     self.assertTrue(isinstance(config, str))
                     self.assertTrue(isinstance(float(qp), float))
 
+    def test_values_of_example_csvs(self):
+        csv_dir = path.join(TEST_DIR, 'test_logs/exampleCsv')
+        # number of lines, and the first and the last item of each file
+        expected = {
+            'CSV/HDR-HLG_HM-16.22.csv': (54, [
+                ('RiverByBoat', '20', {'y-psnr': [(251845.108, 39.97341217)], 'u-psnr': [(251845.108, 41.39445233)],
+                                       'v-psnr': [(251845.108, 43.34404117)]}),
+                ('WaterFallWide', '46', {'y-psnr': [(1807.9432, 25.2193955)], 'u-psnr': [(1807.9432, 38.40795083)],
+                                         'v-psnr': [(1807.9432, 43.355178)]}),
+            ]),
+            'CSV/HDR-HLG_VTM-11.0.csv': (14, [
+                ('RiverByBoat', '22', {'y-psnr': [(137294.5552, 38.62607542)],
+                                       'u-psnr': [(137294.5552, 40.93562588)],
+                                       'v-psnr': [(137294.5552, 43.40527741)]}),
+                ('WaterFallWide', '46', {'y-psnr': [(1460.0632, 25.5267598)], 'u-psnr': [(1460.0632, 39.45618548)],
+                                         'v-psnr': [(1460.0632, 44.29043916)]}),
+            ]),
+            'CSV_CI/test_ci1.csv': (24, [
+                ('Sequence01', '27', {'mos': [(15544.26, 7.65, 0.31)]}),
+                ('Sequence06', '40', {'mos': [(678.06, 2.53, 0.55)]}),
+            ]),
+            'CSV_CI/test_ci2.csv': (24, [
+                ('Sequence01', '23', {'mos': [(10620.9, 7.35, 0.24)]}),
+                ('Sequence06', '33', {'mos': [(647.1, 3.02, 0.57)]}),
+            ]),
+        }
+        for csv_name, (item_count, expected_items) in expected.items():
+            with self.subTest(csv_name=csv_name):
+                with open(path.join(csv_dir, csv_name)) as csv_file:
+                    items = CsvLogs.CSVLog.from_csv_text('config', csv_file.read())
+                self.assertEqual(len(items), item_count)
+                for item, (sequence, qp, summary_data) in zip([items[0], items[-1]], expected_items):
+                    self.assertEqual((item.sequence, item.qp), (sequence, qp))
+                    self.assertEqual(item.summary_data, summary_data)
+
+    def test_missing_and_invalid_values(self):
+        text = 'Sequence;QP;Bitrate;MOS;MOS-CI;PSNR\nA;22;100;7.5;0.3;40\nA;27;50;bad;0.2;x\nA;32;25;6.5\n'
+        items = CsvLogs.CSVLog.from_csv_text('config', text)
+        self.assertEqual(items[0].summary_data, {'mos': [(100.0, 7.5, 0.3)], 'psnr': [(100.0, 40.0)]})
+        self.assertEqual(repr(items[1].summary_data), repr({'mos': [(50.0, float('nan'), float('nan'))],
+                                                            'psnr': [(50.0, float('nan'))]}))
+        # values missing at the end of a line are skipped
+        self.assertEqual(items[2].summary_data, {})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,10 @@ from PyQt5.QtTest import QTest
 from PyQt5 import QtWidgets
 from rdplot.Widgets.MainWindow import MainWindow
 
+# The main window opens the parse cache in the cache directory of the user.
+# Use the test locations of Qt instead, so the tests do not touch the cache.
+QtCore.QStandardPaths.setTestModeEnabled(True)
+
 # from time import sleep
 # 
 # TEST_DIR = path.dirname(path.abspath(__file__))
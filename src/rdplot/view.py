@@ -18,7 +18,9 @@
 #
 ##################################################################################################
 import json
+import sqlite3
 from collections import deque
+from os import cpu_count
 from os.path import isdir, abspath, sep, dirname, isfile, join, splitext
 import jsonpickle
 from PyQt5 import QtWidgets
@@ -29,7 +31,10 @@ from PyQt5.QtGui import *
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QMessageBox, QMenu, QListView
 
-from rdplot.SimulationDataItem import SimulationDataItemFactory, SimulationDataItemError
+from rdplot.SimulationDataItem import (SimulationDataItemFactory, SimulationDataItemError, open_file,
+                                      strip_compression_extension, is_archive)
+from rdplot.lib.FileFilter import FileFilter
+from rdplot.lib.ParseCache import ParseCache
 from rdplot.model import AmbiguousSimDataItems
 
 # Path to the folder containing simulation data sub classes. The classes
@@ -38,10 +43,67 @@ here = abspath(dirname(__file__))
 SIMULATION_DATA_ITEM_CLASSES_PATH = here + sep + "SimulationDataItemClasses"
 
 
+def create_parse_cache(settings):
+    """Create the parse cache in the cache directory of the user. The maximal
+    size in MiB is given by the setting *parser/cacheSize*, 0 disables the cache.
+
+    :rtype: :class: `ParseCache` or None
+    """
+    max_size = int(settings.value('parser/cacheSize', 512))
+    if max_size <= 0:
+        return None
+    cache_path = join(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation),
+                      'rdplot', 'parse_cache.sqlite')
+    try:
+        return ParseCache(cache_path, max_size * 1024 ** 2)
+    except (OSError, sqlite3.Error) as error:
+        print("Could not open parse cache at '{}' due to {}".format(cache_path, error))
+        return None
+
+
+def create_file_filter(settings):
+    """Create the filter for the files of opened directories from the
+    settings *parser/includePatterns* and *parser/excludePatterns*, which are
+    lists of glob patterns separated by ';', *parser/maxDirectoryDepth*
+    (default 0, i.e. sub directories are not searched, -1 searches all) and
+    *parser/maxFileSize* in MiB (default 512, 0 disables the limit).
+
+    :rtype: :class: `FileFilter`
+    """
+    def split_patterns(value):
+        # lists written by QSettings are read as lists
+        if isinstance(value, list):
+            value = ';'.join(value)
+        return [pattern.strip() for pattern in value.split(';') if pattern.strip()]
+
+    include_patterns = split_patterns(settings.value('parser/includePatterns', '*'))
+    exclude_patterns = split_patterns(settings.value('parser/excludePatterns',
+                                                     ';'.join(FileFilter.default_exclude_patterns)))
+    max_depth = int(settings.value('parser/maxDirectoryDepth', 0))
+    max_file_size = int(settings.value('parser/maxFileSize', 512))
+    return FileFilter(include_patterns, exclude_patterns,
+                      max_depth if max_depth >= 0 else None,
+                      max_file_size * 1024 ** 2 if max_file_size > 0 else None)
+
+
 class ParserWorkThread(QThread):
+    """Parses the paths added by :func: `add_path`. Files of directories are
+    parsed in parallel by a pool of worker processes. The parsed items are
+    emitted in batches via *newParsedData*.
+
+    *parsingStarted* is emitted, before the items of the added paths are
+    emitted.
+
+    The number of processes and the batch size can be configured with the
+    settings *parser/processCount* (default: number of cores) and
+    *parser/batchSize*. Items of unchanged files are loaded from the parse
+    cache, see :func: `create_parse_cache`. The files of directories are
+    selected as configured in the settings, see :func: `create_file_filter`.
+    """
     newParsedData = pyqtSignal([list])
     allParsed = pyqtSignal()
     parsingError = pyqtSignal()
+    parsingStarted = pyqtSignal()
 
     def __init__(self, path_list=None):
         QThread.__init__(self)
@@ -54,6 +116,12 @@ class ParserWorkThread(QThread):
             path_list = []
         self.path_list = path_list
 
+        settings = QSettings()
+        self.process_count = int(settings.value('parser/processCount', cpu_count() or 1))
+        self.batch_size = int(settings.value('parser/batchSize', 500))
+        self._factory.parse_cache = create_parse_cache(settings)
+        self._factory.file_filter = create_file_filter(settings)
+
         self._factory.parsingError.connect(self.relay_error)
 
     def __del__(self):
@@ -63,23 +131,59 @@ class ParserWorkThread(QThread):
         self.path_list.append(path)
 
     def run(self):
-        for path in self.path_list:
+        self.parsingStarted.emit()
+        parser_pool = None
+        if self.process_count > 1:
+            parser_pool = self._factory.create_parser_pool(self.process_count)
+
+        try:
+            for path in self.path_list:
+                if self._parse_path(path, parser_pool) is False:
+                    self.newParsedData.emit([])
+                    self.path_list.clear()
+                    return
+        finally:
+            if parser_pool is not None:
+                parser_pool.shutdown(cancel_futures=True)
+            if self._factory.parse_cache is not None:
+                self._factory.parse_cache.flush()
+
+        self.path_list.clear()
+        self.allParsed.emit()
+
+    def _parse_path(self, path, parser_pool):
+        """Parse *path* and emit the parsed items. Returns False, if not at
+        least one item could be created"""
+        if not isdir(path) and not is_archive(path):
             try:
                 sim_data_items = self._factory.create_item_list_from_path(path)
                 print("Parsed '{}' ".format(path))
             except SimulationDataItemError as error:
-                self.newParsedData.emit([])
-                self.path_list.clear()
-
                 # print((
                 #    "Could not create simulation data item from file '{}'"
                 #    " due to {}"
                 # ).format(path, error))
-                return
+                return False
+            self.newParsedData.emit(sim_data_items)
+            return True
 
+        # emit the items of directories and archives in batches, while the
+        # remaining files are still parsed
+        if isdir(path):
+            item_lists = self._factory.iter_item_lists_from_directory(path, parser_pool)
+        else:
+            item_lists = self._factory.iter_item_lists_from_archive(path, parser_pool)
+        sim_data_items = []
+        is_any_item_parsed = False
+        for item_list in item_lists:
+            sim_data_items.extend(item_list)
+            is_any_item_parsed = True
+            if len(sim_data_items) >= self.batch_size:
+                self.newParsedData.emit(sim_data_items)
+                sim_data_items = []
+        if sim_data_items:
             self.newParsedData.emit(sim_data_items)
-        self.path_list.clear()
-        self.allParsed.emit()
+        return is_any_item_parsed
 
     def relay_error(self):
         self.parsingError.emit()
@@ -97,6 +201,7 @@ class ParserWorkNoThread(QObject):
     newParsedData = pyqtSignal([list])
     allParsed = pyqtSignal()
     parsingError = pyqtSignal()
+    parsingStarted = pyqtSignal()
 
     def __init__(self, path_list=None):
         QObject.__init__(self)
@@ -109,6 +214,13 @@ class ParserWorkNoThread(QObject):
             path_list = []
         self.path_list = path_list
 
+        # parse in this process only, worker processes cannot be debugged either
+        settings = QSettings()
+        self.process_count = 1
+        self.batch_size = int(settings.value('parser/batchSize', 500))
+        self._factory.parse_cache = create_parse_cache(settings)
+        self._factory.file_filter = create_file_filter(settings)
+
         self._factory.parsingError.connect(self.relay_error)
 
     def __del__(self):
@@ -117,24 +229,9 @@ class ParserWorkNoThread(QObject):
     def add_path(self, path):
         self.path_list.append(path)
 
-    def run(self):
-        for path in self.path_list:
-            try:
-                sim_data_items = self._factory.create_item_list_from_path(path)
-                print("Parsed '{}' ".format(path))
-            except SimulationDataItemError as error:
-                self.newParsedData.emit([])
-                self.path_list.clear()
-
-                # print((
-                #    "Could not create simulation data item from file '{}'"
-                #    " due to {}"
-                # ).format(path, error))
-                return
-
-            self.newParsedData.emit(sim_data_items)
-        self.path_list.clear()
-        self.allParsed.emit()
+    # parsing is done like in the threaded version
+    run = ParserWorkThread.run
+    _parse_path = ParserWorkThread._parse_path
 
     def relay_error(self):
         self.parsingError.emit()
@@ -156,6 +253,7 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
         self.parserThread = ParserWorkThread()
         # helpful for debugging, when breakpoints don't work because of threading
         # self.parserThread = ParserWorkNoThread()
+        self.parserThread.parsingStarted.connect(self._reset_log_config_tables)
         self.parserThread.newParsedData.connect(self._update_model)
         self.parserThread.allParsed.connect(self._hide_parse_message)
         self.msg = QMessageBox(self)  # use self as parent here
@@ -191,10 +289,10 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
                 try:
                     # check what kind of file we have.
                     # process .rd with load_rd_data, .xml and .log with the parsers
-                    name, file_ending = splitext(file_path)
+                    name, file_ending = splitext(strip_compression_extension(file_path))
                     if file_ending == '.rd':
                         self.load_rd_data(str(file_path))
-                    elif file_ending == '.log' or file_ending == '.xml' or file_ending == '.csv':
+                    elif file_ending == '.log' or file_ending == '.xml' or file_ending == '.csv' or is_archive(file_path):
                         self.parserThread.add_path(str(file_path))
                         self.parserThread.start()
                 except json.decoder.JSONDecodeError:
@@ -241,7 +339,9 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
                 self,
                 "Open Sequence Encoder Log",
                 "/home/ient/Software/rd-plot-gui/exampleLogs",
-                "All Logs (*.log *.xml *.rd);;Encoder Logs (*.log);;Dat Logs (*.xml);; RD Data (*.rd)")
+                "All Logs (*.log *.xml *.rd *.gz *.xz *.bz2 *.tar *.tgz *.zip);;"
+                "Encoder Logs (*.log *.log.gz *.log.xz *.log.bz2);;Dat Logs (*.xml *.xml.gz *.xml.xz *.xml.bz2);;"
+                "Archives (*.tar *.tar.gz *.tgz *.tar.xz *.tar.bz2 *.zip);; RD Data (*.rd)")
 
             # magic: split returned list of files into lists of directories and file names
             directories, file_names = zip(*[file.rsplit('/', 1) for file in result[0]])
@@ -274,10 +374,11 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
                 # check what kind of file we have.
                 # process .rd with load_rd_data, .xml and .log with the parsers
                 path = join(directory, file_name)
-                file_ending = file_name.rsplit('.', maxsplit=1)[1]
+                # compressed logs are handled like uncompressed ones
+                file_ending = strip_compression_extension(file_name).rsplit('.', maxsplit=1)[1]
                 if file_ending == 'rd':
                     self.load_rd_data(path)
-                elif file_ending == 'log' or file_ending == 'xml':
+                elif file_ending == 'log' or file_ending == 'xml' or is_archive(path):
                     self.parserThread.add_path(path)
             self.parserThread.start()
             self.itemsOpened.emit(list(map(lambda x, y: x+'/'+y, directories, file_names)), reload)
@@ -339,12 +440,18 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
 
     def load_rd_data(self, filename):
         """Loads rd data from file"""
-        f = open(filename, 'r')
+        f = open_file(filename, 'r')
         json_str = f.read()
         sim_data_items = jsonpickle.decode(json_str)
+        self._reset_log_config_tables()
         self._update_model(sim_data_items)
         f.close()
 
+    def _reset_log_config_tables(self):
+        # the parameters varying between the items are searched separately for
+        # each parser run and rd file
+        self.model().reset_log_config_tables()
+
     def _update_model(self, sim_data_items):
         if not sim_data_items:
             self._hide_parse_message()
@@ -393,20 +500,115 @@ class PlottedFilesListView(QtWidgets.QListView):
 
 class QRecursiveSelectionModel(QItemSelectionModel):
     """Custom selection model for recursive models. If an item is selected, all
-       sub items are automatically selected."""
+       sub items are automatically selected.
+
+       The sub items are not added to the selection one by one. Instead, the
+       selection of the children of an index is only stored explicitly, if the
+       index was expanded, see :func: `expand`. The children of all other
+       indexes share the selection of their parent. Thus, selecting the root of
+       a large tree only costs a few ranges. Note, that the *expanded* signal
+       of a tree view using this model has to be connected to :func: `expand`,
+       so the displayed indexes have an explicit selection. The items in the
+       selection are obtained by :func: `selected_items`, not by
+       `selectedIndexes`, which only returns the explicitly selected indexes.
+       The model is required to implement the *items_changed* signal and to
+       store tree items like :class: `OrderedDictTreeItem` as internal pointers.
+       """
 
     def __init__(self, model, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Persistent indexes of the expanded parents, whose children have an
+        # explicit selection
+        self._expanded_indexes = set()
+        # Ranges of rows inserted into the selection since the last
+        # *items_changed* signal, with explicit or with implicit selection
+        self._inserted_selection = QItemSelection()
+        self._inserted_implicit_selection = QItemSelection()
         self.setModel(model)
 
     def setModel(self, model):
         if self.model() is not None:
             self.model().items_changed.disconnect(self.select_inserted_rows)
+            self.model().rowsInserted.disconnect(self._add_inserted_rows)
+            self.model().modelReset.disconnect(self._expanded_indexes.clear)
         super().setModel(model)
+        self._expanded_indexes.clear()
         self.model().items_changed.connect(self.select_inserted_rows)
+        self.model().rowsInserted.connect(self._add_inserted_rows)
+        self.model().modelReset.connect(self._expanded_indexes.clear)
+
+    def is_expanded(self, q_index):
+        """Check if the children of *q_index* have an explicit selection. This
+           is always the case for the children of the root."""
+        return not q_index.isValid() or QPersistentModelIndex(q_index) in self._expanded_indexes
+
+    def is_recursively_selected(self, q_index):
+        """Check if *q_index* is selected, either explicitly or by the
+           selection of the parent, whose children share its selection."""
+        while q_index.isValid():
+            q_index_parent = q_index.parent()
+            if self.is_expanded(q_index_parent):
+                return self.isSelected(q_index)
+            q_index = q_index_parent
+        return False
+
+    def expand(self, q_index):
+        """Store the selection of the children of *q_index* explicitly. This is
+           required, if the children are displayed, and thus, has to be called
+           if *q_index* is expanded in a view. The parents of *q_index* are
+           expanded as well. The recursive selection does not change, thus, no
+           signal is emitted."""
+        if self.is_expanded(q_index):
+            return
+        self.expand(q_index.parent())
+
+        if self.is_recursively_selected(q_index) and self.model().rowCount(q_index) > 0:
+            # The children inherit the selection of the parent
+            selection = QItemSelection(
+                self.model().index(0, 0, q_index),
+                self.model().index(self.model().rowCount(q_index) - 1,
+                                   self.model().columnCount(q_index) - 1, q_index),
+            )
+            signals_blocked = self.blockSignals(True)
+            super().select(selection, QItemSelectionModel.Select)
+            self.blockSignals(signals_blocked)
+        self._expanded_indexes.add(QPersistentModelIndex(q_index))
+
+    def _add_inserted_rows(self, q_index_parent, first, last):
+        """Rows inserted below a selected parent are selected as well. They are
+           collected until the *items_changed* signal of the model."""
+        if not self.is_recursively_selected(q_index_parent):
+            return
+        q_range = QItemSelectionRange(
+            self.model().index(first, 0, q_index_parent),
+            self.model().index(last, self.model().columnCount(q_index_parent) - 1, q_index_parent),
+        )
+        if self.is_expanded(q_index_parent):
+            self._inserted_selection.append(q_range)
+        else:
+            self._inserted_implicit_selection.append(q_range)
 
     def select_inserted_rows(self):
-        self.select(self.selection(), QItemSelectionModel.Select)
+        """Select the rows, which were inserted below selected parents, and
+           emit a single *selectionChanged* signal for all of them."""
+        inserted_selection = QItemSelection()
+        for q_range in self._inserted_selection:
+            if q_range.isValid():
+                inserted_selection.append(q_range)
+        selection = QItemSelection()
+        selection.merge(inserted_selection, QItemSelectionModel.Select)
+        for q_range in self._inserted_implicit_selection:
+            if q_range.isValid():
+                selection.append(q_range)
+        self._inserted_selection = QItemSelection()
+        self._inserted_implicit_selection = QItemSelection()
+        if len(selection) == 0:
+            return
+
+        signals_blocked = self.blockSignals(True)
+        super().select(inserted_selection, QItemSelectionModel.Select)
+        self.blockSignals(signals_blocked)
+        self.selectionChanged.emit(selection, QItemSelection())
 
     def select(self, selection, command):
         """Extend behavior of inherited method. Add all sub items to selection
@@ -416,74 +618,83 @@ class QRecursiveSelectionModel(QItemSelectionModel):
             if not selection.isValid():
                 self.clearSelection()
                 return
-            indexes_selected = [selection]
             # If the selection is an index, a range only containing this index
             # has to be created
-            recursive_selection = QItemSelection()
-
-            q_index_parent = self.model().parent(selection)
-            q_index_first = selection
-            q_index_last = self.model().index(selection.row(),
-                                              selection.column(),
-                                              q_index_parent)
-            recursive_selection.select(q_index_first, q_index_last)
-
-        # Handle selections and single indexes
-        if isinstance(selection, QItemSelection):
-            indexes_selected = selection.indexes()
-            recursive_selection = selection
-
-        # Find index ranges of all sub items of the indexes in `selection`
-        index_ranges = self._get_sub_items_index_ranges(indexes_selected)
-        # Add the index ranges to the `selection`
-        for (q_index_1, q_index_2) in index_ranges:
-            # TODO Problem could be, that select leads to duplicates in the
-            # selection. So far, no problem arose. `merge` is no alternative
-            # as it does not support all `commands`
-            recursive_selection.select(q_index_1, q_index_2)
-
-        super().select(recursive_selection, command)
-
-    def _get_sub_items_index_ranges(self, q_index_parent_collection):
-        """Given a collection of indexes :param: `q_index_parent_collection`,
-           find the index ranges of all sub items for all indexes in the
-           collection. An index range corresponds to a tuple consisting of the
-           first and the last index in the range. Index ranges are used to
-           describe selections effectively."""
-        # `deque` is more efficient stack data structure
-        q_index_parent_queue = deque(q_index_parent_collection)
-
-        # Output queue with all index ranges found
-        index_ranges = deque()
-        while len(q_index_parent_queue) != 0:
-            q_index_parent = q_index_parent_queue.pop()
-
-            # Number of columns and rows of the current parent
+            selection = QItemSelection(selection, selection)
+
+        # The selection of the indexes has to be stored explicitly, if they
+        # share the selection of their parent so far
+        for q_range in selection:
+            self.expand(q_range.parent())
+
+        # Add the children of all expanded sub items to the selection. The
+        # children of the other sub items share the selection of their parent.
+        recursive_selection = QItemSelection()
+        recursive_selection.merge(selection, QItemSelectionModel.Select)
+        for q_index_parent in self._get_expanded_sub_items(selection):
             count_row = self.model().rowCount(q_index_parent)
             count_column = self.model().columnCount(q_index_parent)
-
-            # If the currently processed item contains items, then the index
-            # range describing these items has to be added to the output
-            # `index_ranges`, and the sub items have to be processed themselves.
-            # If the item has no sub items, then nothing has to be done, as its
-            # own index is already included in the index range specified by
-            # its own parent.
-            if count_row > 0 or count_column > 0:
-                # Append index range tuple to output `index_ranges`
-                row = count_row - 1
-                column = count_column - 1
-                index_ranges.append((
+            if count_row > 0 and count_column > 0:
+                recursive_selection.append(QItemSelectionRange(
                     self.model().index(0, 0, q_index_parent),
-                    self.model().index(row, column, q_index_parent),
+                    self.model().index(count_row - 1, count_column - 1, q_index_parent),
                 ))
-                # Append indexes of children to the queue `q_index_parent_queue`
-                for row in range(count_row):
-                    for column in range(count_column):
-                        q_index = self.model().index(row, column,
-                                                     q_index_parent)
-                        q_index_parent_queue.append(q_index)
-
-        return list(index_ranges)
+
+        super().select(recursive_selection, command)
+
+    def _get_expanded_sub_items(self, selection):
+        """Find the expanded indexes, which are contained by :param:
+           `selection` or are sub items of an index in the selection. As only
+           a few indexes are expanded, the parents of the expanded indexes are
+           looked up in the selection, instead of walking all sub items of the
+           selection."""
+        # Row ranges of the selection by their parent
+        row_ranges = {}
+        for q_range in selection:
+            row_ranges.setdefault(QPersistentModelIndex(q_range.parent()), []).append(
+                (q_range.top(), q_range.bottom()))
+
+        q_indexes = []
+        for q_persistent_index in list(self._expanded_indexes):
+            if not q_persistent_index.isValid():
+                # The index was removed from the model
+                self._expanded_indexes.discard(q_persistent_index)
+                continue
+            q_index = QModelIndex(q_persistent_index)
+            while q_index.isValid():
+                q_index_parent = q_index.parent()
+                if any(top <= q_index.row() <= bottom
+                       for (top, bottom) in row_ranges.get(QPersistentModelIndex(q_index_parent), [])):
+                    q_indexes.append(QModelIndex(q_persistent_index))
+                    break
+                q_index = q_index_parent
+        return q_indexes
+
+    def selected_items(self):
+        """Get all items in the recursive selection, ie. the items of the
+           explicitly selected indexes and all sub items sharing their
+           selection.
+
+           :rtype: :class: `list` of tree items
+           """
+        # Items of the expanded indexes, whose sub items are selected
+        # explicitly
+        expanded_item_ids = {id(QModelIndex(q_index).internalPointer()) for q_index in self._expanded_indexes
+                             if q_index.isValid()}
+
+        items = []
+        for q_index in self.selectedIndexes():
+            if q_index.column() != 0:
+                continue
+            # Walk the sub items of items, which are not expanded. Note, that
+            # the sub items of these items can not be expanded themselves.
+            items_to_walk = deque([q_index.internalPointer()])
+            while len(items_to_walk) != 0:
+                item = items_to_walk.pop()
+                items.append(item)
+                if id(item) not in expanded_item_ids:
+                    items_to_walk.extend(reversed(item.children))
+        return items
 
 
 class CurveView(QListView):